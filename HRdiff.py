@@ -1,6 +1,11 @@
 from manim import *
 import numpy as np
 
+from curve_utils import coords_to_points
+from ecg import ECGSynth, PanTompkins, instantaneous_bpm
+from hr_filter import HeartRateFilter
+from quality_profile import QUALITY
+
 class HeartRateCalculusTikTok(Scene):
     def construct(self):
         # Title and watermark (persistent)
@@ -45,28 +50,44 @@ class HeartRateCalculusTikTok(Scene):
         x_label.scale(0.7)
         y_label.scale(0.7)
 
-        # Generate realistic heart rate data with noise
+        # Heart rate the way a tracker gets it: a synthetic ECG (breathing-driven
+        # rate variability, baseline wander, motion artifacts) through streaming
+        # Pan-Tompkins R-peak detection, one BPM reading per beat. The record
+        # starts a few seconds early so the detector has learned its thresholds by t = 0
         np.random.seed(42)
-        t_values = np.linspace(0, 10, 100)
-        
-        # Base heart rate with realistic variation
-        base_hr = 75 + 10 * np.sin(0.5 * t_values)  # Slow breathing variation
-        noise = np.random.normal(0, 2, len(t_values))  # Sensor noise
-        measured_hr = base_hr + noise
+        ecg_rate, warmup = 250, 4.0
+        ecg_t, ecg_mv, true_peaks = ECGSynth(
+            fs=ecg_rate, mean_hr=78, hr_std=6, artifact_rate=1 / 3, artifact_mv=1.0, seed=42
+        ).generate(10 + warmup)
+        detector = PanTompkins(ecg_rate)
+        for start in range(0, len(ecg_mv), ecg_rate):
+            detector.process(ecg_mv[start:start + ecg_rate])
+        r_peaks = np.array(detector.finish())
+        beat_times, beat_bpm = instantaneous_bpm(r_peaks, ecg_rate)
+        true_times, true_bpm = instantaneous_bpm(true_peaks, ecg_rate)
+
+        t_values = np.linspace(0, 10, QUALITY.samples(100))
+
+        # Base heart rate: the beat-to-beat rate the synthetic heart actually had
+        base_hr = np.interp(t_values, true_times - warmup, true_bpm)
+        measured_hr = np.interp(t_values, beat_times - warmup, beat_bpm)
         
         # Clip to reasonable range
         measured_hr = np.clip(measured_hr, 65, 95)
 
         # Create noisy heart rate curve (what sensor actually measures)
-        hr_points = [axes.c2p(t, hr) for t, hr in zip(t_values, measured_hr)]
+        hr_points = coords_to_points(axes, t_values, measured_hr)
         noisy_curve = VMobject()
         noisy_curve.set_points_smoothly(hr_points)
         noisy_curve.set_color(RED)
         noisy_curve.set_stroke(width=3)
 
-        # Create smooth heart rate curve (what phone calculates)
-        smooth_hr = base_hr  # The true underlying signal
-        smooth_points = [axes.c2p(t, hr) for t, hr in zip(t_values, smooth_hr)]
+        # Create smooth heart rate curve (what phone calculates): the sensor
+        # samples run through the low-pass + Kalman filter one at a time
+        sample_dt = t_values[1] - t_values[0]
+        hr_filter = HeartRateFilter(sample_dt)
+        smooth_hr = np.array([hr_filter.update(sample) for sample in measured_hr])
+        smooth_points = coords_to_points(axes, t_values, smooth_hr)
         smooth_curve = VMobject()
         smooth_curve.set_points_smoothly(smooth_points)
         smooth_curve.set_color(GREEN)
@@ -95,19 +116,43 @@ class HeartRateCalculusTikTok(Scene):
         mini_smooth.set_stroke(width=2)
         
         # Heart rate number display
-        hr_display = Text("78", font_size=32, color=GREEN).next_to(mini_smooth, UP, buff=0.1)
+        hr_display = Text(f"{smooth_hr[0]:.0f}", font_size=32, color=GREEN).next_to(mini_smooth, UP, buff=0.1)
         bpm_label = Text("BPM", font_size=16, color=WHITE).next_to(hr_display, RIGHT, buff=0.1)
         
         self.play(Create(mini_smooth), Write(hr_display), Write(bpm_label))
-        self.play(Create(smooth_curve, run_time=2))
+
+        # As samples arrive the filter output draws the curve and drives the readout
+        def show_reading(display, alpha):
+            reading = smooth_hr[min(int(alpha * len(smooth_hr)), len(smooth_hr) - 1)]
+            display.become(Text(f"{reading:.0f}", font_size=32, color=GREEN).move_to(display))
+
+        self.play(Create(smooth_curve, rate_func=linear), UpdateFromAlphaFunc(hr_display, show_reading), run_time=2)
         self.wait(1)
 
         # Step 2: The big reveal - show the chaos
         new_step = MathTex(steps[1], font_size=36, color=ORANGE).next_to(watermark, DOWN, buff=0.3)
         self.play(Transform(step_text, new_step))
         
+        # Show the raw ECG the readings came from, squeezed under the curve, R peaks marked
+        shown = ecg_t >= warmup
+        ecg_step = max(int(np.sum(shown)) // QUALITY.samples(1250), 1)
+        ecg_low, ecg_span = ecg_mv[shown].min(), np.ptp(ecg_mv[shown])
+        ecg_to_bpm_axis = lambda mv: 61 + 5 * (mv - ecg_low) / ecg_span
+        ecg_trace = VMobject(stroke_color=RED_E, stroke_width=1.5)
+        ecg_trace.set_points_as_corners(coords_to_points(
+            axes, ecg_t[shown][::ecg_step] - warmup, ecg_to_bpm_axis(ecg_mv[shown][::ecg_step])
+        ))
+        visible_peaks = r_peaks[r_peaks >= warmup * ecg_rate]
+        peak_dots = VGroup(*[
+            Dot(axes.c2p(peak / ecg_rate - warmup, ecg_to_bpm_axis(ecg_mv[peak])), radius=0.03, color=YELLOW)
+            for peak in visible_peaks
+        ])
+        self.play(Create(ecg_trace, rate_func=linear), run_time=1.5)
+        self.play(LaggedStartMap(FadeIn, peak_dots, lag_ratio=0.1), run_time=QUALITY.lagged_time(0.8))
+
         # Show the actual noisy sensor data
         self.play(Create(noisy_curve, run_time=2))
+        self.play(FadeOut(ecg_trace), FadeOut(peak_dots))
         
         # Make the noise "jump around" to emphasize chaos
         for _ in range(3):
@@ -164,6 +209,7 @@ class HeartRateCalculusTikTok(Scene):
         # Multiple noisy signals being processed
         for round in range(3):
             temp_signals = VGroup()
+            temp_filtered = VGroup()
             
             # Create several noisy signals
             for i in range(5):
@@ -171,21 +217,26 @@ class HeartRateCalculusTikTok(Scene):
                 temp_hr = base_hr + temp_noise
                 temp_hr = np.clip(temp_hr, 60, 100)
                 
-                temp_points = [axes.c2p(t, hr) for t, hr in zip(t_values, temp_hr)]
+                temp_points = coords_to_points(axes, t_values, temp_hr)
                 temp_curve = VMobject()
                 temp_curve.set_points_smoothly(temp_points)
                 temp_curve.set_color(RED)
                 temp_curve.set_stroke(width=2)
                 temp_signals.add(temp_curve)
+
+                # The same filter on each stream
+                filtered_points = coords_to_points(axes, t_values, HeartRateFilter(sample_dt).process(temp_hr))
+                filtered_curve = VMobject()
+                filtered_curve.set_points_smoothly(filtered_points)
+                filtered_curve.set_color(GREEN)
+                filtered_curve.set_stroke(width=2)
+                temp_filtered.add(filtered_curve)
             
             # Show noisy signals
             self.play(Create(temp_signals, run_time=0.4))
             
-            # "Filter" them into smooth signal
-            self.play(
-                Transform(temp_signals, smooth_curve.copy().set_stroke(width=2, color=GREEN)),
-                run_time=0.6
-            )
+            # Filter them into smooth signals
+            self.play(Transform(temp_signals, temp_filtered), run_time=0.6)
             self.play(FadeOut(temp_signals, run_time=0.3))
 
         # Final dramatic emphasis
@@ -1,6 +1,11 @@
 from manim import *
 import numpy as np
 
+from grid_surface import SphereSurface
+from quality_profile import QUALITY
+from roots import crossings, level_crossings
+from temperature_field import antipodal_pairs, default_field, great_circle_basis
+
 class IntermediateValueTikTok(Scene):
     def construct(self):
         # Title and watermark (persistent)
@@ -157,8 +162,7 @@ class IntermediateValueTikTok(Scene):
         self.play(Transform(step_text, new_step))
         
         # Find and show the c value where f(c) = k
-        # Approximate where curve intersects k_line
-        c_x = 3.2  # Approximate solution
+        c_x = crossings(sample_function, 1, 5, k_value)[0]
         c_point = Dot(axes.c2p(c_x, k_value), color=PURPLE, radius=0.12)
         c_line = DashedLine(axes.c2p(c_x, 0), axes.c2p(c_x, k_value), color=PURPLE, stroke_width=2)
         c_label = MathTex("c", font_size=28, color=PURPLE).next_to(c_line, DOWN)
@@ -172,9 +176,30 @@ class IntermediateValueTikTok(Scene):
         )
         self.wait(1)
 
+        # Sweep k up and down: every solution of f(c) = k, looked up per frame
+        # from one batched solve over all the levels the sweep passes through
+        k_low, k_high = 1.95, 3.9
+        solutions = level_crossings(sample_function, 1, 5, np.linspace(k_low, k_high, 400))
+        k_tracker = ValueTracker(k_value)
+        k_line.add_updater(lambda m: m.set_y(axes.c2p(0, k_tracker.get_value())[1]))
+        k_label.add_updater(lambda m: m.move_to(axes.c2p(0.5, k_tracker.get_value() + 0.3)))
+        sweep_dots = always_redraw(lambda: VGroup(*[
+            Dot(axes.c2p(x, k_tracker.get_value()), color=PURPLE, radius=0.1)
+            for x in solutions.at(k_tracker.get_value())
+        ]))
+        self.play(FadeOut(c_point), FadeOut(c_line), FadeOut(c_label))
+        self.add(sweep_dots)
+        self.play(k_tracker.animate.set_value(k_high), run_time=2)
+        self.play(k_tracker.animate.set_value(k_low), run_time=3)
+        self.play(k_tracker.animate.set_value(k_value), run_time=2)
+        k_line.clear_updaters()
+        k_label.clear_updaters()
+        sweep_dots.clear_updaters()
+        self.wait(1)
+
         # Clear the graph
         graph_group = VGroup(axes, curve, a_point, b_point, a_label, b_label, 
-                           k_line, k_label, c_point, c_line, c_label)
+                           k_line, k_label, sweep_dots)
         self.play(FadeOut(graph_group))
 
         # Step 7: Back to the temperature example
@@ -242,4 +267,99 @@ class IntermediateValueTikTok(Scene):
             Write(mind_blown, run_time=2),
             final_frame.animate.set_stroke(width=8)
         )
-        self.wait(1.5)
\ No newline at end of file
+        self.wait(1.5)
+
+
+class AntipodalTemperatureTikTok(ThreeDScene):
+    def construct(self):
+        # 1 degree temperature field; the antipodal search runs on the full grid,
+        # the globe is drawn from a coarser copy
+        field = default_field(1.0)
+        radius = 2.2
+        display = field.coarsen(max(1, round(len(field.lon) / QUALITY.cell_count(72))))
+
+        # Great circles through both poles, turning once round the axis
+        n_circles = QUALITY.samples(120)
+        angles = np.linspace(0, PI, n_circles, endpoint=False)
+        normals = np.stack([np.cos(angles), np.sin(angles), np.zeros(n_circles)], axis=1)
+        pairs = antipodal_pairs(field, normals)
+        u, v = great_circle_basis(normals)
+
+        title = Text("Two Opposite Places, One Temperature", font_size=38, color=BLUE).to_edge(UP)
+        watermark = Text("@calc4dumb", font_size=24, color=GREY).next_to(title, DOWN, buff=0.1)
+        self.add_fixed_in_frame_mobjects(title, watermark)
+        self.set_camera_orientation(phi=70 * DEGREES, theta=-30 * DEGREES, zoom=0.9)
+
+        steps = [
+            r"\text{A (made-up) temperature map of Earth}" if field.source == "synthetic"
+            else r"\text{A temperature map of Earth}",
+            r"g(p) = T(p) - T(-p)",
+            r"g(-p) = -g(p) \Rightarrow g = 0 \text{ somewhere on every circle}",
+            r"\text{Same temperature, opposite sides of Earth}",
+        ]
+        step_text = MathTex(steps[0], font_size=34, color=BLUE).to_edge(DOWN, buff=0.4)
+        self.add_fixed_in_frame_mobjects(step_text)
+
+        globe = SphereSurface(
+            display.lat, display.lon, display.temperature, radius=radius,
+            colorscale=(BLUE_E, BLUE, GREEN, YELLOW, ORANGE, RED),
+            z_range=(field.temperature.min(), field.temperature.max()), stroke_width=0,
+        )
+        self.play(Write(step_text), FadeIn(globe), run_time=2)
+        self.wait(1)
+
+        # One circle, and the pair the search found on it
+        new_step = MathTex(steps[1], font_size=40, color=YELLOW).to_edge(DOWN, buff=0.4)
+        self.add_fixed_in_frame_mobjects(new_step)
+        self.play(FadeOut(step_text), FadeIn(new_step))
+        step_text = new_step
+
+        sweep = ValueTracker(0)
+        circle_at = lambda: int(min(sweep.get_value(), n_circles - 1))
+        great_circle = always_redraw(lambda: ParametricFunction(
+            lambda t: radius * 1.01 * (np.cos(t) * u[circle_at()] + np.sin(t) * v[circle_at()]),
+            t_range=[0, TAU], color=WHITE, stroke_width=3,
+        ))
+        pair_marks = always_redraw(lambda: VGroup(*[
+            VGroup(
+                Dot3D(radius * 1.03 * p, radius=0.07, color=GOLD),
+                Dot3D(-radius * 1.03 * p, radius=0.07, color=GOLD),
+                DashedLine(radius * 1.03 * p, -radius * 1.03 * p, color=GOLD, stroke_width=2),
+            )
+            for p in pairs.on_circle(circle_at())
+        ]))
+        self.play(Create(great_circle), run_time=1.5)
+        self.play(FadeIn(pair_marks))
+        self.wait(1)
+
+        # Turn the circle round the globe; every stop has its own pair, and
+        # together they trace a closed curve of equal-temperature antipodes
+        new_step = MathTex(steps[2], font_size=30, color=GREEN).to_edge(DOWN, buff=0.4)
+        self.add_fixed_in_frame_mobjects(new_step)
+        self.play(FadeOut(step_text), FadeIn(new_step))
+        step_text = new_step
+
+        trail = PMobject(stroke_width=4)
+        trail.add_updater(lambda m: m.reset_points().add_points(
+            radius * 1.02 * np.concatenate([pairs.points[pairs.circles <= circle_at()],
+                                            -pairs.points[pairs.circles <= circle_at()]]),
+            color=GOLD,
+        ))
+        self.add(trail)
+        self.play(sweep.animate.set_value(n_circles - 1), run_time=6, rate_func=linear)
+        self.wait(1)
+
+        # Last stop: read both temperatures off the field
+        new_step = MathTex(steps[3], font_size=34, color=GOLD).to_edge(DOWN, buff=0.4)
+        last = pairs.on_circle(n_circles - 1)[0]
+        reading = Text(f"{field.at_points(last):.1f}°C  =  {field.at_points(-last):.1f}°C",
+                       font_size=30, color=GOLD).next_to(new_step, UP, buff=0.3)
+        self.add_fixed_in_frame_mobjects(new_step, reading)
+        self.play(FadeOut(step_text), FadeIn(new_step), Write(reading))
+        for mob in (great_circle, pair_marks, trail):
+            mob.clear_updaters()
+
+        self.begin_ambient_camera_rotation(rate=0.3)
+        self.wait(4)
+        self.stop_ambient_camera_rotation()
+        self.wait(1)
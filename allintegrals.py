@@ -1,6 +1,10 @@
 from manim import *
 import numpy as np
 
+from box_field import BoxField
+from curve_utils import coords_to_points
+from quality_profile import QUALITY
+
 class IntegralTypesTikTok(ThreeDScene):
     def construct(self):
         # Title and watermark (persistent)
@@ -65,7 +69,7 @@ class IntegralTypesTikTok(ThreeDScene):
         ).shift(DOWN * 2)
         
         riemann_func = riemann_axes.plot(lambda x: 1 + 0.3*np.sin(3*x), color=BLUE, stroke_width=3)
-        rectangles = riemann_axes.get_riemann_rectangles(riemann_func, x_range=[0.5, 3.5], dx=0.3, color=GREEN, fill_opacity=0.5)
+        rectangles = riemann_axes.get_riemann_rectangles(riemann_func, x_range=[0.5, 3.5], dx=QUALITY.cell_size(3, 10), color=GREEN, fill_opacity=0.5)
         
         self.play(Create(riemann_axes), Create(riemann_func))
         self.play(Create(rectangles))
@@ -103,8 +107,8 @@ class IntegralTypesTikTok(ThreeDScene):
                 vector_field.add(arrow)
         
         # Path curve - make it stand out more
-        t_vals = np.linspace(0, 2*PI, 100)
-        path_points = [line_axes.c2p(0.8*np.cos(t), 0.8*np.sin(t)) for t in t_vals]
+        t_vals = np.linspace(0, 2*PI, QUALITY.samples(100))
+        path_points = coords_to_points(line_axes, 0.8*np.cos(t_vals), 0.8*np.sin(t_vals))
         path_curve = VMobject()
         path_curve.set_points_smoothly(path_points)
         path_curve.set_color(PURPLE)
@@ -114,7 +118,7 @@ class IntegralTypesTikTok(ThreeDScene):
         path_glow = VMobject()
         path_glow.set_points_smoothly(path_points)
         path_glow.set_color(PURPLE)
-        path_glow.set_stroke(width=12)
+        path_glow.set_stroke(width=QUALITY.glow_width(12))
         path_glow.set_stroke(opacity=0.3)
         
         self.play(Create(line_axes))
@@ -143,7 +147,7 @@ class IntegralTypesTikTok(ThreeDScene):
             lambda u, v: 1 + 0.4*np.sin(u)*np.cos(v) + 0.2*np.cos(2*u),
             u_range=[-1.5, 1.5],
             v_range=[-1.5, 1.5],
-            resolution=(15, 15),
+            resolution=QUALITY.resolution((15, 15)),
             color=RED,
             fill_opacity=0.7,
             stroke_color=RED,
@@ -194,19 +198,17 @@ class IntegralTypesTikTok(ThreeDScene):
         ).move_to(volume_axes.get_origin())
         
         # Add internal grid to show volume elements
-        internal_grid = VGroup()
         spacing = 0.6
-        for i in np.arange(-1, 1.5, spacing):
-            for j in np.arange(-1, 1.5, spacing):
-                for k in np.arange(-1, 1.5, spacing):
-                    small_cube = Cube(
-                        side_length=0.3,
-                        color=YELLOW,
-                        fill_opacity=0.1,
-                        stroke_color=GOLD,
-                        stroke_width=1
-                    ).move_to(volume_axes.c2p(i, j, k))
-                    internal_grid.add(small_cube)
+        grid_vals = np.arange(-1, 1.5, spacing)
+        grid_i, grid_j, grid_k = np.meshgrid(grid_vals, grid_vals, grid_vals, indexing="ij")
+        internal_grid = BoxField(
+            coords_to_points(volume_axes, grid_i, grid_j, grid_k),
+            sizes=0.3,
+            colors=YELLOW,
+            fill_opacity=0.1,
+            stroke_color=GOLD,
+            stroke_width=1
+        )
         
         # Add text to fixed frame AFTER creating 3D objects
         self.add_fixed_in_frame_mobjects(step_text, title, watermark)
@@ -282,21 +284,19 @@ class IntegralTypesTikTok(ThreeDScene):
         ).shift(DOWN * 1.8)
         
         # Create a closed path (irregular shape)
-        path_points = []
-        for t in np.linspace(0, 2*PI, 50):
-            r = 1 + 0.3*np.sin(3*t)
-            x = r * np.cos(t)
-            y = r * np.sin(t)
-            path_points.append(path_axes.c2p(x, y))
+        t_vals = np.linspace(0, 2*PI, QUALITY.samples(50))
+        r = 1 + 0.3*np.sin(3*t_vals)
+        path_points = coords_to_points(path_axes, r * np.cos(t_vals), r * np.sin(t_vals))
+        closed_points = np.vstack([path_points, path_points[:1]])  # Close the path
         
         closed_path = VMobject()
-        closed_path.set_points_smoothly(path_points + [path_points[0]])  # Close the path
+        closed_path.set_points_smoothly(closed_points)
         closed_path.set_color(TEAL)
         closed_path.set_stroke(width=4)
         
         # Fill the region
         region_fill = VMobject()
-        region_fill.set_points_smoothly(path_points + [path_points[0]])
+        region_fill.set_points_smoothly(closed_points)
         region_fill.set_fill(color=TEAL, opacity=0.2)
         region_fill.set_stroke(width=0)
         
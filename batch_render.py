@@ -0,0 +1,255 @@
+import argparse
+import ast
+import fnmatch
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+# Render every scene in the repo across all cores:
+#   python batch_render.py -q low_quality --only "*TikTok"
+#   python batch_render.py --quality-profile draft
+#   python batch_render.py --profile --only TripleIntegral*
+
+ROOT = Path(__file__).resolve().parent
+SCENE_BASES = {
+    "Scene",
+    "ThreeDScene",
+    "MovingCameraScene",
+    "ZoomedScene",
+    "VectorScene",
+    "LinearTransformationScene",
+}
+
+
+def _base_names(node):
+    names = []
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            names.append(base.attr)
+    return names
+
+
+def find_scenes(root=ROOT):
+    # Parse instead of import so scripts with side effects never run here
+    classes = {}
+    for path in sorted(root.glob("*.py")):
+        if path.resolve() == Path(__file__).resolve():
+            continue
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        except SyntaxError:
+            continue
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                classes[node.name] = (path, _base_names(node))
+
+    scene_names = set()
+    changed = True
+    while changed:
+        changed = False
+        for name, (_, bases) in classes.items():
+            if name not in scene_names and any(b in SCENE_BASES or b in scene_names for b in bases):
+                scene_names.add(name)
+                changed = True
+
+    # Shared base scenes are only rendered through their subclasses
+    used_as_base = {b for name in scene_names for b in classes[name][1]}
+    return [
+        (classes[name][0], name)
+        for name in sorted(scene_names, key=lambda n: (classes[n][0].name, n))
+        if name not in used_as_base
+    ]
+
+
+def load_module(path):
+    import importlib.util
+
+    if str(path.parent) not in sys.path:
+        sys.path.insert(0, str(path.parent))
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[path.stem] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def render_scene(path, scene_name, quality):
+    # Runs inside a fresh worker process, one scene per process
+    from manim import config
+
+    import incremental
+    import quality_profile
+    import render_profile
+    import tex_cache
+
+    cache = tex_cache.install()
+    incremental.install()
+    profiling = render_profile.install_from_env()
+    record = {"frames": 0, "output": None, "error": None}
+    config.input_file = str(path)
+    config.quality = quality
+    if os.environ.get("CALC4DUMB_QUALITY"):
+        config.frame_rate = quality_profile.QUALITY.frame_rate
+    config.write_to_movie = True
+    config.progress_bar = "none"
+    config.verbosity = "WARNING"
+
+    module = load_module(path)
+    scene = getattr(module, scene_name)()
+    scene.render()
+
+    record["frames"] = int(round(scene.renderer.time * config.frame_rate))
+    record["output"] = str(scene.renderer.file_writer.movie_file_path)
+    record["tex_cache"] = {"hits": cache.hits, "misses": cache.misses}
+    record["segments"] = incremental.stats()
+    record["segment_log"] = incremental.segments
+    if profiling:
+        record["profile"] = str(render_profile.output_dir() / f"{scene_name}.trace.json")
+    return record
+
+
+def run_worker(args):
+    try:
+        record = render_scene(Path(args.worker[0]), args.worker[1], args.quality)
+        code = 0
+    except Exception:
+        record = {"frames": 0, "output": None, "error": traceback.format_exc()}
+        code = 1
+    Path(args.result).write_text(json.dumps(record), encoding="utf-8")
+    return code
+
+
+def render_job(path, scene_name, quality, timeout):
+    fd, result_file = tempfile.mkstemp(prefix=f"{scene_name}-", suffix=".json")
+    os.close(fd)
+    cmd = [
+        sys.executable, str(Path(__file__).resolve()),
+        "--worker", str(path), scene_name,
+        "--quality", quality,
+        "--result", result_file,
+    ]
+    record = {
+        "module": path.stem,
+        "scene": scene_name,
+        "status": "failed",
+        "exit_status": None,
+        "wall_time": 0.0,
+        "frames": 0,
+        "output": None,
+        "tex_cache": None,
+        "segments": None,
+        "error": None,
+    }
+
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True, timeout=timeout)
+        record["exit_status"] = proc.returncode
+        stderr_tail = proc.stderr[-2000:]
+    except subprocess.TimeoutExpired:
+        stderr_tail = f"timed out after {timeout}s"
+    record["wall_time"] = round(time.perf_counter() - start, 3)
+
+    try:
+        record.update(json.loads(Path(result_file).read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        # Worker died before writing a result (segfault, OOM kill, timeout)
+        record["error"] = stderr_tail or "worker exited without a result"
+    finally:
+        Path(result_file).unlink(missing_ok=True)
+
+    if record["exit_status"] == 0 and record["error"] is None:
+        record["status"] = "ok"
+    return record
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every scene in parallel")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("-q", "--quality", default=None,
+                        help="manim quality preset, e.g. low_quality or high_quality "
+                             "(default: the quality profile's, else low_quality)")
+    parser.add_argument("--quality-profile", choices=["draft", "review", "final"], default=None,
+                        help="scene detail profile (see quality_profile.py)")
+    parser.add_argument("--only", action="append", default=[],
+                        help="glob on scene or module name (repeatable)")
+    parser.add_argument("--manifest", default=str(ROOT / "media" / "batch_manifest.json"))
+    parser.add_argument("--timeout", type=float, default=None, help="per-scene timeout in seconds")
+    parser.add_argument("--list", action="store_true", help="only list the scenes that would render")
+    parser.add_argument("--profile", action="store_true",
+                        help="write a per-call trace and flame graph for each scene (see render_profile.py)")
+    parser.add_argument("--worker", nargs=2, metavar=("FILE", "SCENE"), help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        return run_worker(args)
+
+    scenes = find_scenes()
+    if args.only:
+        scenes = [
+            (path, name) for path, name in scenes
+            if any(fnmatch.fnmatch(name, pat) or fnmatch.fnmatch(path.stem, pat) for pat in args.only)
+        ]
+    if args.list:
+        for path, name in scenes:
+            print(f"{path.name}:{name}")
+        return 0
+
+    if args.quality_profile:
+        from quality_profile import get_profile
+
+        os.environ["CALC4DUMB_QUALITY"] = args.quality_profile
+        if args.quality is None:
+            args.quality = get_profile(args.quality_profile).manim_quality
+    if args.quality is None:
+        args.quality = "low_quality"
+    if args.profile:
+        # Workers inherit the environment
+        os.environ["CALC4DUMB_PROFILE"] = "1"
+
+    jobs = max(1, min(args.jobs, len(scenes) or 1))
+    print(f"Rendering {len(scenes)} scenes with {jobs} workers")
+    start = time.perf_counter()
+    records = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(render_job, path, name, args.quality, args.timeout) for path, name in scenes]
+        for future in as_completed(futures):
+            record = future.result()
+            records.append(record)
+            print(f"[{record['status']:>6}] {record['module']}:{record['scene']} "
+                  f"{record['wall_time']:.1f}s, {record['frames']} frames")
+
+    records.sort(key=lambda r: (r["module"], r["scene"]))
+    manifest = {
+        "quality": args.quality,
+        "quality_profile": args.quality_profile,
+        "workers": jobs,
+        "wall_time": round(time.perf_counter() - start, 3),
+        "ok": sum(r["status"] == "ok" for r in records),
+        "failed": sum(r["status"] != "ok" for r in records),
+        "tex_cache_hits": sum((r["tex_cache"] or {}).get("hits", 0) for r in records),
+        "tex_cache_misses": sum((r["tex_cache"] or {}).get("misses", 0) for r in records),
+        "segments_reused": sum((r["segments"] or {}).get("reused", 0) for r in records),
+        "segments_rendered": sum((r["segments"] or {}).get("rendered", 0) for r in records),
+        "scenes": records,
+    }
+    manifest_path = Path(args.manifest)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    print(f"{manifest['ok']} ok, {manifest['failed']} failed, "
+          f"{manifest['segments_reused']} segments reused, {manifest['segments_rendered']} rendered "
+          f"-> {manifest_path}")
+    return 1 if manifest["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,15 @@
 from manim import *
 import numpy as np
 
+from curve_utils import coords_to_points
+from fan_chart import FanChart, path_quantiles
+from greeks import greek_grid
+from grid_surface import GridSurface
+from mc_pricer import MonteCarloPricer
+from quality_profile import QUALITY
+from step_scene import Step, StepSequenceScene
+from stochastic_paths import gbm_paths
+
 class BlackScholesTikTok(Scene):
     def construct(self):
         # Title and watermark (persistent)
@@ -23,26 +32,17 @@ class BlackScholesTikTok(Scene):
         self.play(Create(axes), Write(x_label), Write(y_label))
 
         # Generate random stock price path (geometric Brownian motion simulation)
-        np.random.seed(42)  # For consistent animation
-        dt = 0.05
+        dt = 5 / QUALITY.samples(100)
         t_values = np.arange(0, 5, dt)
         S0 = 100  # Initial stock price
         mu = 0.02  # Reduced drift rate
         sigma = 0.15  # Reduced volatility
         
-        # Simulate stock price path with bounds checking
-        random_shocks = np.random.normal(0, 1, len(t_values))
-        stock_prices = [S0]
-        
-        for i in range(1, len(t_values)):
-            dS = stock_prices[i-1] * (mu * dt + sigma * np.sqrt(dt) * random_shocks[i])
-            new_price = stock_prices[i-1] + dS
-            # Keep price within reasonable bounds (85-115)
-            new_price = max(85, min(115, new_price))
-            stock_prices.append(new_price)
+        # Seeded for a consistent animation; bounce off 85/115 to stay on the chart
+        stock_prices = gbm_paths(1, len(t_values) - 1, dt, S0, mu, sigma, seed=42, lower=85, upper=115)[0]
         
         # Create the wiggly stock curve
-        stock_points = [axes.c2p(t, price) for t, price in zip(t_values, stock_prices)]
+        stock_points = coords_to_points(axes, t_values, stock_prices)
         stock_curve = VMobject()
         stock_curve.set_points_smoothly(stock_points)
         stock_curve.set_color(GREEN)
@@ -102,6 +102,19 @@ class BlackScholesTikTok(Scene):
             self.wait(1)
             self.play(FadeOut(random_dots))
 
+        # Thousands of paths from the same equation: each one random, the percentile fan predictable
+        fan_paths = QUALITY.samples(2000)
+        fan_values = path_quantiles(
+            lambda count, rng: gbm_paths(count, len(t_values) - 1, dt, S0, mu, sigma, seed=rng, lower=85, upper=115),
+            fan_paths,
+            seed=7,
+        )
+        fan = FanChart(axes, t_values, fan_values, color=BLUE)
+        fan_label = Text(f"5-95% of {fan_paths} paths", font_size=16, color=BLUE).next_to(axes, RIGHT, buff=0.2)
+        self.add_foreground_mobjects(stock_curve)
+        self.play(FadeIn(fan), Write(fan_label), run_time=1.5)
+        self.wait(1)
+
         # Final step with dramatic reveal
         new_step = MathTex(steps[7], font_size=44, color=GREEN).next_to(watermark, DOWN, buff=1)
         self.play(Transform(step_text, new_step))
@@ -116,4 +129,137 @@ class BlackScholesTikTok(Scene):
         # Final dramatic box around the answer
         box = SurroundingRectangle(step_text, color=GREEN, buff=0.3)
         self.play(Create(box))
-        self.wait(2)
\ No newline at end of file
+        self.wait(2)
+
+class MonteCarloOptionTikTok(StepSequenceScene):
+    title_text = "Pricing an Option with Random Paths"
+    title_font_size = 44
+    step_font_size = 36
+
+    def construct_visual(self):
+        # At-the-money call: S0 = K = 100, r = 5%, sigma = 20%, one year
+        S0, K, r, sigma, T = 100, 100, 0.05, 0.2, 1.0
+        chunk = 1024
+        n_paths = chunk * QUALITY.samples(256)
+        plain = MonteCarloPricer(S0, K, r, sigma, T, chunk_size=chunk, antithetic=False, control_variate=False, seed=7)
+        reduced = MonteCarloPricer(S0, K, r, sigma, T, chunk_size=chunk, seed=7)
+        plain_estimates = list(plain.iter_estimates(n_paths))
+        reduced_estimates = list(reduced.iter_estimates(n_paths))
+        exact = reduced.reference_price()
+
+        # Running estimate against log10(number of paths)
+        axes = Axes(
+            x_range=[3, 5.5, 1],
+            y_range=[8.5, 12.5, 1],
+            x_length=4.5,
+            y_length=3,
+            axis_config={"color": GREY},
+            tips=False,
+        ).to_edge(DOWN, buff=0.3)
+        x_label = axes.get_x_axis_label(r"\log_{10} N", edge=RIGHT, direction=DOWN)
+        y_label = axes.get_y_axis_label("C", edge=UP, direction=LEFT)
+
+        exact_line = DashedLine(axes.c2p(3, exact), axes.c2p(5.5, exact), color=YELLOW)
+        exact_label = MathTex(rf"C_{{BS}} = {exact:.2f}", font_size=24, color=YELLOW).next_to(exact_line, RIGHT, buff=0.1)
+        self.play(Create(axes), Write(x_label), Write(y_label))
+        self.play(Create(exact_line), Write(exact_label))
+
+        def estimate_points(estimates, attr="price"):
+            xs = np.log10([e.paths for e in estimates])
+            ys = np.clip([getattr(e, attr) for e in estimates], 8.5, 12.5)
+            return coords_to_points(axes, xs, ys)
+
+        plain_curve = VMobject(color=GREY_B, stroke_width=2)
+        plain_curve.set_points_as_corners(estimate_points(plain_estimates))
+        reduced_curve = VMobject(color=GREEN, stroke_width=4)
+        reduced_curve.set_points_as_corners(estimate_points(reduced_estimates))
+        band = Polygon(
+            *estimate_points(reduced_estimates, "ci_high"),
+            *estimate_points(reduced_estimates, "ci_low")[::-1],
+            color=GREEN, fill_opacity=0.25, stroke_width=0,
+        )
+
+        # Kept for the step hooks and the finale
+        self.plain_curve = plain_curve
+        self.reduced_curve = reduced_curve
+        self.band = band
+        self.final_estimate = reduced_estimates[-1]
+        self.exact = exact
+
+    def show_plain_estimate(self):
+        self.play(Create(self.plain_curve, run_time=2))
+
+    def show_reduced_estimate(self):
+        self.play(FadeIn(self.band), Create(self.reduced_curve, run_time=2))
+
+    def get_steps(self):
+        return [
+            Step(r"C = e^{-rT}\,\mathbb{E}\left[(S_T - K)^+\right]", color=BLUE, hold=1.2),
+            Step(r"S_T = S_0\, e^{(r - \sigma^2/2)T + \sigma \sqrt{T} Z}", hook=self.show_plain_estimate, hold=1),
+            Step(r"\text{Antithetic: use } Z \text{ and } -Z", color=ORANGE, hold=1),
+            Step(r"\text{Control: } \mathbb{E}\left[e^{-rT} S_T\right] = S_0", color=PURPLE,
+                 hook=self.show_reduced_estimate, hold=1),
+            Step(r"\hat{C} \pm 1.96\,\mathrm{SE} \to C_{BS}", color=GREEN, hold=1.2),
+        ]
+
+    def construct_finale(self):
+        box = SurroundingRectangle(self.step_text, color=GREEN, buff=0.3)
+        self.play(Create(box))
+
+        estimate = self.final_estimate
+        end_text = Text(
+            f"{estimate.paths:,} paths: {estimate.price:.3f} ± {estimate.ci_high - estimate.price:.3f} (exact {self.exact:.3f})",
+            font_size=24, color=GREEN,
+        ).next_to(box, DOWN, buff=0.3)
+        self.play(Write(end_text))
+        self.wait(2)
+
+class GreekSurfacesTikTok(ThreeDScene):
+    def construct(self):
+        # Call with K = 100, r = 5%, sigma = 20%; every Greek on one (S, tau) grid, computed once (cached)
+        n = QUALITY.cell_count(100)
+        grid = greek_grid(100.0, 0.05, 0.2, "call", (50.0, 150.0), (0.05, 1.0), (n + 1, n + 1))
+
+        axes = ThreeDAxes(
+            x_range=[50, 150, 25],
+            y_range=[0, 1, 0.25],
+            z_range=[-1, 1, 0.5],
+            x_length=5,
+            y_length=4,
+            z_length=3,
+        ).shift(DOWN * 0.5)
+        self.set_camera_orientation(phi=65 * DEGREES, theta=-55 * DEGREES, zoom=0.8)
+        axis_labels = VGroup(
+            MathTex("S", font_size=28).next_to(axes.x_axis, DOWN),
+            MathTex(r"\tau", font_size=28).next_to(axes.y_axis, RIGHT),
+        )
+
+        title = Text("The Greeks: How Your Option Moves", font_size=40, color=BLUE).to_edge(UP)
+        watermark = Text("@calc4dumb", font_size=24, color=GREY).next_to(title, DOWN, buff=0.1)
+        scale_note = Text("each surface scaled to ±1", font_size=18, color=GREY).to_corner(DR)
+        self.add_fixed_in_frame_mobjects(title, watermark, scale_note)
+        self.play(Create(axes), Write(axis_labels), run_time=1.2)
+
+        greek_steps = [
+            ("delta", r"\Delta = \frac{\partial V}{\partial S}"),
+            ("gamma", r"\Gamma = \frac{\partial^2 V}{\partial S^2}"),
+            ("vega", r"\nu = \frac{\partial V}{\partial \sigma}"),
+            ("theta", r"\Theta = \frac{\partial V}{\partial t}"),
+            ("rho", r"\rho = \frac{\partial V}{\partial r}"),
+        ]
+        surface = label = None
+        for name, tex in greek_steps:
+            new_surface = GridSurface(axes, grid.s, grid.tau, grid.normalized(name), z_range=(-1, 1))
+            new_label = MathTex(tex, font_size=40, color=YELLOW).to_edge(DOWN, buff=0.4)
+            self.add_fixed_in_frame_mobjects(new_label)
+            if surface is None:
+                self.play(FadeIn(new_surface), Write(new_label), run_time=1.5)
+            else:
+                self.play(FadeOut(surface), FadeOut(label), FadeIn(new_surface), FadeIn(new_label), run_time=1.5)
+            surface, label = new_surface, new_label
+            self.wait(1.5)
+
+        self.begin_ambient_camera_rotation(rate=0.3)
+        self.wait(4)
+        self.stop_ambient_camera_rotation()
+        self.wait(1)
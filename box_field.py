@@ -0,0 +1,145 @@
+from manim import *
+import numpy as np
+
+# Thousands of axis-aligned boxes without a Cube (six Squares) per box.
+# Box centers/sizes/colors live in NumPy arrays; the faces are generated in
+# one shot and merged into a few VMobjects, one per (color, face direction,
+# plane), so ThreeDCamera sorts and shades a handful of mobjects instead of
+# 6 * N. Rotate/shift/FadeOut work as on any VGroup; GrowBoxes replaces
+# LaggedStart(*[GrowFromCenter(box) ...]).
+
+POINTS_PER_FACE = 16  # 4 straight cubic edges
+BEZIER_T = np.array([0, 1 / 3, 2 / 3, 1])
+
+# (axis, sign) of each face normal, in the same order for every box
+FACE_DIRECTIONS = [(axis, sign) for axis in range(3) for sign in (1, -1)]
+
+
+def _unit_faces():
+    # Corners of the unit cube's faces, wound like manim's Cube faces
+    # (normal pointing into the box) so the camera shades them the same way
+    faces = []
+    for axis, sign in FACE_DIRECTIONS:
+        n, u, v = np.eye(3)[axis], np.eye(3)[(axis + 1) % 3], np.eye(3)[(axis + 2) % 3]
+        if sign < 0:
+            n, u, v = -n, v, u
+        faces.append([(n + a * u + b * v) / 2 for a, b in [(-1, -1), (-1, 1), (1, 1), (1, -1)]])
+    return np.array(faces)
+
+
+UNIT_FACES = _unit_faces()
+
+
+def face_points(corners):
+    # (M, 4, 3) quad corners -> (M, 16, 3) VMobject points, edges as straight cubics
+    starts = corners
+    ends = np.roll(corners, -1, axis=1)
+    points = starts[:, :, None, :] + BEZIER_T[None, None, :, None] * (ends - starts)[:, :, None, :]
+    return points.reshape(len(corners), POINTS_PER_FACE, 3)
+
+
+def pad_for_shading(faces):
+    # ThreeDCamera shades a VMobject from the normal at its first point and at
+    # point ((n-1)//6)*3, each taken from the points 3 either side. Close the
+    # list with a copy of the first face, plus one more when needed, so both
+    # normals come from a single face (the copy just fills the same quad twice).
+    total = len(faces) + 1
+    if total % 2 == 0:
+        total += 1
+    return np.concatenate([faces] + [faces[:1]] * (total - len(faces)))
+
+
+class BoxField(VGroup):
+    def __init__(self, centers, sizes=1.0, colors=BLUE, fill_opacity=0.75, stroke_color=None,
+                 stroke_width=0, layer_tolerance=1e-6, **kwargs):
+        super().__init__(**kwargs)
+        self.centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+        self.box_count = len(self.centers)
+        self.sizes = np.broadcast_to(np.asarray(sizes, dtype=float), (self.box_count, 3)).copy()
+        if isinstance(colors, (list, tuple, np.ndarray)) and len(colors) == self.box_count:
+            self.colors = [ManimColor(c).to_hex() for c in colors]
+        else:
+            self.colors = [ManimColor(colors).to_hex()] * self.box_count
+        self.box_fill_opacity = fill_opacity
+        self.box_stroke_color = stroke_color
+        self.box_stroke_width = stroke_width
+        self.layer_tolerance = layer_tolerance
+        self.build_faces()
+
+    def build_faces(self):
+        self.remove(*self.submobjects)
+        if self.box_count == 0:
+            return self
+        palette, color_index = np.unique(self.colors, return_inverse=True)
+
+        for face, (axis, sign) in enumerate(FACE_DIRECTIONS):
+            corners = self.centers[:, None, :] + self.sizes[:, None, :] * UNIT_FACES[face][None]
+            planes = self.centers[:, axis] + sign * self.sizes[:, axis] / 2
+            layers = np.round(planes / self.layer_tolerance).astype(np.int64)
+            keys, group_of = np.unique(np.column_stack([color_index, layers]), axis=0, return_inverse=True)
+            group_of = group_of.ravel()
+
+            for group, (color, _) in enumerate(keys):
+                boxes = np.flatnonzero(group_of == group)
+                faces = pad_for_shading(face_points(corners[boxes]))
+                color = palette[color]
+                mob = VMobject(
+                    fill_color=color,
+                    fill_opacity=self.box_fill_opacity,
+                    stroke_color=self.box_stroke_color or color,
+                    stroke_width=self.box_stroke_width,
+                    shade_in_3d=True,
+                )
+                mob.set_points(faces.reshape(-1, 3))
+                mob.face_count = len(boxes)
+                mob.face_owners = np.concatenate([boxes, np.full(len(faces) - len(boxes), boxes[0])])
+                self.add(mob)
+        return self
+
+    def get_box_centers(self):
+        # Current centers (after any Rotate/shift): the mean of each box's six face centers
+        sums = np.zeros((self.box_count, 3))
+        counts = np.zeros(self.box_count)
+        for mob in self.submobjects:
+            faces = mob.points[:mob.face_count * POINTS_PER_FACE].reshape(-1, POINTS_PER_FACE, 3)
+            owners = mob.face_owners[:mob.face_count]
+            np.add.at(sums, owners, faces.mean(axis=1))
+            np.add.at(counts, owners, 1)
+        return sums / np.maximum(counts, 1)[:, None]
+
+
+class GrowBoxes(Animation):
+    # LaggedStart(*[GrowFromCenter(box) for box in boxes], lag_ratio=...) for a
+    # BoxField, as one vectorized update per frame. order gives the reveal
+    # order (indices into the field), default is build order.
+    def __init__(self, box_field, lag_ratio=0.03, box_rate_func=smooth, order=None, **kwargs):
+        self.box_lag_ratio = lag_ratio
+        self.box_rate_func = np.vectorize(box_rate_func, otypes=[float])
+        self.order = order
+        kwargs.setdefault("rate_func", linear)
+        kwargs.setdefault("introducer", True)
+        super().__init__(box_field, **kwargs)
+
+    def begin(self):
+        field = self.mobject
+        n = field.box_count
+        order = np.arange(n) if self.order is None else np.asarray(self.order)
+        rank = np.empty(n)
+        rank[order] = np.arange(n)
+        total = (n - 1) * self.box_lag_ratio + 1
+        self.box_starts = rank * self.box_lag_ratio / total
+        self.box_span = 1 / total
+
+        centers = field.get_box_centers()
+        self.point_owners = [np.repeat(mob.face_owners, POINTS_PER_FACE) for mob in field.submobjects]
+        self.point_centers = [centers[owners] for owners in self.point_owners]
+        self.start_points = [mob.points.copy() for mob in field.submobjects]
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        alpha = self.rate_func(alpha)
+        scales = self.box_rate_func(np.clip((alpha - self.box_starts) / self.box_span, 0, 1))
+        for mob, start, centers, owners in zip(
+            self.mobject.submobjects, self.start_points, self.point_centers, self.point_owners
+        ):
+            mob.set_points(centers + scales[owners][:, None] * (start - centers))
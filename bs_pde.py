@@ -0,0 +1,141 @@
+import argparse
+import time
+
+import numpy as np
+from scipy.linalg import solve_banded
+
+from mc_pricer import bs_price
+
+# Black-Scholes PDE by finite differences, for animating V(S, t):
+#   dV/dt + 1/2 sigma^2 S^2 V_SS + r S V_S - r V = 0,  V(S, T) = payoff
+# Stepped in time-to-expiry tau = T - t from the payoff back to today with
+# Crank-Nicolson: one tridiagonal solve (solve_banded) per step, so O(N) per
+# step. The first step is two implicit-Euler half steps (Rannacher) to damp
+# the oscillations CN otherwise leaves at the strike kink. Only the slices at
+# the requested times are kept, so memory is frames x N, not steps x N.
+#
+# Benchmark: python bs_pde.py
+
+
+def payoff(s, strike, kind="call"):
+    return np.maximum(s - strike, 0.0) if kind == "call" else np.maximum(strike - s, 0.0)
+
+
+def boundary_values(s_max, strike, rate, tau, kind="call"):
+    # (V at S = 0, V at S = s_max) for time-to-expiry tau
+    discounted = strike * np.exp(-rate * tau)
+    if kind == "call":
+        return 0.0, s_max - discounted
+    return discounted, 0.0
+
+
+def operator_bands(s, rate, sigma):
+    # Lower, main, upper diagonals of L V = 1/2 sigma^2 S^2 V_SS + r S V_S - r V on interior nodes
+    ds = s[1] - s[0]
+    x = s[1:-1] / ds
+    diffusion = 0.5 * sigma**2 * x**2
+    drift = 0.5 * rate * x
+    return diffusion - drift, -2 * diffusion - rate, diffusion + drift
+
+
+class PDESolution:
+    def __init__(self, s, times, values):
+        self.s = s
+        self.times = times  # calendar time t, ascending from 0 (today) to T
+        self.values = values  # (len(times), len(s))
+
+    def value(self, spot, t=0.0):
+        # Linear in S on the nearest stored slice
+        index = np.argmin(np.abs(self.times - t))
+        return np.interp(spot, self.s, self.values[index])
+
+    def slice_at(self, alpha):
+        # Blend of the two stored slices around alpha in [0, 1] of the stored range (for animation)
+        position = np.clip(alpha, 0, 1) * (len(self.times) - 1)
+        low = min(int(position), len(self.times) - 2) if len(self.times) > 1 else 0
+        frac = position - low
+        if len(self.times) == 1:
+            return self.times[0], self.values[0]
+        return (
+            (1 - frac) * self.times[low] + frac * self.times[low + 1],
+            (1 - frac) * self.values[low] + frac * self.values[low + 1],
+        )
+
+
+def crank_nicolson(strike, rate, sigma, maturity, kind="call", s_max=None, n_space=400, n_time=200,
+                   store_times=None, rannacher=True):
+    # store_times: calendar times t in [0, T] to keep (default just t = 0);
+    # each is snapped to the nearest time step
+    s_max = s_max or 4.0 * strike
+    s = np.linspace(0.0, s_max, n_space + 1)
+    dt = maturity / n_time
+    store_times = np.atleast_1d(np.asarray([0.0] if store_times is None else store_times, dtype=float))
+    store_steps = np.clip(np.round((maturity - store_times) / dt).astype(int), 0, n_time)
+    wanted = {}
+    for slot, step in enumerate(store_steps):
+        wanted.setdefault(step, []).append(slot)
+
+    lower, main, upper = operator_bands(s, rate, sigma)
+    n = len(main)
+    values = np.empty((len(store_times), len(s)))
+    v = payoff(s, strike, kind)
+    for slot in wanted.get(0, []):
+        values[slot] = v
+
+    banded = {}
+
+    def step(v, tau_next, h, theta):
+        # (I - theta h L) v_next = (I + (1 - theta) h L) v, boundaries from the closed form
+        rhs = v[1:-1].copy()
+        if theta < 1:
+            explicit = (1 - theta) * h
+            rhs += explicit * (lower * v[:-2] + main * v[1:-1] + upper * v[2:])
+        left, right = boundary_values(s_max, strike, rate, tau_next, kind)
+        rhs[0] += theta * h * lower[0] * left
+        rhs[-1] += theta * h * upper[-1] * right
+        if (h, theta) not in banded:
+            bands = np.zeros((3, n))
+            bands[0, 1:] = -theta * h * upper[:-1]
+            bands[1] = 1 - theta * h * main
+            bands[2, :-1] = -theta * h * lower[1:]
+            banded[h, theta] = bands
+        v_next = np.empty_like(v)
+        v_next[1:-1] = solve_banded((1, 1), banded[h, theta], rhs, check_finite=False)
+        v_next[0], v_next[-1] = left, right
+        return v_next
+
+    for k in range(1, n_time + 1):
+        tau = k * dt
+        if k == 1 and rannacher:
+            v = step(v, tau - 0.5 * dt, 0.5 * dt, 1.0)
+            v = step(v, tau, 0.5 * dt, 1.0)
+        else:
+            v = step(v, tau, dt, 0.5)
+        for slot in wanted.get(k, []):
+            values[slot] = v
+
+    # Calendar order, today first
+    times = maturity - store_steps * dt
+    order = np.argsort(times, kind="stable")
+    return PDESolution(s, times[order], values[order])
+
+
+def benchmark(strike=100.0, rate=0.05, sigma=0.2, maturity=1.0, kind="call"):
+    spots = np.linspace(0.5 * strike, 1.5 * strike, 101)
+    exact = bs_price(spots, strike, rate, sigma, maturity, kind)
+    print(f"{kind}, K={strike:g}, r={rate:g}, sigma={sigma:g}, T={maturity:g}; error over S in [0.5K, 1.5K]")
+    for n_space, n_time in [(100, 50), (200, 100), (400, 200), (800, 400), (1600, 800)]:
+        start = time.perf_counter()
+        solution = crank_nicolson(strike, rate, sigma, maturity, kind, n_space=n_space, n_time=n_time)
+        elapsed = time.perf_counter() - start
+        error = np.abs(solution.value(spots) - exact)
+        print(f"  {n_space:>5} x {n_time:<4} max |error| {error.max():.2e}  "
+              f"{elapsed * 1000:7.1f} ms  {n_space * n_time / elapsed / 1e6:6.1f} M nodes/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crank-Nicolson Black-Scholes accuracy/speed benchmark")
+    parser.add_argument("--kind", choices=["call", "put"], default="call")
+    parser.add_argument("--sigma", type=float, default=0.2)
+    args = parser.parse_args()
+    benchmark(kind=args.kind, sigma=args.sigma)
@@ -0,0 +1,27 @@
+from manim import *
+import numpy as np
+
+
+def coords_to_points(axes, *coords):
+    # Vectorized axes.c2p: coordinate arrays in, (N, 3) scene points out.
+    # Linear axes are an affine map, so probe it once instead of per point.
+    coords = np.broadcast_arrays(*[np.asarray(c, dtype=float).ravel() for c in coords])
+    number_lines = axes.get_axes()[:len(coords)]
+    if any(type(getattr(line, "scaling", None)).__name__ not in ("LinearBase", "NoneType") for line in number_lines):
+        # Log axes aren't affine; keep the exact per-point path
+        return np.array([axes.c2p(*point) for point in zip(*coords)])
+
+    zeros = [0.0] * len(coords)
+    origin = np.asarray(axes.c2p(*zeros), dtype=float)
+    basis = np.array([
+        np.asarray(axes.c2p(*(zeros[:i] + [1.0] + zeros[i + 1:])), dtype=float) - origin
+        for i in range(len(coords))
+    ])
+    return origin + np.column_stack(coords) @ basis
+
+
+def smooth_curve(axes, *coords, **kwargs):
+    # Smooth VMobject through the points; kwargs go to VMobject (color, stroke_width, ...)
+    curve = VMobject(**kwargs)
+    curve.set_points_smoothly(coords_to_points(axes, *coords))
+    return curve
@@ -1,13 +1,13 @@
 from manim import *
 import numpy as np
 
-class DiskMethodTikTok(Scene):
-    def construct(self):
-        # Title and watermark (persistent)
-        title = Text("Disk Method: Volume of Revolution", font_size=48, color=BLUE).to_edge(UP)
-        watermark = Text("@calc4dumb", font_size=24, color=GREY).next_to(title, DOWN, buff=0.1)
-        self.add(title, watermark)
+from step_scene import Step, StepSequenceScene
 
+class DiskMethodTikTok(StepSequenceScene):
+    title_text = "Disk Method: Volume of Revolution"
+    step_font_size = 42
+
+    def construct_visual(self):
         # Smaller graph on bottom left
         axes = Axes(
             x_range=[0, 3, 1],
@@ -51,85 +51,53 @@ class DiskMethodTikTok(Scene):
         self.play(Create(rotation_arrow), Write(rotation_label))
         self.wait(0.7)
 
-        # Steps to show, centered below watermark/title
-        steps = [
-            r"V = \int_0^4 \pi [R(x)]^2 \, dx",
-            r"\text{Step 1: Identify radius function}",
-            r"R(x) = \sqrt{x}",
-            r"\text{Step 2: Set up disk method}",
-            r"V = \int_0^4 \pi (\sqrt{x})^2 \, dx",
-            r"\text{Step 3: Simplify}",
-            r"V = \int_0^4 \pi x \, dx",
-            r"\text{Step 4: Integrate}",
-            r"V = \pi \left[\frac{x^2}{2}\right]_0^4",
-            r"\text{Step 5: Evaluate}",
-            r"V = \pi \left(\frac{16}{2} - 0\right) = 8\pi",
-        ]
-        
-        step_labels = [
-            "",
-            "",
-            "Step 1: Identify radius function", 
-            "",
-            "Step 2: Set up disk method",
-            "",
-            "Step 3: Simplify",
-            "",
-            "Step 4: Integrate",
-            "",
-            "Step 5: Final answer"
-        ]
+        # Kept for the step hooks
+        self.axes = axes
+        self.graph = graph
 
-        # Create first step centered below watermark/title
-        step_text = MathTex(steps[0], font_size=42, color=BLUE).next_to(watermark, DOWN, buff=1)
-        self.play(Write(step_text))
-        self.wait(0.7)
+    def highlight_radius(self):
+        # Highlight the curve as the radius
+        self.play(self.graph.animate.set_stroke(width=6, color=GOLD), run_time=0.7)
+        self.play(self.graph.animate.set_stroke(width=4, color=YELLOW), run_time=0.3)
 
-        # Iterate through remaining steps
-        for i in range(1, len(steps)):
-            # Special colors for different types of steps
-            if "Step" in steps[i]:
-                new_color = ORANGE
-            elif i == len(steps) - 1:  # Final answer
-                new_color = GREEN
-            else:
-                new_color = WHITE
+    def show_sample_disk(self):
+        # Add a sample disk
+        axes = self.axes
+        sample_x = 1.5
+        sample_radius = np.sqrt(sample_x)
+        disk = Circle(radius=sample_radius * 0.4, color=PURPLE, fill_opacity=0.3)
+        disk.move_to(axes.c2p(sample_x, 0))
+        disk_line = Line(
+            axes.c2p(sample_x, 0),
+            axes.c2p(sample_x, sample_radius),
+            color=PURPLE,
+            stroke_width=3
+        )
+        radius_label = MathTex("R(x)", font_size=24, color=PURPLE).next_to(disk_line, RIGHT)
+
+        self.play(Create(disk), Create(disk_line), Write(radius_label))
+        self.wait(1)
+        self.play(FadeOut(disk), FadeOut(disk_line), FadeOut(radius_label))
 
-            new_step = MathTex(steps[i], font_size=42, color=new_color).next_to(watermark, DOWN, buff=1)
-            self.play(Transform(step_text, new_step))
-            
-            # Special animations for key steps
-            if i == 2:  # Show radius function
-                # Highlight the curve as the radius
-                self.play(graph.animate.set_stroke(width=6, color=GOLD), run_time=0.7)
-                self.play(graph.animate.set_stroke(width=4, color=YELLOW), run_time=0.3)
-                self.wait(1)
-            elif i == 4:  # Set up disk method - show disk visualization
-                # Add a sample disk
-                sample_x = 1.5
-                sample_radius = func(sample_x)
-                disk = Circle(radius=sample_radius * 0.4, color=PURPLE, fill_opacity=0.3)
-                disk.move_to(axes.c2p(sample_x, 0))
-                disk_line = Line(
-                    axes.c2p(sample_x, 0), 
-                    axes.c2p(sample_x, sample_radius), 
-                    color=PURPLE, 
-                    stroke_width=3
-                )
-                radius_label = MathTex("R(x)", font_size=24, color=PURPLE).next_to(disk_line, RIGHT)
-                
-                self.play(Create(disk), Create(disk_line), Write(radius_label))
-                self.wait(1)
-                self.play(FadeOut(disk), FadeOut(disk_line), FadeOut(radius_label))
-            elif i == 8:  # Integration step
-                self.wait(1.3)
-            elif i == len(steps) - 1:  # Final answer
-                self.wait(1)
-            else:
-                self.wait(1.2)
+    def get_steps(self):
+        # Steps to show, centered below watermark/title
+        return [
+            Step(r"V = \int_0^4 \pi [R(x)]^2 \, dx", color=BLUE, hold=0.7),
+            Step(r"\text{Step 1: Identify radius function}", color=ORANGE, hold=1.2),
+            Step(r"R(x) = \sqrt{x}", hook=self.highlight_radius, hold=1),
+            Step(r"\text{Step 2: Set up disk method}", color=ORANGE, hold=1.2),
+            Step(r"V = \int_0^4 \pi (\sqrt{x})^2 \, dx", hook=self.show_sample_disk, hold=0),
+            Step(r"\text{Step 3: Simplify}", color=ORANGE, hold=1.2),
+            Step(r"V = \int_0^4 \pi x \, dx", hold=1.2),
+            Step(r"\text{Step 4: Integrate}", color=ORANGE, hold=1.2),
+            Step(r"V = \pi \left[\frac{x^2}{2}\right]_0^4", hold=1.3),
+            Step(r"\text{Step 5: Evaluate}", color=ORANGE, hold=1.2),
+            Step(r"V = \pi \left(\frac{16}{2} - 0\right) = 8\pi", color=GREEN, hold=1),
+        ]
 
+    def construct_finale(self):
         # Highlight final answer with animated box
-        box = SurroundingRectangle(step_text, color=GREEN, buff=0.3)
+        box = SurroundingRectangle(self.step_text, color=GREEN, buff=0.3)
         self.play(Create(box))
         self.wait(0.3)
 
@@ -141,4 +109,4 @@ class DiskMethodTikTok(Scene):
         # Quick reminder of the concept
         concept_text = Text("Disk Method: π × radius² × thickness", font_size=32, color=YELLOW).next_to(end_text, UP, buff=0.3)
         self.play(FadeIn(concept_text))
-        self.wait(0.7)
\ No newline at end of file
+        self.wait(0.7)
@@ -1,12 +1,15 @@
 from manim import *
 
-class DoubleIntegralTikTok(Scene):
-    def construct(self):
-        # Title and watermark (persistent)
-        title = Text("Double Integral", font_size=48, color=BLUE).to_edge(UP)
-        watermark = Text("@calc4dumb", font_size=24, color=GREY).next_to(title, DOWN, buff=0.1)
-        self.add(title, watermark)
+from step_scene import Step, StepSequenceScene
 
+class DoubleIntegralTikTok(StepSequenceScene):
+    title_text = "Double Integral"
+    step_font_size = 40
+    label_font_size = 24
+    label_buff = 0.4
+    label_fade_time = 0.5
+
+    def construct_visual(self):
         # Regular 2D graph on bottom left showing the region
         axes = Axes(
             x_range=[0, 2.5, 1],
@@ -37,57 +40,27 @@ class DoubleIntegralTikTok(Scene):
         
         self.play(Create(region), Write(region_label))
 
-        # Steps to show, centered below watermark/title
-        steps = [
-            r"\iint_R xy \, dA",
-            r"R: 0 \leq x \leq 2, \, 0 \leq y \leq 1",
-            r"\int_0^2 \int_0^1 xy \, dy \, dx",
-            r"\int_0^2 x \left[\frac{y^2}{2}\right]_0^1 dx",
-            r"\int_0^2 x \cdot \frac{1}{2} \, dx",
-            r"\frac{1}{2} \int_0^2 x \, dx",
-            r"\frac{1}{2} \left[\frac{x^2}{2}\right]_0^2 = 1",
-        ]
-        
-        step_labels = [
-            "",
-            "Step 1: Define region R",
-            "Step 2: Set up iterated integral", 
-            "Step 3: Integrate with respect to y",
-            "Step 4: Evaluate y bounds",
-            "Step 5: Factor out constant",
-            "Step 6: Final integration"
+    def get_steps(self):
+        # Steps to show, centered below watermark/title, with faster timing
+        return [
+            Step(r"\iint_R xy \, dA", color=BLUE, hold=0.8),
+            Step(r"R: 0 \leq x \leq 2, \, 0 \leq y \leq 1", label="Step 1: Define region R", run_time=0.8, hold=1.2),
+            Step(r"\int_0^2 \int_0^1 xy \, dy \, dx", label="Step 2: Set up iterated integral", run_time=0.8, hold=1.2),
+            Step(r"\int_0^2 x \left[\frac{y^2}{2}\right]_0^1 dx",
+                 label="Step 3: Integrate with respect to y", run_time=0.8, hold=1.2),
+            Step(r"\int_0^2 x \cdot \frac{1}{2} \, dx", label="Step 4: Evaluate y bounds", run_time=0.8, hold=1.2),
+            Step(r"\frac{1}{2} \int_0^2 x \, dx", label="Step 5: Factor out constant", run_time=0.8, hold=1.2),
+            Step(r"\frac{1}{2} \left[\frac{x^2}{2}\right]_0^2 = 1", color=GREEN,
+                 label="Step 6: Final integration", run_time=0.8, hold=1.2),
         ]
 
-        # Create first step centered below watermark/title
-        step_text = MathTex(steps[0], font_size=40, color=BLUE).next_to(watermark, DOWN, buff=1)
-        self.play(Write(step_text))
-        self.wait(0.8)
-
-        # Iterate through remaining steps with faster timing
-        for i in range(1, len(steps)):
-            new_color = GREEN if i == len(steps) - 1 else WHITE
-                
-            # Show the actual step
-            new_step = MathTex(steps[i], font_size=40, color=new_color).next_to(watermark, DOWN, buff=1)
-            
-            # Show step label below the math if it exists
-            if step_labels[i]:
-                label = Text(step_labels[i], font_size=24, color=ORANGE).next_to(new_step, DOWN, buff=0.4)
-                self.play(Transform(step_text, new_step), Write(label), run_time=0.8)
-                self.wait(1.2)
-                # Remove the label before next step
-                if i < len(steps) - 1:
-                    self.play(FadeOut(label), run_time=0.5)
-            else:
-                self.play(Transform(step_text, new_step), run_time=0.8)
-                self.wait(1.2)
-
+    def construct_finale(self):
         # Highlight final answer with box
-        box = SurroundingRectangle(step_text, color=GREEN, buff=0.3)
+        box = SurroundingRectangle(self.step_text, color=GREEN, buff=0.3)
         self.play(Create(box), run_time=0.6)
         self.wait(0.5)
 
         # End text moved a bit up from bottom
         end_text = Text("Volume = 1!", font_size=36, color=GREEN).to_edge(DOWN).shift(UP * 0.4)
         self.play(Write(end_text), run_time=0.8)
-        self.wait(1)
\ No newline at end of file
+        self.wait(1)
@@ -0,0 +1,322 @@
+import argparse
+import time
+
+import numpy as np
+from scipy.ndimage import maximum_filter1d
+from scipy.signal import butter, group_delay, lfilter, lfilter_zi
+
+# Synthetic ECG and streaming R-peak detection for HeartRateCalculusTikTok.
+#
+# ECGSynth follows ECGSYN (McSharry et al. 2003): the phase theta goes round
+# a limit cycle at the instantaneous heart rate, and P, Q, R, S, T are
+# Gaussian bumps in theta driving
+#   dz/dt = -sum_i a_i dtheta_i exp(-dtheta_i^2 / 2 b_i^2) - (z - z0(t))
+# That equation is linear in z, so it is solved exactly with lfilter instead
+# of an ODE stepper. Heart rate carries LF (Mayer, ~0.1 Hz) and HF
+# (respiratory, ~0.25 Hz) variability from an inverse FFT; z0 is respiratory
+# baseline wander plus slow drift; motion artifacts are random bursts of
+# band-limited noise. Chunks carry phase and filter state, so arbitrarily
+# long signals stream in constant memory.
+#
+# PanTompkins is the classic detector (band-pass 5-15 Hz, derivative,
+# squaring, 150 ms moving integration, adaptive thresholds with a 200 ms
+# refractory period and searchback), fed block by block with every filter's
+# state carried over, so a stream split anywhere gives the same beats.
+#
+# Benchmark: python ecg.py --minutes 60 --rate 500
+
+# P, Q, R, S, T: angle (rad), amplitude, width (rad) from the ECGSYN paper
+WAVE_THETA = np.array([-np.pi / 3, -np.pi / 12, 0.0, np.pi / 12, np.pi / 2])
+WAVE_A = np.array([1.2, -5.0, 30.0, -7.5, 0.75])
+WAVE_B = np.array([0.25, 0.1, 0.1, 0.1, 0.4])
+# ECGSYN rescales z afterwards; this puts the R wave near 1.1 mV
+MV_PER_UNIT = 80.0
+
+
+def hrv_series(duration, mean_hr, hr_std, seed, rate=4.0, lf=0.1, hf=0.25, lf_hf_ratio=0.5):
+    # Heart rate (BPM) sampled at `rate` Hz with a bimodal LF/HF spectrum
+    rng = np.random.default_rng(seed)
+    n = int(np.ceil(duration * rate)) + 2
+    freqs = np.fft.rfftfreq(n, 1 / rate)
+    # Peaks 0.01 Hz wide, or a couple of bins for short records
+    width = max(0.01, 2 * rate / n)
+    power = lf_hf_ratio * np.exp(-0.5 * ((freqs - lf) / width) ** 2) + np.exp(-0.5 * ((freqs - hf) / width) ** 2)
+    spectrum = np.sqrt(power) * np.exp(2j * np.pi * rng.random(len(freqs)))
+    series = np.fft.irfft(spectrum, n)
+    series *= hr_std / max(series.std(), 1e-12)
+    return np.arange(n) / rate, mean_hr + series
+
+
+class ECGSynth:
+    def __init__(self, fs=500.0, mean_hr=75.0, hr_std=4.0, resp_rate=0.25, wander_mv=0.15, drift_mv=0.1,
+                 artifact_rate=1 / 20, artifact_mv=0.4, noise_mv=0.02, seed=0):
+        self.fs = fs
+        self.mean_hr = mean_hr
+        self.hr_std = hr_std
+        self.resp_rate = resp_rate
+        self.wander_mv = wander_mv
+        self.drift_mv = drift_mv
+        self.artifact_rate = artifact_rate  # bursts per second
+        self.artifact_mv = artifact_mv
+        self.noise_mv = noise_mv
+        self.seed = seed
+
+    def chunks(self, duration, chunk_seconds=60.0):
+        # Yields (t, ecg_mv, true_r_peak_indices) per chunk; indices are global sample numbers
+        fs = self.fs
+        dt = 1 / fs
+        # One generator per random source, each read strictly in time order, so
+        # the signal doesn't depend on how it is cut into chunks
+        hrv_rng, artifact_rng, drift_rng, noise_rng = (
+            np.random.default_rng(s) for s in np.random.SeedSequence(self.seed).spawn(4)
+        )
+        hr_t, hr_bpm = hrv_series(duration, self.mean_hr, self.hr_std, hrv_rng)
+
+        # Motion artifacts: Poisson burst starts, each a windowed band-limited noise burst
+        n_bursts = artifact_rng.poisson(self.artifact_rate * duration)
+        burst_start = np.sort(artifact_rng.uniform(0, duration, n_bursts))
+        burst_length = artifact_rng.uniform(0.3, 1.5, n_bursts)
+        burst_seed = artifact_rng.integers(0, 2**32, n_bursts)
+        artifact_b, artifact_a = butter(2, [1 / (fs / 2), 10 / (fs / 2)], btype="band")
+
+        # Drift: integrated noise through a very slow low-pass
+        drift_b, drift_a = butter(1, 0.05 / (fs / 2))
+        drift_state = lfilter_zi(drift_b, drift_a) * 0
+        decay = np.exp(-dt)
+        z_state = np.array([0.0])
+        theta = -np.pi
+        b_scale = np.sqrt(self.mean_hr / 60)
+
+        n_total = int(round(duration * fs))
+        chunk = max(int(chunk_seconds * fs), 1)
+        for start in range(0, n_total, chunk):
+            n = min(chunk, n_total - start)
+            t = (start + np.arange(n)) * dt
+
+            # Phase: cumulative angular speed; every wrap past pi is a new beat
+            omega = 2 * np.pi * np.interp(t, hr_t, hr_bpm) / 60
+            phase = theta + np.cumsum(omega) * dt
+            wraps = np.floor((phase + np.pi) / (2 * np.pi))
+            wrapped = phase - 2 * np.pi * wraps
+            # R wave sits at theta = 0: crossings of 0 from below within the chunk
+            previous = np.concatenate([[theta], wrapped[:-1]])
+            r_peaks = start + np.flatnonzero((previous < 0) & (wrapped >= 0))
+            theta = float(wrapped[-1])
+
+            # Forcing from the five waves, then the exact linear solve for z
+            dtheta = np.mod(wrapped[:, None] - WAVE_THETA[None, :] + np.pi, 2 * np.pi) - np.pi
+            widths = WAVE_B * b_scale
+            forcing = -np.sum(WAVE_A * dtheta * np.exp(-0.5 * (dtheta / widths) ** 2), axis=1) * omega
+            z, z_state = lfilter([1 - decay], [1, -decay], forcing, zi=decay * z_state)
+            z_state = z[-1:]
+
+            drift, drift_state = lfilter(drift_b, drift_a, drift_rng.standard_normal(n), zi=drift_state)
+            baseline = self.wander_mv * np.sin(2 * np.pi * self.resp_rate * t) + self.drift_mv * 20 * drift
+
+            artifacts = np.zeros(n)
+            active = np.flatnonzero((burst_start < t[-1] + dt) & (burst_start + burst_length > t[0]))
+            for i in active:
+                first = int(burst_start[i] * fs)
+                full = int(burst_length[i] * fs)
+                lo, hi = max(first - start, 0), min(first + full - start, n)
+                if hi <= lo:
+                    continue
+                # Each burst regenerates from its own seed, so one split across chunks stays continuous
+                noise = lfilter(artifact_b, artifact_a, np.random.default_rng(burst_seed[i]).standard_normal(full))
+                window = np.hanning(full) * self.artifact_mv / max(noise.std(), 1e-12)
+                artifacts[lo:hi] = (noise * window)[start + lo - first:start + hi - first]
+
+            ecg = MV_PER_UNIT * z + baseline + artifacts + self.noise_mv * noise_rng.standard_normal(n)
+            yield t, ecg, r_peaks
+
+    def generate(self, duration):
+        parts = list(self.chunks(duration))
+        return (
+            np.concatenate([p[0] for p in parts]),
+            np.concatenate([p[1] for p in parts]),
+            np.concatenate([p[2] for p in parts]),
+        )
+
+
+class PanTompkins:
+    def __init__(self, fs=500.0, learning_seconds=2.0):
+        self.fs = fs
+        self.band_b, self.band_a = butter(2, [5 / (fs / 2), 15 / (fs / 2)], btype="band")
+        self.band_state = lfilter_zi(self.band_b, self.band_a) * 0
+        self.deriv_b = np.array([1, 2, 0, -2, -1]) * fs / 8
+        self.deriv_state = np.zeros(4)
+        self.window = max(int(0.15 * fs), 1)
+        self.mwi_b = np.ones(self.window) / self.window
+        self.mwi_state = np.zeros(self.window - 1)
+        self.refractory = int(0.2 * fs)
+        self.half = int(0.1 * fs)
+        self.learning = int(learning_seconds * fs)
+        # The band-passed QRS lags the raw one by the filter's group delay around 10 Hz
+        self.band_delay = int(round(group_delay((self.band_b, self.band_a), [10.0], fs=fs)[1][0]))
+        self.history_len = int(1.0 * fs)
+
+        self.processed = 0
+        self.spki = self.npki = None
+        self.rr_avg = None
+        self.last_peak = None
+        self.pending = None  # (mwi index, value) waiting out the refractory period
+        self.candidates = []  # rejected local maxima since the last beat, for searchback
+        self._learn = []
+        self._tail = np.zeros(0)
+        self._band_history = np.zeros(0)
+        self.peaks = []
+
+    def threshold(self):
+        return self.npki + 0.25 * (self.spki - self.npki)
+
+    def _accept(self, index, value, searchback=False):
+        self.spki = (0.25 if searchback else 0.125) * value + (0.75 if searchback else 0.875) * self.spki
+        if self.last_peak is not None:
+            rr = index - self.last_peak
+            self.rr_avg = rr if self.rr_avg is None else 0.875 * self.rr_avg + 0.125 * rr
+        self.last_peak = index
+        self.candidates = []
+        self.peaks.append(self._locate_r(index))
+
+    def _locate_r(self, mwi_index):
+        # The R wave is the largest band-passed deflection in the integration window before the MWI peak
+        history_start = self.processed - len(self._band_history)
+        lo = max(mwi_index - self.window - 5, history_start)
+        hi = max(min(mwi_index + 1, self.processed), lo + 1)
+        segment = self._band_history[lo - history_start:hi - history_start]
+        if not len(segment):
+            return mwi_index - self.band_delay
+        return lo + int(np.argmax(np.abs(segment))) - self.band_delay
+
+    def _flush_pending(self, upto):
+        if self.pending is not None and upto - self.pending[0] > self.refractory:
+            self._accept(*self.pending)
+            self.pending = None
+
+    def _candidate(self, index, value):
+        self._flush_pending(index)
+        if value > self.threshold():
+            if self.pending is not None and index - self.pending[0] <= self.refractory:
+                # Two peaks inside 200 ms: keep the bigger one
+                if value > self.pending[1]:
+                    self.npki = 0.125 * self.pending[1] + 0.875 * self.npki
+                    self.pending = (index, value)
+                else:
+                    self.npki = 0.125 * value + 0.875 * self.npki
+            elif self.last_peak is not None and index - self.last_peak <= self.refractory:
+                self.npki = 0.125 * value + 0.875 * self.npki
+            else:
+                self.pending = (index, value)
+        else:
+            self.npki = 0.125 * value + 0.875 * self.npki
+            self.candidates.append((index, value))
+
+        # Searchback: no beat for 1.66 RR, take the best rejected peak above half the threshold
+        if self.pending is None and self.rr_avg is not None and self.last_peak is not None:
+            if index - self.last_peak > 1.66 * self.rr_avg:
+                usable = [c for c in self.candidates if c[1] > 0.5 * self.threshold()
+                          and c[0] - self.last_peak > self.refractory]
+                if usable:
+                    self._accept(*max(usable, key=lambda c: c[1]), searchback=True)
+
+    def process(self, block):
+        # Feed raw samples; returns the R-peak sample indices found during this call
+        block = np.asarray(block, dtype=float)
+        if not len(block):
+            return []
+        found = len(self.peaks)
+        band, self.band_state = lfilter(self.band_b, self.band_a, block, zi=self.band_state)
+        deriv, self.deriv_state = lfilter(self.deriv_b, [1.0], band, zi=self.deriv_state)
+        mwi, self.mwi_state = lfilter(self.mwi_b, [1.0], deriv**2, zi=self.mwi_state)
+        self.processed += len(block)
+        # Keep the whole block until its candidates are settled, trimmed afterwards
+        self._band_history = np.concatenate([self._band_history, band])
+
+        if self.spki is None:
+            # Learning phase: thresholds from the first couple of seconds
+            self._learn.append(mwi)
+            learned = np.concatenate(self._learn)
+            if len(learned) >= self.learning:
+                learned = learned[:self.learning]
+                self.spki = learned.max() / 3
+                self.npki = learned.mean() / 2
+                self._learn = []
+
+        # Candidates are maxima of the integrated signal over +-100 ms; a sample
+        # is only judged once the samples after it have arrived, so the last
+        # 2 * half samples are carried into the next call
+        extended = np.concatenate([self._tail, mwi])
+        base = self.processed - len(extended)
+        half = self.half
+        if len(extended) > 2 * half:
+            peak = maximum_filter1d(extended, 2 * half + 1, mode="nearest")
+            inner = np.arange(half, len(extended) - half)
+            inner = inner[(extended[inner] == peak[inner]) & (extended[inner] > extended[inner - 1])]
+            if self.spki is not None:
+                for i in inner[base + inner >= self.learning]:
+                    self._candidate(base + i, extended[i])
+            self._tail = extended[-2 * half:]
+        else:
+            self._tail = extended
+        if self.spki is not None:
+            self._flush_pending(self.processed - half)
+        self._band_history = self._band_history[-self.history_len:]
+        return self.peaks[found:]
+
+    def finish(self):
+        if self.pending is not None:
+            self._accept(*self.pending)
+            self.pending = None
+        return self.peaks
+
+
+def instantaneous_bpm(peaks, fs):
+    # (beat time, BPM from the preceding RR interval)
+    peaks = np.asarray(peaks, dtype=float)
+    if len(peaks) < 2:
+        return np.zeros(0), np.zeros(0)
+    return peaks[1:] / fs, 60 * fs / np.diff(peaks)
+
+
+def match_peaks(detected, truth, tolerance):
+    # Sensitivity and positive predictive value with a +-tolerance sample window
+    detected = np.sort(np.asarray(detected))
+    truth = np.asarray(truth)
+    if not len(detected) or not len(truth):
+        return 0.0, 0.0
+    nearest = np.clip(np.searchsorted(detected, truth), 1, len(detected) - 1)
+    distance = np.minimum(np.abs(detected[nearest] - truth), np.abs(detected[nearest - 1] - truth))
+    hits = int(np.sum(distance <= tolerance))
+    return hits / len(truth), min(hits / len(detected), 1.0)
+
+
+def benchmark(minutes, fs, chunk_seconds=60.0):
+    duration = minutes * 60
+    synth = ECGSynth(fs=fs, seed=1)
+    detector = PanTompkins(fs)
+    truth, gen_time, det_time = [], 0.0, 0.0
+    start = time.perf_counter()
+    for _, ecg, peaks in synth.chunks(duration, chunk_seconds):
+        gen_time += time.perf_counter() - start
+        truth.append(peaks)
+        start = time.perf_counter()
+        detector.process(ecg)
+        det_time += time.perf_counter() - start
+        start = time.perf_counter()
+    detected = detector.finish()
+    truth = np.concatenate(truth)
+    sensitivity, ppv = match_peaks(detected, truth, int(0.075 * fs))
+    n = int(duration * fs)
+    print(f"{minutes:g} min at {fs:g} Hz = {n:,} samples, {len(truth):,} beats")
+    print(f"  ECGSynth     {gen_time:6.2f} s  ({duration / gen_time:,.0f}x real time)")
+    print(f"  PanTompkins  {det_time:6.2f} s  ({duration / det_time:,.0f}x real time)")
+    print(f"  sensitivity {sensitivity:.4f}, positive predictivity {ppv:.4f} (+-75 ms)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Synthetic ECG + streaming Pan-Tompkins benchmark")
+    parser.add_argument("--minutes", type=float, default=60)
+    parser.add_argument("--rate", type=float, default=500, help="sample rate in Hz")
+    parser.add_argument("--chunk", type=float, default=60, help="seconds per streamed chunk")
+    args = parser.parse_args()
+    benchmark(args.minutes, args.rate, args.chunk)
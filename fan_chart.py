@@ -0,0 +1,110 @@
+from manim import *
+import numpy as np
+
+from curve_utils import coords_to_points
+
+# Percentile fan of many simulated paths: 5/25/50/75/95% bands drawn as a
+# couple of filled polygons plus a median line, instead of one curve per path.
+# Quantiles come from the P^2 algorithm (Jain & Chlamtac 1985, extended to
+# several quantiles), one estimator per time step updated together, so paths
+# stream through in batches and only 2m + 3 markers per step are ever kept.
+
+FAN_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+class P2Quantiles:
+    def __init__(self, quantiles=FAN_QUANTILES, size=1):
+        self.quantiles = np.asarray(quantiles, dtype=float)
+        # Marker probabilities: 0, the quantiles, midpoints between them, 1
+        between = np.concatenate([[0.0], self.quantiles, [1.0]])
+        self.marker_p = np.sort(np.concatenate([between, 0.5 * (between[:-1] + between[1:])]))
+        self.n_markers = len(self.marker_p)
+        self.size = size
+        self.count = 0
+        self.heights = np.zeros((self.n_markers, size))
+        self.positions = np.tile(np.arange(1.0, self.n_markers + 1)[:, None], (1, size))
+        self.desired = 1 + (self.n_markers - 1) * self.marker_p[:, None] * np.ones((1, size))
+        self._first = []
+
+    def update(self, x):
+        # One observation per estimator (e.g. one path's value at every time step)
+        x = np.asarray(x, dtype=float)
+        self.count += 1
+        if self.count <= self.n_markers:
+            self._first.append(x)
+            if self.count == self.n_markers:
+                self.heights = np.sort(np.array(self._first), axis=0)
+                self._first = []
+            return
+
+        q, n = self.heights, self.positions
+        cols = np.arange(self.size)
+        q[0] = np.minimum(q[0], x)
+        q[-1] = np.maximum(q[-1], x)
+        # Cell k with q[k] <= x < q[k + 1]; every marker above it moves up one
+        k = np.clip((x[None, :] >= q).sum(axis=0) - 1, 0, self.n_markers - 2)
+        n += np.arange(self.n_markers)[:, None] > k[None, :]
+        self.desired += self.marker_p[:, None]
+
+        for i in range(1, self.n_markers - 1):
+            d = self.desired[i] - n[i]
+            move = ((d >= 1) & (n[i + 1] - n[i] > 1)) | ((d <= -1) & (n[i - 1] - n[i] < -1))
+            if not move.any():
+                continue
+            d = np.sign(d)
+            # Piecewise-parabolic prediction, linear if it would break the ordering
+            parabolic = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+            )
+            neighbour = np.where(d > 0, i + 1, i - 1)
+            linear = q[i] + d * (q[neighbour, cols] - q[i]) / (n[neighbour, cols] - n[i])
+            ordered = (q[i - 1] < parabolic) & (parabolic < q[i + 1])
+            q[i] = np.where(move, np.where(ordered, parabolic, linear), q[i])
+            n[i] = np.where(move, n[i] + d, n[i])
+
+    def update_many(self, block):
+        # (observations, size) block, e.g. a batch of paths
+        for row in np.asarray(block, dtype=float):
+            self.update(row)
+
+    def values(self):
+        # (len(quantiles), size) current estimates
+        if self.count < self.n_markers:
+            return np.quantile(np.array(self._first), self.quantiles, axis=0)
+        return self.heights[np.searchsorted(self.marker_p, self.quantiles)]
+
+
+def path_quantiles(simulate, n_paths, batch_size=512, quantiles=FAN_QUANTILES, seed=0):
+    # simulate(count, rng) -> (count, steps) block of paths; only one batch is in memory at a time
+    rng = np.random.default_rng(seed)
+    estimator = None
+    done = 0
+    while done < n_paths:
+        block = simulate(min(batch_size, n_paths - done), rng)
+        if estimator is None:
+            estimator = P2Quantiles(quantiles, block.shape[1])
+        estimator.update_many(block)
+        done += len(block)
+    return estimator.values()
+
+
+class FanChart(VGroup):
+    # Bands between symmetric quantile pairs (outermost first, lighter) plus the
+    # median. quantile_values is (len(quantiles), len(t)), ascending quantiles.
+    def __init__(self, axes, t, quantile_values, color=BLUE, band_opacities=(0.2, 0.4), median_width=3, **kwargs):
+        super().__init__(**kwargs)
+        values = np.asarray(quantile_values, dtype=float)
+        t = np.asarray(t, dtype=float)
+        self.bands = VGroup()
+        for level in range(len(values) // 2):
+            upper = coords_to_points(axes, t, values[-1 - level])
+            lower = coords_to_points(axes, t, values[level])
+            band = VMobject(fill_color=color, fill_opacity=band_opacities[min(level, len(band_opacities) - 1)],
+                            stroke_width=0)
+            band.set_points_as_corners(np.concatenate([upper, lower[::-1], upper[:1]]))
+            self.bands.add(band)
+        self.median = VMobject(color=color, stroke_width=median_width)
+        if len(values) % 2:
+            self.median.set_points_as_corners(coords_to_points(axes, t, values[len(values) // 2]))
+        self.add(self.bands, self.median)
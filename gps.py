@@ -1,5 +1,12 @@
 from manim import *
 import numpy as np
+import time
+
+from gps_router import OccupancyGrid, astar, simplify
+from path_relax import relax_path
+from quality_profile import QUALITY
+from road_router import contraction_hierarchy, default_network
+from street_map import MapFrame, RouteLine, StreetNetwork
 
 class GPSCalculusTikTok(Scene):
     def construct(self):
@@ -58,6 +65,17 @@ class GPSCalculusTikTok(Scene):
         
         self.play(Create(start_dot), Create(end_dot), Write(start_label), Write(end_label))
 
+        # Route on an occupancy grid of the map: buildings grown by a little
+        # clearance, A* from the start cell to the target cell
+        building_rects = [(*b.get_corner(DL)[:2], *b.get_corner(UR)[:2]) for b in buildings]
+        router = OccupancyGrid((-2.2, 2.2), (-2.6, -0.2), 0.02, building_rects, clearance=0.08)
+        start_cell = router.to_cell(start_dot.get_center())
+        end_cell = router.to_cell(end_dot.get_center())
+        search = astar(router, start_cell, end_cell)
+
+        def route_points(cells):
+            return simplify(router.to_points(cells))
+
         # Steps to show
         steps = [
             r"\text{You just ask for directions...}",
@@ -87,20 +105,18 @@ class GPSCalculusTikTok(Scene):
         new_step = MathTex(steps[1], font_size=36, color=ORANGE).next_to(watermark, DOWN, buff=0.3)
         self.play(Transform(step_text, new_step))
         
-        # Show the actual optimal path around buildings - adjusted for smaller grid
-        optimal_path_points = [
-            [-1.8, -0.4, 0],   # start
-            [-1.8, -0.5, 0],   # go down a bit
-            [-1.0, -0.5, 0],   # go right
-            [-1.0, -1.0, 0],   # go down
-            [0.3, -1.0, 0],    # go right
-            [0.3, -1.9, 0],    # go down
-            [1.8, -1.9, 0],    # go right
-            [1.8, -2.2, 0]     # reach target
-        ]
+        # Show the actual optimal path around buildings, pinned to the dots at either end
+        optimal_path_points = route_points(search.path())
+        optimal_path_points[0] = start_dot.get_center()
+        optimal_path_points[-1] = end_dot.get_center()
+
+        # The grid route is only good to a cell; descending the discretized
+        # length functional (plus a building penalty) pulls it taut
+        relaxation = relax_path(optimal_path_points, building_rects, n_nodes=QUALITY.samples(300),
+                                iterations=1000, record_every=1)
         
         optimal_path = VMobject()
-        optimal_path.set_points_smoothly([np.array(p) for p in optimal_path_points])
+        optimal_path.set_points_as_corners(optimal_path_points)
         optimal_path.set_color(GREEN)
         optimal_path.set_stroke(width=6)
         
@@ -138,34 +154,40 @@ class GPSCalculusTikTok(Scene):
         # Step 7: The actual differential equation
         new_step = MathTex(steps[6], font_size=28, color=PINK).next_to(watermark, DOWN, buff=0.3)
         self.play(Transform(step_text, new_step))
-        self.wait(2)
+
+        # Solve it: the route relaxes iterate by iterate to the Euler-Lagrange solution
+        iteration_label = Text("iteration", font_size=18, color=GREY).next_to(grid, DOWN, buff=0.4).shift(LEFT * 0.4)
+        iteration_count = Integer(0, font_size=24, color=PINK).next_to(iteration_label, RIGHT, buff=0.15)
+        self.play(FadeIn(iteration_label), FadeIn(iteration_count))
+
+        # Iterations on a log scale: the big early moves and the slow finish both get screen time
+        def relax(path, alpha):
+            iteration = (1 + relaxation.iterations[-1]) ** alpha - 1
+            frame = relaxation.at_iteration(iteration)
+            path.set_points_as_corners(np.column_stack([frame, np.zeros(len(frame))]))
+            iteration_count.set_value(round(iteration))
+
+        self.play(UpdateFromAlphaFunc(optimal_path, relax), run_time=3, rate_func=linear)
+        self.wait(1)
+        self.play(FadeOut(iteration_label), FadeOut(iteration_count))
 
         # Step 8: Mind-blown finale
         new_step = MathTex(steps[7], font_size=36, color=GREEN).next_to(watermark, DOWN, buff=0.3)
         self.play(Transform(step_text, new_step))
         
-        # Show MANY more path calculations happening rapidly - like phone is calculating
-        for round in range(4):  # Multiple rounds of calculations
+        # Replay the routes A* actually weighed on the way to the answer: the path
+        # to the cell it was expanding at 24 moments of the search
+        candidates = search.candidates(24)
+        for batch_index in range(4):  # Multiple rounds of calculations
             paths_to_show = VGroup()
             
-            for i in range(6):  # 6 paths per round
-                # Create more varied path attempts
-                variation_points = [[p[0], p[1], p[2]] for p in optimal_path_points]
-                
-                # Add more randomness to show different "attempts"
-                for j in range(1, len(variation_points)-1):
-                    variation_points[j][0] += np.random.uniform(-0.4, 0.4)
-                    variation_points[j][1] += np.random.uniform(-0.3, 0.3)
-                
-                # Some paths try to go through buildings (bad solutions)
-                if i < 2:
-                    variation_points[2][0] += np.random.uniform(-0.8, 0.8)
-                    variation_points[3][1] += np.random.uniform(-0.5, 0.5)
-                
+            # Color-code by how far each candidate still is from the target: red far, blue closer, green nearly there
+            batch = sorted(candidates[batch_index * 6:(batch_index + 1) * 6],
+                           key=lambda cells: -np.hypot(*(cells[-1] - np.array(end_cell))))
+            for i, cells in enumerate(batch):
                 variation_path = VMobject()
-                variation_path.set_points_smoothly([np.array(p) for p in variation_points])
+                variation_path.set_points_as_corners(route_points(cells))
                 
-                # Color-code the paths: red for bad, blue for okay, green for good
                 if i < 2:
                     variation_path.set_color(RED)  # Bad paths
                 elif i < 4:
@@ -180,18 +202,20 @@ class GPSCalculusTikTok(Scene):
             self.play(Create(paths_to_show, run_time=0.4))
             self.play(FadeOut(paths_to_show, run_time=0.3))
         
-        # Show final "convergence" - multiple good paths getting closer to optimal
+        # Final "convergence": routes from all around the start, each read off the
+        # cached distance field to the target, funnel onto the same optimal path
         final_paths = VGroup()
-        for i in range(8):
-            variation_points = [[p[0], p[1], p[2]] for p in optimal_path_points]
-            
-            # Very small variations around the optimal path
-            for j in range(1, len(variation_points)-1):
-                variation_points[j][0] += np.random.uniform(-0.1, 0.1)
-                variation_points[j][1] += np.random.uniform(-0.08, 0.08)
+        for angle in np.linspace(0, 2 * PI, 8, endpoint=False):
+            nearby = start_dot.get_center() + 0.25 * np.array([np.cos(angle), np.sin(angle), 0])
+            nearby_cell = router.to_cell(nearby)
+            if not router.free(nearby_cell):
+                continue
+            cells = router.route_to(nearby_cell, end_cell)
+            if cells is None:
+                continue
             
             variation_path = VMobject()
-            variation_path.set_points_smoothly([np.array(p) for p in variation_points])
+            variation_path.set_points_smoothly(route_points(cells))
             variation_path.set_color(YELLOW)
             variation_path.set_stroke(width=2)
             final_paths.add(variation_path)
@@ -212,8 +236,19 @@ class GPSCalculusTikTok(Scene):
         self.play(Create(box))
         self.wait(2)
 
-        # Add final "calculation speed" indicator
-        speed_text = Text("Processing: 1000 calculations/sec", font_size=24, color=YELLOW)
+        # Add final "calculation speed" indicator, timed right here: routes to
+        # the destination from random free cells of the map, walked off its
+        # cached distance field (a fresh A* solve takes a few ms)
+        rng = np.random.default_rng(0)
+        free_cells = np.argwhere(~router.blocked)[:, ::-1]
+        starts = free_cells[rng.integers(0, len(free_cells), 500)]
+        router.distance_field(end_cell)
+        began = time.perf_counter()
+        for cell in starts:
+            router.route_to(tuple(cell), end_cell)
+        routes_per_second = len(starts) / (time.perf_counter() - began)
+        speed_text = Text(f"Processing: {routes_per_second:,.0f} routes/sec to this destination",
+                          font_size=24, color=YELLOW)
         speed_text.next_to(box, DOWN, buff=0.3)
         self.play(Write(speed_text))
         
@@ -222,4 +257,99 @@ class GPSCalculusTikTok(Scene):
             self.play(speed_text.animate.set_opacity(0.3), run_time=0.2)
             self.play(speed_text.animate.set_opacity(1), run_time=0.2)
         
-        self.wait(1)
\ No newline at end of file
+        self.wait(1)
+
+class GPSCityRoutingTikTok(Scene):
+    def construct(self):
+        # Title and watermark (persistent)
+        title = Text("Your GPS Searches a Whole City in Microseconds", font_size=42, color=BLUE).to_edge(UP)
+        watermark = Text("@calc4dumb", font_size=24, color=GREY).next_to(title, DOWN, buff=0.1)
+        self.add(title, watermark)
+
+        # A local OSM extract if there is one (CALC4DUMB_OSM_FILE or data/city.osm),
+        # otherwise a synthetic city; the contraction hierarchy comes from the disk cache
+        network = default_network()
+        hierarchy = contraction_hierarchy(network)
+
+        # Zoomed in a little, so streets off the edge of the map box are culled
+        frame = MapFrame(network.bounds(), 6.4, 4.2, center=DOWN * 1.1, zoom=1.25)
+        streets = StreetNetwork(network, frame, color=GREY_B, stroke_width=1)
+        map_box = Rectangle(width=frame.width, height=frame.height, color=GREY, stroke_width=2).move_to(frame.center)
+        self.play(Create(map_box), Create(streets), run_time=2)
+
+        # Start and end near opposite corners of the map box
+        xmin, ymin, xmax, ymax = frame.viewport()
+        start = network.nearest_node(frame.to_network([xmin + 0.5, ymax - 0.5]))
+        end = network.nearest_node(frame.to_network([xmax - 0.5, ymin + 0.5]))
+        start_dot = Dot(frame.to_scene(network.xy[start])[0], color=GREEN, radius=0.08)
+        end_dot = Dot(frame.to_scene(network.xy[end])[0], color=RED, radius=0.08)
+        start_label = Text("You", font_size=16, color=GREEN).next_to(start_dot, UP, buff=0.05)
+        end_label = Text("Target", font_size=16, color=RED).next_to(end_dot, DOWN, buff=0.05)
+        self.play(Create(start_dot), Create(end_dot), Write(start_label), Write(end_label))
+
+        distance, path = hierarchy.query(start, end)
+        forward, backward = hierarchy.search_space(start, end)
+        # Everything plain Dijkstra settles before it reaches the target
+        dijkstra_nodes = np.flatnonzero(np.isfinite(network.distances_from(start, limit=distance)))
+        # Speed, timed right here on a batch of random queries
+        rng = np.random.default_rng(0)
+        targets = rng.integers(0, network.n_nodes, 200)
+        began = time.perf_counter()
+        routes = [hierarchy.query(start, int(target))[1] for target in targets]
+        per_route = (time.perf_counter() - began) / len(targets)
+
+        steps = [
+            rf"\text{{A city: {network.n_nodes:,} intersections}}",
+            rf"\text{{Dijkstra checks {len(dijkstra_nodes):,} of them...}}",
+            rf"\text{{Contraction hierarchy: {len(forward) + len(backward):,}}}",
+            r"\text{Climb to big roads, meet in the middle}",
+            rf"\text{{{1 / per_route:,.0f} routes per second!}}",
+        ]
+
+        # Step 1: The city
+        step_text = MathTex(steps[0], font_size=36, color=BLUE).next_to(watermark, DOWN, buff=0.3)
+        self.play(Write(step_text))
+        self.wait(1)
+
+        # Step 2: Plain Dijkstra floods outward from the start
+        new_step = MathTex(steps[1], font_size=36, color=ORANGE).next_to(watermark, DOWN, buff=0.3)
+        self.play(Transform(step_text, new_step))
+        flood = PMobject(stroke_width=4)
+        flood.add_points(frame.to_scene(network.xy[dijkstra_nodes]), color=ORANGE)
+        self.play(FadeIn(flood))
+        self.wait(1)
+
+        # Step 3: The hierarchy only climbs from each end
+        new_step = MathTex(steps[2], font_size=36, color=PURPLE).next_to(watermark, DOWN, buff=0.3)
+        self.play(Transform(step_text, new_step))
+        climb = PMobject(stroke_width=6)
+        climb.add_points(frame.to_scene(network.xy[forward]), color=GREEN)
+        climb.add_points(frame.to_scene(network.xy[backward]), color=RED)
+        self.play(FadeOut(flood), FadeIn(climb))
+        self.wait(1)
+
+        # Step 4: Where they meet is the route, unpacked back into streets
+        new_step = MathTex(steps[3], font_size=34, color=YELLOW).next_to(watermark, DOWN, buff=0.3)
+        self.play(Transform(step_text, new_step))
+        route = RouteLine(network, frame, path, color=GOLD, stroke_width=6)
+        self.play(Create(route), run_time=2)
+        self.play(FadeOut(climb))
+        self.wait(1)
+
+        # Step 5: Speed, and a few of the routes it was timed on
+        new_step = MathTex(steps[4], font_size=36, color=GREEN).next_to(watermark, DOWN, buff=0.3)
+        self.play(Transform(step_text, new_step))
+
+        others = VGroup(*[
+            RouteLine(network, frame, other, color=BLUE, stroke_width=2)
+            for other in routes[:12] if other is not None and len(other) > 1
+        ])
+        self.play(LaggedStartMap(Create, others, lag_ratio=0.15), run_time=QUALITY.lagged_time(2))
+        self.play(FadeOut(others))
+
+        box = SurroundingRectangle(step_text, color=GREEN, buff=0.3)
+        self.play(Create(box))
+        speed_text = Text(f"{per_route * 1e6:,.0f} microseconds per route", font_size=24, color=YELLOW)
+        speed_text.next_to(box, DOWN, buff=0.3)
+        self.play(Write(speed_text))
+        self.wait(2)
@@ -0,0 +1,420 @@
+import argparse
+import time
+from collections import OrderedDict
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+# Obstacle-aware routing for GPSCalculusTikTok.
+#   OccupancyGrid  buildings (xmin, ymin, xmax, ymax) rasterized onto a square
+#                  cell grid, grown by a clearance so routes don't scrape walls
+#   astar          8-connected A* with the octile-distance heuristic (exact
+#                  for 8-connected moves, so admissible and consistent); no
+#                  corner cutting past blocked cells. Run as csgraph Dijkstra
+#                  in C on the potential-reduced weights w - h(u) + h(v), which
+#                  settles nodes in A*'s order. Only the box round start and
+#                  goal is reweighted (cached per goal and box): a route that
+#                  leaves the box costs at least the cheapest octile detour
+#                  through a free cell just outside it, so Dijkstra is limited
+#                  to that and the box doubles if the goal isn't inside. Within
+#                  a box the search radius starts small and doubles too, since
+#                  Dijkstra can't stop at the goal. The settled nodes are kept,
+#                  so the routes it actually considered can be replayed
+#   distance_field every cell's distance to one target (csgraph Dijkstra in
+#                  C), cached per target; after that a route from anywhere is
+#                  a walk down the predecessor tree
+# Every cell on an octile-shortest line to the goal has the same f, and the
+# reduced weights can't break those ties towards the goal the way a heap key
+# can, so open ground costs extra settled cells, and a solve's time is mostly
+# Dijkstra settling them (about 0.5 us each). Measured on a slow single core:
+# about 3 ms per fresh solve on the scene's 220 x 120 grid (300/s; a cached
+# route to one target takes 20 us); on a 1000 x 1000 city 65-85 ms for a
+# random pair and 0.4 s corner to corner, where the box is the whole city.
+#
+# Benchmark: python gps_router.py --size 1000
+
+SQRT2 = np.sqrt(2.0)
+# (row step, column step, length in cells)
+MOVES = ((0, 1, 1.0), (1, 0, 1.0), (0, -1, 1.0), (-1, 0, 1.0),
+         (1, 1, SQRT2), (1, -1, SQRT2), (-1, 1, SQRT2), (-1, -1, SQRT2))
+
+
+class OccupancyGrid:
+    def __init__(self, x_range, y_range, cell_size, rects=(), clearance=0.0):
+        self.x0, self.y0 = x_range[0], y_range[0]
+        self.cell_size = cell_size
+        self.cols = int(np.ceil((x_range[1] - x_range[0]) / cell_size))
+        self.rows = int(np.ceil((y_range[1] - y_range[0]) / cell_size))
+        self.blocked = np.zeros((self.rows, self.cols), dtype=bool)
+        self._fields = OrderedDict()
+        self._searches = OrderedDict()
+        self._graph = None
+        self._edges = None
+        self._moves = None
+        for rect in rects:
+            self.block(rect, clearance)
+
+    def block(self, rect, clearance=0.0):
+        xmin, ymin, xmax, ymax = rect
+        c0, r0 = self.to_cell((xmin - clearance, ymin - clearance))
+        c1, r1 = self.to_cell((xmax + clearance, ymax + clearance))
+        self.blocked[max(r0, 0):max(r1 + 1, 0), max(c0, 0):max(c1 + 1, 0)] = True
+        self._fields.clear()
+        self._searches.clear()
+        self._graph = None
+        self._moves = None
+
+    def to_cell(self, point):
+        # (column, row) of the cell containing an (x, y) point
+        return (int(np.floor((point[0] - self.x0) / self.cell_size)),
+                int(np.floor((point[1] - self.y0) / self.cell_size)))
+
+    def to_points(self, cells):
+        # (column, row) cells -> (n, 3) scene points at the cell centres
+        cells = np.asarray(cells, dtype=float).reshape(-1, 2)
+        points = np.zeros((len(cells), 3))
+        points[:, 0] = self.x0 + (cells[:, 0] + 0.5) * self.cell_size
+        points[:, 1] = self.y0 + (cells[:, 1] + 0.5) * self.cell_size
+        return points
+
+    def free(self, cell):
+        c, r = cell
+        return 0 <= c < self.cols and 0 <= r < self.rows and not self.blocked[r, c]
+
+    def moves(self):
+        # (rows, cols, moves) mask of the moves each cell can make: both cells
+        # free, and for diagonals both side cells too (no corner cutting)
+        if self._moves is None:
+            free = np.pad(~self.blocked, 1)
+            rows, cols = self.rows, self.cols
+            self._moves = np.empty((rows, cols, len(MOVES)), dtype=bool)
+            for k, (dr, dc, _) in enumerate(MOVES):
+                ok = free[1:-1, 1:-1] & free[1 + dr:1 + dr + rows, 1 + dc:1 + dc + cols]
+                if dr and dc:
+                    ok &= free[1 + dr:1 + dr + rows, 1:-1] & free[1:-1, 1 + dc:1 + dc + cols]
+                self._moves[:, :, k] = ok
+        return self._moves
+
+    def graph(self):
+        # Sparse 8-connected graph over every cell as CSR, each edge stored in
+        # both directions, weights in scene units; blocked cells get no edges
+        if self._graph is None:
+            self._graph, self._edges = window_graph(self.moves(), self.cell_size)
+        return self._graph
+
+    def search_graph(self, goal, window, max_cached=4):
+        # A* over the window (r0, r1, c0, c1) as Dijkstra: octile distance to
+        # goal per window cell (flat) and the window's graph with each edge
+        # u -> v reweighted to w - h(u) + h(v); cached per (goal, window)
+        key = (tuple(goal), window)
+        if key in self._searches:
+            self._searches.move_to_end(key)
+            return self._searches[key]
+        r0, r1, c0, c1 = window
+        dx = np.abs(np.arange(c0, c1) - goal[0])[None, :]
+        dy = np.abs(np.arange(r0, r1) - goal[1])[:, None]
+        h = (np.maximum(dx, dy) + (SQRT2 - 1) * np.minimum(dx, dy)) * self.cell_size
+        if window == (0, self.rows, 0, self.cols):
+            graph, edges = self.graph(), self._edges
+        else:
+            graph, edges = window_graph(self.moves()[r0:r1, c0:c1], self.cell_size)
+        entry = (h.ravel(), reduced_graph(graph, edges, h, self.cell_size))
+        self._searches[key] = entry
+        if len(self._searches) > max_cached:
+            self._searches.popitem(last=False)
+        return entry
+
+    def distance_field(self, target, max_cached=8):
+        # (distance to target per cell as (rows, cols), flat predecessor list), cached per target cell
+        target = tuple(target)
+        if target in self._fields:
+            self._fields.move_to_end(target)
+            return self._fields[target]
+        c, r = target
+        # The graph already holds both directions; directed=False would symmetrize it again
+        distance, predecessors = dijkstra(self.graph(), indices=r * self.cols + c, return_predecessors=True)
+        # Predecessors as a list: route walks index it one step at a time
+        field = (distance.reshape(self.rows, self.cols), predecessors.tolist())
+        self._fields[target] = field
+        if len(self._fields) > max_cached:
+            self._fields.popitem(last=False)
+        return field
+
+    def route_to(self, start, target):
+        # Cells from start to target using the cached field for target; None if unreachable
+        distance, predecessors = self.distance_field(target)
+        c, r = start
+        if not np.isfinite(distance[r, c]):
+            return None
+        node = r * self.cols + c
+        # Dijkstra was rooted at the target, so predecessors lead back towards it
+        path = [node]
+        while predecessors[node] >= 0:
+            node = predecessors[node]
+            path.append(node)
+        path = np.array(path)
+        return np.stack([path % self.cols, path // self.cols], axis=1)
+
+
+def window_graph(moves, cell_size):
+    # CSR graph over a (rows, cols, moves) window of the move mask, dropping
+    # moves that leave it. Also where each stored edge sits in the flattened
+    # mask, which is how reduced_graph finds its weight
+    rows, cols, _ = moves.shape
+    n = rows * cols
+    moves = moves.copy()
+    for k, (dr, dc, _) in enumerate(MOVES):
+        if dr:
+            moves[0 if dr < 0 else -1, :, k] = False
+        if dc:
+            moves[:, 0 if dc < 0 else -1, k] = False
+    # Row-major over (cell, move), so edges come out grouped by source cell
+    edges = np.flatnonzero(moves)
+    source, move = np.divmod(edges, len(MOVES))
+    target = source + np.array([dr * cols + dc for dr, dc, _ in MOVES])[move]
+    lengths = np.array([length for _, _, length in MOVES]) * cell_size
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(moves.sum(axis=2).ravel(), out=indptr[1:])
+    return csr_matrix((lengths[move], target.astype(np.int32), indptr), shape=(n, n)), edges
+
+
+def reduced_graph(graph, edges, h, cell_size):
+    # The graph with each edge u -> v reweighted to w - h(u) + h(v), worked
+    # out a move at a time on the (rows, cols) h; h consistent keeps it >= 0
+    rows, cols = h.shape
+    padded = np.pad(h, 1)
+    change = np.empty((rows, cols, len(MOVES)))
+    for k, (dr, dc, length) in enumerate(MOVES):
+        np.subtract(padded[1 + dr:1 + dr + rows, 1 + dc:1 + dc + cols], h, out=change[:, :, k])
+        change[:, :, k] += length * cell_size
+    weights = change.reshape(-1).take(edges)
+    # Rounding can leave -1e-16 where h drops by exactly the edge length
+    np.maximum(weights, 0, out=weights)
+    return csr_matrix((weights, graph.indices, graph.indptr), shape=graph.shape)
+
+
+class SearchResult:
+    def __init__(self, grid, start, goal, cost, came_from, expanded, window):
+        self.grid = grid
+        self.start = start
+        self.goal = goal
+        self.cost = cost  # scene units, inf if unreachable
+        # Both in flat indices of the window (r0, r1, c0, c1) the search ran in
+        self.came_from = came_from  # index -> parent, -1 for none
+        self.expanded = expanded  # in the order A* closes them
+        self.window = window
+
+    def trace(self, node):
+        # (column, row) cells from the start to a window index
+        r0, _, c0, c1 = self.window
+        path = [node]
+        while self.came_from[node] >= 0:
+            node = self.came_from[node]
+            path.append(node)
+        path = np.array(path[::-1])
+        return np.stack([path % (c1 - c0) + c0, path // (c1 - c0) + r0], axis=1)
+
+    def path(self):
+        if not np.isfinite(self.cost):
+            return None
+        r0, _, c0, c1 = self.window
+        return self.trace((self.goal[1] - r0) * (c1 - c0) + self.goal[0] - c0)
+
+    def candidates(self, count):
+        # Best partial routes at evenly spaced moments of the search: the path to
+        # the node A* was expanding (closed nodes' parents never change again)
+        picks = np.linspace(min(1, len(self.expanded) - 1), len(self.expanded) - 1, count).round().astype(int)
+        return [self.trace(self.expanded[i]) for i in picks]
+
+
+def exit_bound(grid, start, goal, window):
+    # Lower bound on any route that leaves the window: it has to pass a free
+    # cell just outside, and costs at least octile(start, x) + octile(x, goal)
+    r0, r1, c0, c1 = window
+    lo, hi = max(c0 - 1, 0), min(c1 + 1, grid.cols)
+    rows, cols = [], []
+    if r0 > 0:
+        rows.append(np.full(hi - lo, r0 - 1))
+        cols.append(np.arange(lo, hi))
+    if r1 < grid.rows:
+        rows.append(np.full(hi - lo, r1))
+        cols.append(np.arange(lo, hi))
+    if c0 > 0:
+        rows.append(np.arange(r0, r1))
+        cols.append(np.full(r1 - r0, c0 - 1))
+    if c1 < grid.cols:
+        rows.append(np.arange(r0, r1))
+        cols.append(np.full(r1 - r0, c1))
+    if not rows:
+        return np.inf
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    free = ~grid.blocked[rows, cols]
+    if not free.any():
+        return np.inf
+    rows, cols = rows[free], cols[free]
+
+    def octile(c, r):
+        dx, dy = np.abs(cols - c), np.abs(rows - r)
+        return np.maximum(dx, dy) + (SQRT2 - 1) * np.minimum(dx, dy)
+
+    return float((octile(*start) + octile(*goal)).min()) * grid.cell_size
+
+
+def astar(grid, start, goal, pad=16):
+    # start, goal: (column, row) cells. Searches the box round start and goal,
+    # padded by pad cells, and doubles the padding until the route found beats
+    # exit_bound. Dijkstra can't stop at the goal, so within a window the
+    # detour it may look at starts small and doubles too
+    if not (grid.free(start) and grid.free(goal)):
+        raise ValueError(f"start {start} and goal {goal} must be free cells")
+    (sc, sr), (gc, gr) = start, goal
+    # A reduced edge weighs at most twice its length
+    longest = 2 * SQRT2 * grid.cell_size
+    detour = None
+    while True:
+        window = (max(min(sr, gr) - pad, 0), min(max(sr, gr) + pad + 1, grid.rows),
+                  max(min(sc, gc) - pad, 0), min(max(sc, gc) + pad + 1, grid.cols))
+        r0, r1, c0, c1 = window
+        if 2 * (r1 - r0) * (c1 - c0) > grid.rows * grid.cols:
+            # The whole grid's graph is built once and reweights faster
+            window = r0, r1, c0, c1 = 0, grid.rows, 0, grid.cols
+        width = c1 - c0
+        h, reduced = grid.search_graph(goal, window)
+        start_node, goal_node = (sr - r0) * width + sc - c0, (gr - r0) * width + gc - c0
+        if detour is None:
+            detour = 0.05 * h[start_node] + 4 * grid.cell_size
+        # Reduced distance is the detour over h(start); past the exit bound a
+        # route might leave the window, so the window grows instead
+        bound = exit_bound(grid, start, goal, window) - h[start_node]
+        while True:
+            limit = min(detour, bound)
+            distance, predecessors = dijkstra(reduced, indices=start_node, limit=limit, return_predecessors=True)
+            reached = np.isfinite(distance)
+            if reached[goal_node] or limit == bound:
+                break
+            if distance[reached].max() + longest < limit and not np.isfinite(bound):
+                # Nothing left at the edge of the search: the goal is cut off
+                break
+            detour *= 2
+        if reached[goal_node] or not np.isfinite(bound):
+            break
+        pad *= 2
+
+    came_from = np.maximum(predecessors, -1)
+    if not reached[goal_node]:
+        # Out of reach: everything the search could get to, in order
+        reached = np.flatnonzero(reached)
+        return SearchResult(grid, start, goal, np.inf, came_from, reached[np.argsort(distance[reached])], window)
+    # Everything A* closes before the goal: f = g + h up to the goal's, nearer the goal first on ties
+    closed = np.flatnonzero(distance <= distance[goal_node])
+    expanded = closed[np.lexsort((h[closed], distance[closed]))]
+    expanded = expanded[:int(np.flatnonzero(expanded == goal_node)[0]) + 1]
+    return SearchResult(grid, start, goal, distance[goal_node] + h[start_node], came_from, expanded, window)
+
+
+def simplify(points, tolerance=1e-9):
+    # Drop interior points that sit on a straight run, leaving the corners
+    points = np.asarray(points, dtype=float)
+    if len(points) < 3:
+        return points
+    d1 = points[1:-1] - points[:-2]
+    d2 = points[2:] - points[1:-1]
+    turn = np.abs(d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0]) > tolerance
+    return np.concatenate([points[:1], points[1:-1][turn], points[-1:]])
+
+
+def random_city(size, n_buildings, seed=0):
+    # size x size unit cells with random rectangular blocks
+    rng = np.random.default_rng(seed)
+    lo = rng.uniform(0, size, (n_buildings, 2))
+    extent = rng.uniform(0.01, 0.05, (n_buildings, 2)) * size
+    return OccupancyGrid((0, size), (0, size), 1.0, np.concatenate([lo, lo + extent], axis=1))
+
+
+def nearest_cell(mask, cell):
+    # (column, row) of the True cell of mask closest to cell
+    rows, cols = np.nonzero(mask)
+    i = np.argmin((cols - cell[0]) ** 2 + (rows - cell[1]) ** 2)
+    return int(cols[i]), int(rows[i])
+
+
+def random_pairs(grid, reachable, count, rng):
+    free = np.argwhere(reachable)[:, ::-1]
+    return free[rng.integers(0, len(free), (count, 2))]
+
+
+def benchmark(size, n_buildings, queries, solves, seed=0):
+    grid = random_city(size, n_buildings, seed)
+    # Opposite corners of the goal's connected piece of the city
+    goal = nearest_cell(~grid.blocked, (size - 1, size - 1))
+    reachable = np.isfinite(grid.distance_field(goal)[0])
+    start = nearest_cell(reachable, (0, 0))
+    # Fresh grid so the timings below start cold
+    grid = random_city(size, n_buildings, seed)
+    print(f"{size}x{size} grid, {n_buildings} buildings, {grid.blocked.mean():.0%} blocked")
+
+    t0 = time.perf_counter()
+    grid.graph()
+    built = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    result = astar(grid, start, goal)
+    elapsed = time.perf_counter() - t0
+    print(f"  graph build          {built * 1000:8.1f} ms  (once per grid)")
+    print(f"  A* corner to corner  {elapsed * 1000:8.1f} ms  cost {result.cost:.2f}, "
+          f"{len(result.expanded):,} of {size * size:,} cells expanded")
+
+    # Fresh A* solves between random pairs, the graph already built
+    rng = np.random.default_rng(seed + 1)
+    pairs = random_pairs(grid, reachable, solves, rng)
+    t0 = time.perf_counter()
+    for s, g in pairs:
+        astar(grid, tuple(s), tuple(g))
+    per_solve = (time.perf_counter() - t0) / solves
+    print(f"  A* random pairs      {per_solve * 1000:8.1f} ms  -> {1 / per_solve:,.0f} solves/s")
+
+    t0 = time.perf_counter()
+    distance, _ = grid.distance_field(goal)
+    field = time.perf_counter() - t0
+    matches = np.isclose(distance[start[1], start[0]], result.cost)
+    print(f"  distance field       {field * 1000:8.1f} ms  (matches A*: {matches})")
+    starts = random_pairs(grid, reachable, queries, rng)[:, 0]
+    t0 = time.perf_counter()
+    for s in starts:
+        grid.route_to(s, goal)
+    elapsed = time.perf_counter() - t0
+    print(f"  cached route walk    {elapsed / queries * 1e6:8.1f} us  "
+          f"-> {queries / elapsed:,.0f} routes/s to that one target")
+
+    # The scene's own grid: 220 x 120 cells
+    small = OccupancyGrid((0, 220), (0, 120), 1.0, [(x, y, x + 14, y + 18) for x in range(20, 200, 40)
+                                                     for y in (20, 70)])
+    t0 = time.perf_counter()
+    small.graph()
+    built = time.perf_counter() - t0
+    pairs = random_pairs(small, ~small.blocked, solves, rng)
+    t0 = time.perf_counter()
+    for s, g in pairs:
+        astar(small, tuple(s), tuple(g))
+    per_solve = (time.perf_counter() - t0) / solves
+    print(f"  220x120 scene grid   {per_solve * 1000:8.1f} ms per A* solve ({built * 1000:.1f} ms graph build) "
+          f"-> {1 / per_solve:,.0f} solves/s")
+    # What the scene puts on screen: routes to its one destination off the cached field
+    target = tuple(pairs[0][1])
+    small.distance_field(target)
+    starts = random_pairs(small, np.isfinite(small.distance_field(target)[0]), queries, rng)[:, 0]
+    t0 = time.perf_counter()
+    for s in starts:
+        small.route_to(s, target)
+    rate = queries / (time.perf_counter() - t0)
+    print(f"  220x120 cached walk  {1e6 / rate:8.1f} us  -> {rate:,.0f} routes/s to one target "
+          f"({'meets' if rate >= 1000 else 'misses'} the scene's 1000/s)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Grid A* / distance-field routing benchmark")
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--buildings", type=int, default=300)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--solves", type=int, default=20)
+    args = parser.parse_args()
+    benchmark(args.size, args.buildings, args.queries, args.solves)
@@ -0,0 +1,104 @@
+import argparse
+import time
+from functools import lru_cache
+
+import numpy as np
+from scipy.special import ndtr
+
+# Closed-form Black-Scholes price and Greeks on whole (S, tau) grids at once.
+# d1/d2, the normal pdf/cdf and the discount factor are computed once and
+# shared by every Greek; greek_grid() caches finished grids by parameter
+# tuple, so scenes can ask for the same surface repeatedly for free.
+# Theta is per year of calendar time (dV/dt = -dV/dtau).
+#
+# Benchmark: python greeks.py --size 1000
+
+GREEKS = ("price", "delta", "gamma", "vega", "theta", "rho")
+SQRT_2PI = np.sqrt(2 * np.pi)
+
+
+def d1_d2(s, strike, rate, sigma, tau):
+    vol = sigma * np.sqrt(tau)
+    d1 = (np.log(s / strike) + (rate + 0.5 * sigma**2) * tau) / vol
+    return d1, d1 - vol
+
+
+def greeks(s, strike, rate, sigma, tau, kind="call"):
+    s, tau = np.broadcast_arrays(np.asarray(s, dtype=float), np.asarray(tau, dtype=float))
+    d1, d2 = d1_d2(s, strike, rate, sigma, tau)
+    sqrt_tau = np.sqrt(tau)
+    pdf = np.exp(-0.5 * d1**2) / SQRT_2PI
+    discount = strike * np.exp(-rate * tau)
+    sign = 1.0 if kind == "call" else -1.0
+    cdf1 = ndtr(sign * d1)
+    cdf2 = ndtr(sign * d2)
+    return {
+        "price": sign * (s * cdf1 - discount * cdf2),
+        "delta": sign * cdf1,
+        "gamma": pdf / (s * sigma * sqrt_tau),
+        "vega": s * pdf * sqrt_tau,
+        "theta": -s * pdf * sigma / (2 * sqrt_tau) - sign * rate * discount * cdf2,
+        "rho": sign * tau * discount * cdf2,
+    }
+
+
+class GreekGrid:
+    def __init__(self, s, tau, values):
+        self.s = s
+        self.tau = tau
+        self.values = values  # name -> (len(s), len(tau)), read-only
+
+    def __getitem__(self, name):
+        return self.values[name]
+
+    def normalized(self, name):
+        # Scaled into [-1, 1] by the largest |value|, for plotting Greeks on one set of axes
+        values = self.values[name]
+        peak = np.max(np.abs(values))
+        return values / peak if peak > 0 else values
+
+
+@lru_cache(maxsize=32)
+def greek_grid(strike, rate, sigma, kind="call", s_range=(50.0, 150.0), tau_range=(0.05, 1.0), resolution=(100, 100)):
+    # Every Greek on a resolution[0] x resolution[1] (S, tau) grid, S along axis 0
+    s = np.linspace(s_range[0], s_range[1], resolution[0])
+    tau = np.linspace(tau_range[0], tau_range[1], resolution[1])
+    s_grid, tau_grid = np.meshgrid(s, tau, indexing="ij")
+    values = greeks(s_grid, strike, rate, sigma, tau_grid, kind)
+    for array in (s, tau, *values.values()):
+        # Shared by every caller through the cache
+        array.setflags(write=False)
+    return GreekGrid(s, tau, values)
+
+
+def benchmark(size, strike=100.0, rate=0.05, sigma=0.2):
+    s = np.linspace(50, 150, size)
+    tau = np.linspace(0.05, 1.0, size)
+    s_grid, tau_grid = np.meshgrid(s, tau, indexing="ij")
+    start = time.perf_counter()
+    values = greeks(s_grid, strike, rate, sigma, tau_grid)
+    elapsed = time.perf_counter() - start
+
+    # Central differences of the price as a check
+    h = 1e-3
+    up, down = greeks(s_grid + h, strike, rate, sigma, tau_grid), greeks(s_grid - h, strike, rate, sigma, tau_grid)
+    delta_error = np.max(np.abs((up["price"] - down["price"]) / (2 * h) - values["delta"]))
+    gamma_error = np.max(np.abs((up["delta"] - down["delta"]) / (2 * h) - values["gamma"]))
+    print(f"{size}x{size} grid, all {len(GREEKS)} outputs in {elapsed * 1000:.1f} ms "
+          f"({size * size / elapsed / 1e6:.1f} M points/s); finite-difference check: "
+          f"delta {delta_error:.1e}, gamma {gamma_error:.1e}")
+
+    greek_grid.cache_clear()
+    start = time.perf_counter()
+    greek_grid(strike, rate, sigma, resolution=(size, size))
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    greek_grid(strike, rate, sigma, resolution=(size, size))
+    print(f"greek_grid: first call {first * 1000:.1f} ms, cached call {(time.perf_counter() - start) * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vectorized Black-Scholes Greeks benchmark")
+    parser.add_argument("--size", type=int, default=1000)
+    args = parser.parse_args()
+    benchmark(args.size)
@@ -0,0 +1,123 @@
+from manim import *
+import numpy as np
+
+from box_field import POINTS_PER_FACE, face_points, pad_for_shading
+from curve_utils import coords_to_points
+from riemann import evaluate
+
+# z = f(x, y) surfaces without manim's Surface (one VMobject per face).
+# Heights come in as one (nx, ny) array, quads are built in one shot, and
+# faces are merged into one VMobject per (color band, tile), so a 60x60 mesh
+# is a few hundred mobjects for ThreeDCamera to sort instead of 3600. Cells
+# with a NaN corner or a False mask entry are left out, so data that only
+# covers part of the grid (quoted strikes, a region) renders as-is.
+
+
+class GridSurface(VGroup):
+    def __init__(self, axes, xs, ys, zs, mask=None, colorscale=(BLUE_E, GREEN, YELLOW, RED), color_bins=16,
+                 z_range=None, fill_opacity=0.85, stroke_color=None, stroke_width=0.5, tile_cells=8, **kwargs):
+        super().__init__(**kwargs)
+        self.xs = np.asarray(xs, dtype=float)
+        self.ys = np.asarray(ys, dtype=float)
+        self.zs = np.asarray(zs, dtype=float).reshape(len(self.xs), len(self.ys))
+        self.colorscale = [ManimColor(c) for c in colorscale]
+        self.color_bins = color_bins
+        self.surface_fill_opacity = fill_opacity
+        self.surface_stroke_color = stroke_color
+        self.surface_stroke_width = stroke_width
+        self.tile_cells = tile_cells
+
+        finite = np.isfinite(self.zs)
+        if z_range is None:
+            z_range = (np.min(self.zs[finite]), np.max(self.zs[finite])) if finite.any() else (0.0, 1.0)
+        self.z_range = z_range
+
+        # A cell is drawn when all four corners are finite and (if given) unmasked
+        corners_ok = finite if mask is None else finite & np.asarray(mask, dtype=bool).reshape(finite.shape)
+        self.cell_mask = corners_ok[:-1, :-1] & corners_ok[1:, :-1] & corners_ok[1:, 1:] & corners_ok[:-1, 1:]
+        self.build_faces(axes)
+
+    @classmethod
+    def from_function(cls, axes, func, x_range, y_range, resolution=40, **kwargs):
+        nx, ny = (resolution, resolution) if isinstance(resolution, int) else resolution
+        xs = np.linspace(x_range[0], x_range[1], nx + 1)
+        ys = np.linspace(y_range[0], y_range[1], ny + 1)
+        x_grid, y_grid = np.meshgrid(xs, ys, indexing="ij")
+        return cls(axes, xs, ys, evaluate(func, x_grid, y_grid), **kwargs)
+
+    def grid_points(self, axes):
+        # (nx, ny, 3) scene points of the grid nodes
+        x_grid, y_grid = np.meshgrid(self.xs, self.ys, indexing="ij")
+        return coords_to_points(axes, x_grid, y_grid, np.nan_to_num(self.zs)).reshape(len(self.xs), len(self.ys), 3)
+
+    def band_colors(self):
+        # color_bins evenly spaced samples of the colorscale, low to high
+        stops = np.linspace(0, 1, self.color_bins)
+        positions = stops * (len(self.colorscale) - 1)
+        colors = []
+        for p in positions:
+            i = min(int(p), len(self.colorscale) - 2)
+            colors.append(interpolate_color(self.colorscale[i], self.colorscale[i + 1], p - i).to_hex())
+        return colors
+
+    def build_faces(self, axes):
+        self.remove(*self.submobjects)
+        ii, jj = np.nonzero(self.cell_mask)
+        self.face_count = len(ii)
+        if not self.face_count:
+            return self
+
+        points = self.grid_points(axes)
+        corners = np.stack([points[ii, jj], points[ii + 1, jj], points[ii + 1, jj + 1], points[ii, jj + 1]], axis=1)
+
+        z_low, z_high = self.z_range
+        cell_z = 0.25 * (self.zs[ii, jj] + self.zs[ii + 1, jj] + self.zs[ii + 1, jj + 1] + self.zs[ii, jj + 1])
+        scaled = (cell_z - z_low) / (z_high - z_low) if z_high > z_low else np.zeros_like(cell_z)
+        bands = np.clip((scaled * self.color_bins).astype(int), 0, self.color_bins - 1)
+        colors = self.band_colors()
+
+        # Tiles keep each merged mobject spatially local so depth sorting still works
+        keys = np.column_stack([bands, ii // self.tile_cells, jj // self.tile_cells])
+        groups, group_of = np.unique(keys, axis=0, return_inverse=True)
+        group_of = group_of.ravel()
+        for group, (band, _, _) in enumerate(groups):
+            cells = np.flatnonzero(group_of == group)
+            faces = pad_for_shading(face_points(corners[cells]))
+            mob = VMobject(
+                fill_color=colors[band],
+                fill_opacity=self.surface_fill_opacity,
+                stroke_color=self.surface_stroke_color or colors[band],
+                stroke_width=self.surface_stroke_width,
+                shade_in_3d=True,
+            )
+            mob.set_points(faces.reshape(-1, 3))
+            mob.face_count = len(cells)
+            self.add(mob)
+        return self
+
+    def get_face_centers(self):
+        # (face_count, 3) current quad centers, after any rotation or shift
+        return np.concatenate([
+            mob.points[:mob.face_count * POINTS_PER_FACE].reshape(-1, POINTS_PER_FACE, 3).mean(axis=1)
+            for mob in self.submobjects
+        ]) if self.submobjects else np.zeros((0, 3))
+
+
+class SphereSurface(GridSurface):
+    # Values on a lat/lon grid (degrees, longitudes wrapping round once) as a
+    # colored sphere: same banded, tiled faces, placed on the sphere instead of
+    # raised to z. The first longitude is repeated so the seam closes.
+    def __init__(self, lat, lon, values, radius=2.0, center=ORIGIN, **kwargs):
+        self.radius = radius
+        self.sphere_center = np.asarray(center, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        values = np.asarray(values, dtype=float).reshape(len(lat), len(lon))
+        # x is longitude and y latitude, so faces wind east then north (outward,
+        # like the upward faces of a flat surface)
+        super().__init__(None, np.append(lon, lon[0] + 360), lat, np.concatenate([values, values[:, :1]], axis=1).T,
+                         **kwargs)
+
+    def grid_points(self, axes):
+        lon, lat = np.meshgrid(np.radians(self.xs), np.radians(self.ys), indexing="ij")
+        unit = np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1)
+        return self.sphere_center + self.radius * unit
@@ -0,0 +1,141 @@
+import argparse
+import time
+
+import numpy as np
+from scipy.signal import lfilter
+
+# Streaming heart-rate filters for HeartRateCalculusTikTok.
+#   LowPassFilter   dy/dt + alpha y = alpha u, discretized exactly for a
+#                   sample held over dt: y += (1 - e^{-alpha dt}) (u - y)
+#   ScalarKalman    random-walk state x, noisy measurements z = x + noise
+#   HeartRateFilter low-pass, then Kalman ("low-pass filter + Kalman filtering")
+# update() takes one sample in O(1). process() takes a block and gives the
+# same outputs, through lfilter with the state carried between blocks, so
+# hours of 250 Hz data run thousands of times faster than real time.
+#
+# Benchmark: python hr_filter.py --hours 4 --rate 250
+
+
+class LowPassFilter:
+    def __init__(self, alpha, dt, y0=None):
+        self.alpha = alpha
+        self.dt = dt
+        self.gain = 1 - np.exp(-alpha * dt)
+        self.y = y0
+
+    def update(self, u):
+        if np.isnan(u):
+            # Dropout: hold the last output (NaN if nothing has arrived yet)
+            return np.nan if self.y is None else self.y
+        if self.y is None:
+            self.y = float(u)
+        else:
+            self.y += self.gain * (u - self.y)
+        return self.y
+
+    def process(self, block):
+        block = np.asarray(block, dtype=float)
+        if np.isnan(block).any():
+            return np.array([self.update(u) for u in block])
+        if self.y is None:
+            self.y = float(block[0])
+        # y[n] = (1 - g) y[n-1] + g u[n]
+        out, _ = lfilter([self.gain], [1, -(1 - self.gain)], block, zi=[(1 - self.gain) * self.y])
+        self.y = float(out[-1])
+        return out
+
+
+class ScalarKalman:
+    def __init__(self, process_var, measurement_var, x0=None, p0=None):
+        self.q = process_var
+        self.r = measurement_var
+        self.x = x0
+        self.p = measurement_var if p0 is None else p0
+
+    def update(self, z):
+        # Predict (random walk), then correct with z; a NaN sample is a dropout (predict only)
+        self.p += self.q
+        if z is None or np.isnan(z):
+            return np.nan if self.x is None else self.x
+        if self.x is None:
+            self.x, self.p = float(z), self.r
+            return self.x
+        k = self.p / (self.p + self.r)
+        self.x += k * (z - self.x)
+        self.p *= 1 - k
+        return self.x
+
+    def steady_gain(self):
+        # Fixed point of p -> (p + q) r / (p + q + r), as a gain
+        q, r = self.q, self.r
+        p = 0.5 * (-q + np.sqrt(q * q + 4 * q * r))
+        return (p + q) / (p + q + r)
+
+    def process(self, block):
+        block = np.asarray(block, dtype=float)
+        if np.isnan(block).any():
+            return np.array([self.update(z) for z in block])
+        out = np.empty_like(block)
+        # The gain doesn't depend on the data and converges geometrically; step
+        # one sample at a time until it has, after that it's a fixed IIR
+        steady = self.steady_gain()
+        i = 0
+        settled = lambda: abs((self.p + self.q) / (self.p + self.q + self.r) - steady) <= 1e-12
+        while i < len(block) and (self.x is None or not settled()):
+            out[i] = self.update(block[i])
+            i += 1
+        if i < len(block):
+            k = steady
+            rest, _ = lfilter([k], [1, -(1 - k)], block[i:], zi=[(1 - k) * self.x])
+            out[i:] = rest
+            self.x = float(rest[-1])
+            # Settled posterior variance: (1 - k) (p + q) = r k
+            self.p = self.r * k
+        return out
+
+
+class HeartRateFilter:
+    def __init__(self, dt, alpha=4.0, process_var=5.0, measurement_var=4.0):
+        self.low_pass = LowPassFilter(alpha, dt)
+        self.kalman = ScalarKalman(process_var * dt, measurement_var)
+
+    def update(self, sample):
+        return self.kalman.update(self.low_pass.update(sample))
+
+    def process(self, block):
+        return self.kalman.process(self.low_pass.process(block))
+
+
+def benchmark(hours, rate, block_size=1 << 16, seed=0):
+    n = int(hours * 3600 * rate)
+    dt = 1 / rate
+    rng = np.random.default_rng(seed)
+    t = np.arange(n) * dt
+    samples = 75 + 10 * np.sin(0.5 * t) + rng.normal(0, 2, n)
+
+    per_sample = min(n, 200_000)
+    hr = HeartRateFilter(dt)
+    start = time.perf_counter()
+    single = [hr.update(x) for x in samples[:per_sample]]
+    elapsed = time.perf_counter() - start
+    print(f"{hours:g} h at {rate:g} Hz = {n:,} samples")
+    print(f"  update() per sample: {per_sample / elapsed / 1e6:6.2f} M samples/s  "
+          f"({per_sample / elapsed / rate:,.0f}x real time)")
+
+    hr = HeartRateFilter(dt)
+    start = time.perf_counter()
+    blocks = [hr.process(samples[i:i + block_size]) for i in range(0, n, block_size)]
+    elapsed = time.perf_counter() - start
+    out = np.concatenate(blocks)
+    print(f"  process() blocks of {block_size:,}: {n / elapsed / 1e6:6.1f} M samples/s  "
+          f"({n / elapsed / rate:,.0f}x real time)  max |block - per-sample| "
+          f"{np.max(np.abs(out[:per_sample] - single)):.1e}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Streaming heart-rate filter throughput benchmark")
+    parser.add_argument("--hours", type=float, default=4)
+    parser.add_argument("--rate", type=float, default=250, help="sensor sample rate in Hz")
+    parser.add_argument("--block", type=int, default=1 << 16)
+    args = parser.parse_args()
+    benchmark(args.hours, args.rate, args.block)
@@ -1,12 +1,11 @@
 from manim import *
 
-class ImproperIntegralTikTok(Scene):
-    def construct(self):
-        # Title and watermark (persistent)
-        title = Text("Improper Integral Example", font_size=48, color=BLUE).to_edge(UP)
-        watermark = Text("@calc4dumb", font_size=24, color=GREY).next_to(title, DOWN, buff=0.1)
-        self.add(title, watermark)
+from step_scene import Step, StepSequenceScene
 
+class ImproperIntegralTikTok(StepSequenceScene):
+    title_text = "Improper Integral Example"
+
+    def construct_visual(self):
         # Smaller graph on bottom left
         axes = Axes(
             x_range=[0, 10, 1],
@@ -28,29 +27,19 @@ class ImproperIntegralTikTok(Scene):
         area = axes.get_area(graph, x_range=[1, 10], color=YELLOW, opacity=0.3)
         self.play(Create(graph), FadeIn(area))
 
+    def get_steps(self):
         # Steps to show, centered below watermark/title
-        steps = [
-            r"\int_1^\infty \frac{1}{x^2} \, dx",
-            r"= \lim_{b \to \infty} \int_1^b \frac{1}{x^2} \, dx",
-            r"= \lim_{b \to \infty} \left[-\frac{1}{x}\right]_1^b",
-            r"= \lim_{b \to \infty} \left(-\frac{1}{b} + 1\right)",
-            r"= 0 + 1 = 1",
+        return [
+            Step(r"\int_1^\infty \frac{1}{x^2} \, dx", color=BLUE, hold=1),
+            Step(r"= \lim_{b \to \infty} \int_1^b \frac{1}{x^2} \, dx", hold=2),
+            Step(r"= \lim_{b \to \infty} \left[-\frac{1}{x}\right]_1^b", hold=2),
+            Step(r"= \lim_{b \to \infty} \left(-\frac{1}{b} + 1\right)", hold=2),
+            Step(r"= 0 + 1 = 1", color=GREEN, hold=1.5),
         ]
 
-        # Create first step centered below watermark/title
-        step_text = MathTex(steps[0], font_size=48, color=BLUE).next_to(watermark, DOWN, buff=1)
-        self.play(Write(step_text))
-        self.wait(1)
-
-        # Iterate through remaining steps, smoothly transforming old into new
-        for i in range(1, len(steps)):
-            new_color = GREEN if i == len(steps) - 1 else WHITE
-            new_step = MathTex(steps[i], font_size=48, color=new_color).next_to(watermark, DOWN, buff=1)
-            self.play(Transform(step_text, new_step))
-            self.wait(2 if i < len(steps) - 1 else 1.5)
-
+    def construct_finale(self):
         # Highlight final answer with box
-        box = SurroundingRectangle(step_text, color=GREEN, buff=0.3)
+        box = SurroundingRectangle(self.step_text, color=GREEN, buff=0.3)
         self.play(Create(box))
         self.wait(1)
 
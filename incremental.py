@@ -0,0 +1,226 @@
+import functools
+import hashlib
+import os
+import sysconfig
+import types
+
+import numpy as np
+
+# Segment-level incremental rendering. Every play()/wait() gets a content
+# hash of exactly what it will draw: the full state of every mobject on
+# screen, the animations (class, timing, rate function, targets) and the
+# camera setup. The partial movie file is named after that hash, so after an
+# edit only segments whose inputs actually changed are rendered again; every
+# other segment - including ones after the edit, as long as the scene is back
+# in the same state - reuses its partial movie and ffmpeg just concatenates.
+#
+# Replaces manim's own play hash, which truncates big point arrays (two
+# different 125-cube grids can hash the same) and uses 32-bit CRCs.
+
+MAX_FILES_CACHED = int(os.environ.get("CALC4DUMB_MAX_PARTIAL_MOVIES", "2000"))
+
+# Attributes that change from run to run or are derived from the frame, not the content
+SKIP_KEYS = {
+    "original_id",
+    "background",
+    "pixel_array",
+    "pixel_array_to_cairo_context",
+    "partial_movie_files",
+}
+
+# Functions from these trees hash by code alone; their module globals
+# (loggers, config, locks) aren't scene content and don't repr stably
+LIBRARY_PATHS = tuple({os.path.realpath(sysconfig.get_paths()[key]) for key in ("stdlib", "purelib", "platlib")})
+
+_installed = False
+_opaque_types = ()
+segments = []
+
+
+class _Hasher:
+    # Streams a canonical encoding of an object graph into blake2b. Objects
+    # seen twice are written as back-references, which keeps cycles finite
+    # and the encoding independent of memory addresses.
+    def __init__(self):
+        self.digest = hashlib.blake2b(digest_size=20)
+        self.seen = {}
+
+    def write(self, *parts):
+        for part in parts:
+            self.digest.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+            self.digest.update(b"\0")
+
+    def hexdigest(self):
+        return self.digest.hexdigest()
+
+    def feed(self, obj):
+        if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+            self.write(type(obj).__name__, repr(obj))
+            return
+        if isinstance(obj, np.generic):
+            self.write("np", obj.dtype.str, obj.tobytes())
+            return
+        if isinstance(obj, np.ndarray):
+            array = np.ascontiguousarray(obj)
+            if array.dtype == object:
+                self.write("ndarray-object", array.shape)
+                for item in array.ravel():
+                    self.feed(item)
+            else:
+                self.write("ndarray", array.dtype.str, array.shape, array.tobytes())
+            return
+        if isinstance(obj, (type, types.ModuleType)):
+            self.write("name", getattr(obj, "__module__", ""), getattr(obj, "__qualname__", obj.__name__))
+            return
+
+        key = id(obj)
+        if key in self.seen:
+            self.write("ref", self.seen[key][0])
+            return
+        # Holding obj keeps temporaries alive so their ids can't be reused mid-hash
+        self.seen[key] = (len(self.seen), obj)
+
+        if isinstance(obj, _opaque_types):
+            # Scene/renderer/camera/file writer reached through a closure or bound method
+            self.write("opaque", type(obj).__qualname__)
+        elif isinstance(obj, (list, tuple)):
+            self.write(type(obj).__name__, len(obj))
+            for item in obj:
+                self.feed(item)
+        elif isinstance(obj, dict):
+            self.write("dict", len(obj))
+            for k, v in obj.items():
+                if k in SKIP_KEYS:
+                    continue
+                self.feed(k)
+                self.feed(v)
+        elif isinstance(obj, (set, frozenset)):
+            # No stable order, so hash each member on its own and sort
+            self.write("set", *sorted(_digest(item) for item in obj))
+        elif isinstance(obj, functools.partial):
+            self.write("partial")
+            self.feed(obj.func)
+            self.feed(obj.args)
+            self.feed(obj.keywords)
+        elif isinstance(obj, types.MethodType):
+            self.write("method")
+            self.feed(obj.__func__)
+            self.feed(obj.__self__)
+        elif isinstance(obj, types.FunctionType):
+            self.write("function", obj.__module__, obj.__qualname__)
+            self.feed_code(obj.__code__)
+            self.feed(obj.__defaults__)
+            self.feed([cell.cell_contents if _cell_filled(cell) else None for cell in obj.__closure__ or ()])
+            # Module-level values the code reads (constants an updater uses, say)
+            if not _is_library(obj.__globals__):
+                names = sorted(name for name in _global_names(obj.__code__) if name in obj.__globals__)
+                self.feed({name: obj.__globals__[name] for name in names})
+        elif isinstance(obj, types.BuiltinFunctionType):
+            self.write("builtin", getattr(obj, "__module__", ""), obj.__qualname__)
+        elif isinstance(obj, types.CodeType):
+            self.feed_code(obj)
+        elif hasattr(obj, "__dict__") or hasattr(obj, "__slots__"):
+            self.write("object", type(obj).__module__, type(obj).__qualname__)
+            state = dict(getattr(obj, "__dict__", {}))
+            for slot in getattr(type(obj), "__slots__", ()):
+                if hasattr(obj, slot):
+                    state[slot] = getattr(obj, slot)
+            self.feed(state)
+        else:
+            self.write("repr", type(obj).__qualname__, repr(obj))
+
+    def feed_code(self, code):
+        self.write("code", code.co_code, code.co_names)
+        for const in code.co_consts:
+            self.feed(const)
+
+
+def _cell_filled(cell):
+    try:
+        cell.cell_contents
+    except ValueError:
+        return False
+    return True
+
+
+def _global_names(code):
+    # Names a code object and the functions nested in it may load as globals
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def _is_library(module_globals):
+    path = module_globals.get("__file__")
+    return path is None or os.path.realpath(path).startswith(LIBRARY_PATHS)
+
+
+def _digest(obj):
+    hasher = _Hasher()
+    hasher.feed(obj)
+    return hasher.hexdigest()
+
+
+def camera_state(camera):
+    # Settings and trackers only; pixel buffers are derived from the mobjects
+    state = {k: v for k, v in vars(camera).items() if k not in SKIP_KEYS}
+    state["__class__"] = type(camera).__qualname__
+    return state
+
+
+def segment_hash(scene, camera, animations, mobjects):
+    hasher = _Hasher()
+    hasher.feed(camera_state(camera))
+    # Scene state before the segment, in draw order
+    hasher.feed(list(mobjects))
+    hasher.feed([getattr(scene, "duration", None)])
+    for animation in animations:
+        hasher.feed(animation)
+    return "seg_" + hasher.hexdigest()
+
+
+def get_hash_from_play_call(scene_object, camera_object, animations_list, current_mobjects_list):
+    key = segment_hash(scene_object, camera_object, animations_list, current_mobjects_list)
+    renderer = scene_object.renderer
+    file_writer = renderer.file_writer
+    reused = bool(file_writer.is_already_cached(key))
+    if reused:
+        # clean_cache() evicts by atime, which relatime mounts rarely update
+        path = file_writer.partial_movie_directory / f"{key}{file_writer.movie_file_extension}"
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    segments.append({
+        "scene": type(scene_object).__name__,
+        "index": renderer.num_plays,
+        "hash": key,
+        "reused": reused,
+        "animations": [type(a).__name__ for a in animations_list],
+        "step": getattr(scene_object, "step_index", None),
+    })
+    return key
+
+
+def stats():
+    reused = sum(segment["reused"] for segment in segments)
+    return {"reused": reused, "rendered": len(segments) - reused}
+
+
+def install():
+    global _installed, _opaque_types
+    if _installed:
+        return
+    from manim import config
+    from manim.camera.camera import Camera
+    from manim.renderer import cairo_renderer
+    from manim.scene.scene import Scene
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    _opaque_types = (Scene, cairo_renderer.CairoRenderer, SceneFileWriter, Camera)
+    cairo_renderer.get_hash_from_play_call = get_hash_from_play_call
+    # Keep enough partial movies around to cover every segment of the longest scene
+    config.max_files_cached = max(config.max_files_cached, MAX_FILES_CACHED)
+    _installed = True
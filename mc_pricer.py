@@ -0,0 +1,183 @@
+import argparse
+import time
+
+import numpy as np
+from scipy.special import ndtr
+
+from greeks import d1_d2
+from stochastic_paths import gbm_paths
+
+# Monte Carlo option pricer behind the Black-Scholes scenes.
+#   European and arithmetic-average Asian calls/puts
+#   antithetic variates (Z and -Z) and a control variate with a known mean:
+#     European -> discounted S_T (mean S0)
+#     Asian    -> the geometric-average Asian option (closed form)
+#   paths are streamed chunk_size at a time with running sums, so memory is
+#   flat at millions of paths and every chunk yields an updated estimate.
+#
+# Benchmark: python mc_pricer.py --paths 4000000
+
+Z_95 = 1.959963984540054
+
+
+def bs_price(s0, strike, rate, sigma, maturity, kind="call"):
+    # Closed-form Black-Scholes price of a European option
+    d1, d2 = d1_d2(s0, strike, rate, sigma, maturity)
+    discount = np.exp(-rate * maturity)
+    if kind == "call":
+        return s0 * ndtr(d1) - strike * discount * ndtr(d2)
+    return strike * discount * ndtr(-d2) - s0 * ndtr(-d1)
+
+
+def geometric_asian_price(s0, strike, rate, sigma, maturity, n_steps, kind="call"):
+    # Geometric average over t_i = i T / n, i = 1..n, is lognormal
+    n = n_steps
+    mean = np.log(s0) + (rate - 0.5 * sigma**2) * maturity * (n + 1) / (2 * n)
+    var = sigma**2 * maturity * (n + 1) * (2 * n + 1) / (6 * n**2)
+    d1 = (mean - np.log(strike) + var) / np.sqrt(var)
+    d2 = d1 - np.sqrt(var)
+    discount = np.exp(-rate * maturity)
+    forward = np.exp(mean + 0.5 * var)
+    if kind == "call":
+        return discount * (forward * ndtr(d1) - strike * ndtr(d2))
+    return discount * (strike * ndtr(-d2) - forward * ndtr(-d1))
+
+
+class Estimate:
+    def __init__(self, paths, price, stderr):
+        self.paths = paths
+        self.price = price
+        self.stderr = stderr
+        self.ci_low = price - Z_95 * stderr
+        self.ci_high = price + Z_95 * stderr
+
+    def __repr__(self):
+        return f"Estimate(paths={self.paths}, price={self.price:.5f} +/- {Z_95 * self.stderr:.5f})"
+
+
+class MonteCarloPricer:
+    def __init__(self, s0, strike, rate, sigma, maturity, kind="call", style="european", n_steps=None,
+                 chunk_size=65536, antithetic=True, control_variate=True, seed=0):
+        if style not in ("european", "asian"):
+            raise ValueError(f"Unknown option style {style!r}")
+        self.s0 = s0
+        self.strike = strike
+        self.rate = rate
+        self.sigma = sigma
+        self.maturity = maturity
+        self.kind = kind
+        self.style = style
+        # European payoffs only need S_T, which GBM gives exactly in one step
+        self.n_steps = n_steps or (1 if style == "european" else 64)
+        self.chunk_size = chunk_size + chunk_size % 2
+        self.antithetic = antithetic
+        self.control_variate = control_variate
+        self.rng = np.random.default_rng(seed)
+        self.discount = np.exp(-rate * maturity)
+
+    def control_mean(self):
+        if self.style == "european":
+            return self.s0
+        return geometric_asian_price(self.s0, self.strike, self.rate, self.sigma, self.maturity,
+                                     self.n_steps, self.kind)
+
+    def reference_price(self):
+        # Closed form when there is one (European); None for Asian
+        if self.style == "european":
+            return bs_price(self.s0, self.strike, self.rate, self.sigma, self.maturity, self.kind)
+        return None
+
+    def _payoff(self, level):
+        if self.kind == "call":
+            return np.maximum(level - self.strike, 0.0)
+        return np.maximum(self.strike - level, 0.0)
+
+    def simulate(self, n_paths):
+        # Discounted payoffs Y and controls X for one chunk. With antithetic
+        # variates each returned sample is the average of a Z / -Z pair.
+        paths = gbm_paths(n_paths, self.n_steps, self.maturity / self.n_steps, self.s0, self.rate, self.sigma,
+                          seed=self.rng, antithetic=self.antithetic)[:, 1:]
+        if self.style == "european":
+            y = self.discount * self._payoff(paths[:, -1])
+            x = self.discount * paths[:, -1]
+        else:
+            y = self.discount * self._payoff(paths.mean(axis=1))
+            x = self.discount * self._payoff(np.exp(np.log(paths).mean(axis=1)))
+        if self.antithetic:
+            half = n_paths // 2
+            y = 0.5 * (y[:half] + y[half:2 * half])
+            x = 0.5 * (x[:half] + x[half:2 * half])
+        return y, x
+
+    def iter_estimates(self, n_paths):
+        # Running estimate after every chunk, from sums only (constant memory)
+        n = 0
+        sum_y = sum_x = sum_yy = sum_xx = sum_xy = 0.0
+        paths = 0
+        control_mean = self.control_mean()
+        while paths < n_paths:
+            size = min(self.chunk_size, n_paths - paths)
+            size += size % 2 if self.antithetic else 0
+            y, x = self.simulate(size)
+            paths += size
+            n += len(y)
+            sum_y += y.sum()
+            sum_yy += y @ y
+            if self.control_variate:
+                sum_x += x.sum()
+                sum_xx += x @ x
+                sum_xy += x @ y
+
+            mean_y = sum_y / n
+            var_y = max(sum_yy / n - mean_y**2, 0.0)
+            if self.control_variate and n > 1:
+                mean_x = sum_x / n
+                var_x = sum_xx / n - mean_x**2
+                cov = sum_xy / n - mean_x * mean_y
+                beta = cov / var_x if var_x > 0 else 0.0
+                price = mean_y - beta * (mean_x - control_mean)
+                variance = max(var_y - beta * cov, 0.0)
+            else:
+                price, variance = mean_y, var_y
+            yield Estimate(paths, price, np.sqrt(variance / max(n - 1, 1)))
+
+    def price(self, n_paths):
+        estimate = None
+        for estimate in self.iter_estimates(n_paths):
+            pass
+        return estimate
+
+
+def benchmark(n_paths, style="european", chunk_size=65536, n_steps=None):
+    rows = []
+    for label, antithetic, control in [
+        ("plain", False, False),
+        ("antithetic", True, False),
+        ("antithetic + control", True, True),
+    ]:
+        pricer = MonteCarloPricer(100.0, 100.0, 0.05, 0.2, 1.0, style=style, n_steps=n_steps,
+                                  chunk_size=chunk_size, antithetic=antithetic, control_variate=control)
+        start = time.perf_counter()
+        estimate = pricer.price(n_paths)
+        elapsed = time.perf_counter() - start
+        rows.append((label, estimate, elapsed))
+
+    reference = MonteCarloPricer(100.0, 100.0, 0.05, 0.2, 1.0, style=style).reference_price()
+    print(f"{style} call, S0=K=100, r=5%, sigma=20%, T=1, {n_paths:,} paths"
+          + (f", Black-Scholes {reference:.5f}" if reference is not None else ""))
+    base_var = rows[0][1].stderr**2
+    for label, estimate, elapsed in rows:
+        reduction = base_var / estimate.stderr**2 if estimate.stderr > 0 else float("inf")
+        print(f"  {label:<22} {estimate.price:9.5f} +/- {Z_95 * estimate.stderr:.5f}  "
+              f"{n_paths / elapsed:>12,.0f} paths/s  variance / {reduction:,.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo pricer throughput benchmark")
+    parser.add_argument("--paths", type=int, default=4_000_000)
+    parser.add_argument("--chunk", type=int, default=65536)
+    parser.add_argument("--style", choices=["european", "asian", "both"], default="both")
+    parser.add_argument("--steps", type=int, default=None, help="monitoring dates for Asian options")
+    args = parser.parse_args()
+    for style in (["european", "asian"] if args.style == "both" else [args.style]):
+        benchmark(args.paths, style, args.chunk, args.steps)
@@ -1,12 +1,15 @@
 from manim import *
 
-class PartialFractionsTikTok(Scene):
-    def construct(self):
-        # Title and watermark (persistent)
-        title = Text("Partial Fractions", font_size=48, color=BLUE).to_edge(UP)
-        watermark = Text("@calc4dumb", font_size=24, color=GREY).next_to(title, DOWN, buff=0.1)
-        self.add(title, watermark)
+from step_scene import Step, StepSequenceScene
 
+class PartialFractionsTikTok(StepSequenceScene):
+    title_text = "Partial Fractions"
+    step_font_size = 40
+    label_font_size = 24
+    label_buff = 0.4
+    label_fade_time = 0.5
+
+    def construct_visual(self):
         # Smaller graph on bottom left
         axes = Axes(
             x_range=[-1, 4, 1],
@@ -36,57 +39,28 @@ class PartialFractionsTikTok(Scene):
         
         self.play(Create(graph1), Create(graph2), Create(asymptote1), Create(asymptote2))
 
-        # Steps to show, centered below watermark/title
-        steps = [
-            r"\int \frac{2x+1}{x^2-1} dx",
-            r"\frac{2x+1}{(x-1)(x+1)} = \frac{A}{x-1} + \frac{B}{x+1}",
-            r"2x+1 = A(x+1) + B(x-1)",
-            r"x=1: 3 = 2A \Rightarrow A = \frac{3}{2}",
-            r"x=-1: -1 = -2B \Rightarrow B = \frac{1}{2}",
-            r"\int \left(\frac{3/2}{x-1} + \frac{1/2}{x+1}\right) dx",
-            r"= \frac{3}{2}\ln|x-1| + \frac{1}{2}\ln|x+1| + C",
-        ]
-        
-        step_labels = [
-            "",
-            "Step 1: Set up partial fractions",
-            "Step 2: Clear denominators", 
-            "Step 3: Solve for A",
-            "Step 4: Solve for B",
-            "Step 5: Integrate each term",
-            "Step 6: Final answer"
+    def get_steps(self):
+        # Steps to show, centered below watermark/title, with faster timing
+        return [
+            Step(r"\int \frac{2x+1}{x^2-1} dx", color=BLUE, hold=0.8),
+            Step(r"\frac{2x+1}{(x-1)(x+1)} = \frac{A}{x-1} + \frac{B}{x+1}",
+                 label="Step 1: Set up partial fractions", run_time=0.8, hold=1.2),
+            Step(r"2x+1 = A(x+1) + B(x-1)", label="Step 2: Clear denominators", run_time=0.8, hold=1.2),
+            Step(r"x=1: 3 = 2A \Rightarrow A = \frac{3}{2}", label="Step 3: Solve for A", run_time=0.8, hold=1.2),
+            Step(r"x=-1: -1 = -2B \Rightarrow B = \frac{1}{2}", label="Step 4: Solve for B", run_time=0.8, hold=1.2),
+            Step(r"\int \left(\frac{3/2}{x-1} + \frac{1/2}{x+1}\right) dx",
+                 label="Step 5: Integrate each term", run_time=0.8, hold=1.2),
+            Step(r"= \frac{3}{2}\ln|x-1| + \frac{1}{2}\ln|x+1| + C", color=GREEN,
+                 label="Step 6: Final answer", run_time=0.8, hold=1.2),
         ]
 
-        # Create first step centered below watermark/title
-        step_text = MathTex(steps[0], font_size=40, color=BLUE).next_to(watermark, DOWN, buff=1)
-        self.play(Write(step_text))
-        self.wait(0.8)
-
-        # Iterate through remaining steps with faster timing
-        for i in range(1, len(steps)):
-            new_color = GREEN if i == len(steps) - 1 else WHITE
-                
-            # Show the actual step
-            new_step = MathTex(steps[i], font_size=40, color=new_color).next_to(watermark, DOWN, buff=1)
-            
-            # Show step label below the math if it exists
-            if step_labels[i]:
-                label = Text(step_labels[i], font_size=24, color=ORANGE).next_to(new_step, DOWN, buff=0.4)
-                self.play(Transform(step_text, new_step), Write(label), run_time=0.8)
-                self.wait(1.2)
-                # Remove the label before next step
-                if i < len(steps) - 1:
-                    self.play(FadeOut(label), run_time=0.5)
-            else:
-                self.play(Transform(step_text, new_step), run_time=0.8)
-                self.wait(1.2)
-
+    def construct_finale(self):
         # Highlight final answer with box
-        box = SurroundingRectangle(step_text, color=GREEN, buff=0.3)
+        box = SurroundingRectangle(self.step_text, color=GREEN, buff=0.3)
         self.play(Create(box), run_time=0.6)
         self.wait(0.5)
 
         # End text moved a bit up from bottom
         end_text = Text("Partial fractions solved!", font_size=36, color=GREEN).to_edge(DOWN).shift(UP * 0.4)
         self.play(Write(end_text), run_time=0.8)
-        self.wait(1)
\ No newline at end of file
+        self.wait(1)
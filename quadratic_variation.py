@@ -0,0 +1,94 @@
+import argparse
+import time
+
+import numpy as np
+
+# Quadratic variation of one Brownian path over nested partitions of [0, t]:
+#   QV_j = sum over the 2^j increments of width t / 2^j of (dW)^2  ->  t
+# The path is drawn once on the finest mesh (2^max_level increments, 10^8
+# and up) chunk_size increments at a time. Within a chunk the coarser
+# levels come from pairwise sums of the finer increments; levels whose
+# increments span several chunks carry a running partial increment, so
+# memory is O(chunk_size) however fine the mesh.
+#
+# Benchmark: python quadratic_variation.py --level 27
+
+
+class QuadraticVariation:
+    def __init__(self, t=1.0, max_level=27, chunk_size=2**20, sigma=1.0, seed=0, dtype=np.float64):
+        if chunk_size & (chunk_size - 1):
+            raise ValueError(f"chunk_size must be a power of two, got {chunk_size}")
+        self.t = t
+        self.max_level = max_level
+        self.n_increments = 2**max_level
+        self.chunk_size = min(chunk_size, self.n_increments)
+        self.chunk_level = self.chunk_size.bit_length() - 1  # increments per chunk = 2^chunk_level
+        self.sigma = sigma
+        self.rng = np.random.default_rng(seed)
+        self.dtype = dtype
+        # Levels 0..max_level; sums[j] is QV over 2^j increments
+        self.levels = np.arange(max_level + 1)
+        self.sums = np.zeros(max_level + 1)
+        self.processed = 0
+        self._pending = np.zeros(max_level + 1)
+
+    def mesh(self):
+        # Increment width at each level
+        return self.t / 2.0**self.levels
+
+    def iter_chunks(self):
+        # Consume the path chunk by chunk; yields (increments done, time covered,
+        # finest-level running sum) after each one, for live counters
+        scale = self.sigma * np.sqrt(self.t / self.n_increments)
+        n_chunks = self.n_increments // self.chunk_size
+        for index in range(1, n_chunks + 1):
+            increments = scale * self.rng.standard_normal(self.chunk_size, dtype=self.dtype)
+
+            # Fine levels: all their increments lie inside this chunk
+            level_increments = increments
+            for level in range(self.max_level, self.max_level - self.chunk_level - 1, -1):
+                self.sums[level] += float(np.dot(level_increments, level_increments))
+                if len(level_increments) > 1:
+                    level_increments = level_increments.reshape(-1, 2).sum(axis=1)
+
+            # Coarse levels: one increment spans 2^(coarse gap) chunks
+            total = float(level_increments[0])
+            for level in range(self.max_level - self.chunk_level - 1, -1, -1):
+                self._pending[level] += total
+                chunks_per_increment = 2 ** (self.max_level - self.chunk_level - level)
+                if index % chunks_per_increment == 0:
+                    self.sums[level] += self._pending[level] ** 2
+                    self._pending[level] = 0.0
+
+            self.processed = index * self.chunk_size
+            yield self.processed, self.t * index / n_chunks, self.sums[self.max_level]
+
+    def run(self):
+        for _ in self.iter_chunks():
+            pass
+        return self.sums
+
+    def expected_spread(self):
+        # Standard deviation of QV_j around t: t sqrt(2 / 2^j)
+        return self.t * np.sqrt(2.0 / 2.0**self.levels)
+
+
+def benchmark(level, chunk_sizes, seed=0):
+    n = 2**level
+    print(f"quadratic variation of one path, {n:,} finest increments ({level + 1} nested levels)")
+    for dtype in (np.float64, np.float32):
+        for chunk_size in chunk_sizes:
+            qv = QuadraticVariation(1.0, level, chunk_size, seed=seed, dtype=dtype)
+            start = time.perf_counter()
+            sums = qv.run()
+            elapsed = time.perf_counter() - start
+            print(f"  {np.dtype(dtype).name:<8} chunk 2^{qv.chunk_level:<3} {n / elapsed / 1e6:8.1f} M increments/s  "
+                  f"QV finest {sums[-1]:.6f} (spread {qv.expected_spread()[-1]:.1e})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Streaming quadratic-variation throughput benchmark")
+    parser.add_argument("--level", type=int, default=27, help="finest mesh has 2^level increments")
+    parser.add_argument("--chunks", type=int, nargs="+", default=[14, 17, 20, 22], help="chunk sizes as powers of two")
+    args = parser.parse_args()
+    benchmark(args.level, [2**c for c in args.chunks])
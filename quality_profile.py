@@ -0,0 +1,93 @@
+import os
+
+# Project-wide draft/review/final switch (replaces the old per-file TESTING flags).
+# Pick one with CALC4DUMB_QUALITY=draft|review|final or
+# batch_render.py --quality-profile draft. Scenes keep their final-look
+# numbers in the code and pass them through QUALITY, e.g.
+#   resolution=QUALITY.resolution((30, 30))
+#   dx = QUALITY.cell_size(2 * PI, 12)
+#   t_vals = np.linspace(0, 4, QUALITY.samples(300))
+#   glow.set_stroke(width=QUALITY.glow_width(12))
+#   LaggedStart(..., run_time=QUALITY.lagged_time(4))
+
+DEFAULT_PROFILE = "final"
+
+
+class QualityProfile:
+    def __init__(self, name, manim_quality, frame_rate, resolution_scale=1.0, cell_scale=1.0,
+                 sample_scale=1.0, glow=True, box_detail=True, lagged_time_scale=1.0):
+        self.name = name
+        self.manim_quality = manim_quality
+        self.frame_rate = frame_rate
+        self.resolution_scale = resolution_scale
+        self.cell_scale = cell_scale
+        self.sample_scale = sample_scale
+        self.glow = glow
+        self.box_detail = box_detail  # outlines + translucency on box grids
+        self.lagged_time_scale = lagged_time_scale
+
+    def resolution(self, final):
+        # Surface (u, v) resolution
+        if isinstance(final, int):
+            return max(4, round(final * self.resolution_scale))
+        return tuple(max(4, round(n * self.resolution_scale)) for n in final)
+
+    def cell_count(self, final):
+        return max(2, round(final * self.cell_scale))
+
+    def cell_size(self, span, final_count):
+        # Riemann / box spacing that still tiles the span exactly
+        return span / self.cell_count(final_count)
+
+    def samples(self, final):
+        # Points on random paths and sampled curves
+        return max(16, round(final * self.sample_scale))
+
+    def glow_width(self, width):
+        # Glow layers are just wide translucent strokes; width 0 skips the stroke entirely
+        return width if self.glow else 0
+
+    def lagged_time(self, run_time):
+        return run_time * self.lagged_time_scale
+
+    def apply_config(self, config=None):
+        if config is None:
+            from manim import config
+        config.quality = self.manim_quality
+        config.frame_rate = self.frame_rate
+
+
+PROFILES = {
+    "draft": QualityProfile(
+        "draft", "low_quality", 15,
+        resolution_scale=1 / 3, cell_scale=2 / 3, sample_scale=0.25,
+        glow=False, box_detail=False, lagged_time_scale=0.25,
+    ),
+    "review": QualityProfile(
+        "review", "medium_quality", 30,
+        resolution_scale=0.5, sample_scale=0.5,
+    ),
+    "final": QualityProfile("final", "high_quality", 60),
+}
+
+
+def get_profile(name=None):
+    name = (name or os.environ.get("CALC4DUMB_QUALITY") or DEFAULT_PROFILE).lower()
+    if name not in PROFILES:
+        raise ValueError(f"Unknown quality profile {name!r}, expected one of {', '.join(PROFILES)}")
+    return PROFILES[name]
+
+
+QUALITY = get_profile()
+
+# Only touch manim's resolution/frame rate when a profile was asked for,
+# so plain `manim -qh` renders keep their command line settings
+if os.environ.get("CALC4DUMB_QUALITY"):
+    QUALITY.apply_config()
+
+# Scenes run straight through `manim` (not batch_render.py) still honour
+# CALC4DUMB_PROFILE; the profiler pulls in manim, so only import it when asked
+if os.environ.get("CALC4DUMB_PROFILE", "").lower() not in ("", "0", "false", "no"):
+    import render_profile
+
+    render_profile.install_from_env()
@@ -1,13 +1,13 @@
 from manim import *
 import numpy as np
 
-class RelatedRatesTikTok(Scene):
-    def construct(self):
-        # Title and watermark (persistent)
-        title = Text("Related Rates: Balloon Problem", font_size=48, color=BLUE).to_edge(UP)
-        watermark = Text("@calc4dumb", font_size=24, color=GREY).next_to(title, DOWN, buff=0.1)
-        self.add(title, watermark)
+from step_scene import Step, StepSequenceScene
 
+class RelatedRatesTikTok(StepSequenceScene):
+    title_text = "Related Rates: Balloon Problem"
+    step_font_size = 38
+
+    def construct_visual(self):
         # Create animated balloon on bottom left (moved lower)
         balloon_center = LEFT * 3 + DOWN * 2
         balloon = Circle(radius=1, color=RED, fill_opacity=0.3, stroke_width=4)
@@ -36,79 +36,68 @@ class RelatedRatesTikTok(Scene):
         self.play(Write(problem_label), Write(question_label))
         self.wait(0.7)
 
-        # Steps to show, centered below watermark/title
-        steps = [
-            r"\text{Given: } \frac{dV}{dt} = 3 \text{ cm}^3\text{/s}",
-            r"\text{Find: } \frac{dr}{dt} \text{ when } r = 5 \text{ cm}",
-            r"V = \frac{4}{3}\pi r^3",
-            r"\frac{dV}{dt} = \frac{d}{dt}\left(\frac{4}{3}\pi r^3\right)",
-            r"\frac{dV}{dt} = \frac{4}{3}\pi \cdot 3r^2 \cdot \frac{dr}{dt}",
-            r"3 = 4\pi r^2 \cdot \frac{dr}{dt}",
-            r"\frac{dr}{dt} = \frac{3}{4\pi r^2}",
-            r"\frac{dr}{dt} = \frac{3}{4\pi (5)^2} = \frac{3}{100\pi} \text{ cm/s}",
-        ]
+        # Kept for the step hooks
+        self.balloon = balloon
+        self.air_particles = air_particles
 
-        # Create first step centered below watermark/title
-        step_text = MathTex(steps[0], font_size=38, color=BLUE).next_to(watermark, DOWN, buff=1)
-        self.play(Write(step_text))
-        self.wait(0.7)
+    def pulse_balloon(self):
+        # Volume formula - expand balloon
+        self.play(
+            self.balloon.animate.scale(1.3),
+            self.air_particles.animate.scale(1.3),
+            run_time=0.8
+        )
+        self.play(
+            self.balloon.animate.scale(1/1.3),
+            self.air_particles.animate.scale(1/1.3),
+            run_time=0.5
+        )
 
-        # Iterate through remaining steps
-        for i in range(1, len(steps)):
-            # Final answer gets special color
-            new_color = GREEN if i == len(steps) - 1 else WHITE
+    def show_chain_rule(self):
+        # Add arrows showing the chain rule (positioned to not block text)
+        chain_arrow1 = Arrow(
+            self.step_text.get_center() + DOWN * 0.8 + LEFT * 1,
+            self.step_text.get_center() + DOWN * 0.8 + RIGHT * 1,
+            color=ORANGE,
+            stroke_width=3,
+            max_tip_length_to_length_ratio=0.3
+        )
+        chain_label = Text("Chain Rule!", font_size=20, color=ORANGE).next_to(chain_arrow1, DOWN, buff=0.1)
 
-            new_step = MathTex(steps[i], font_size=38, color=new_color).next_to(watermark, DOWN, buff=1)
-            self.play(Transform(step_text, new_step))
-            
-            # Special animations for key steps
-            if i == 2:  # Volume formula - expand balloon
-                self.play(
-                    balloon.animate.scale(1.3),
-                    air_particles.animate.scale(1.3),
-                    run_time=0.8
-                )
-                self.play(
-                    balloon.animate.scale(1/1.3),
-                    air_particles.animate.scale(1/1.3),
-                    run_time=0.5
-                )
-                self.wait(0.8)
-            elif i == 3:  # Taking derivative - show chain rule concept
-                # Add arrows showing the chain rule (positioned to not block text)
-                chain_arrow1 = Arrow(
-                    step_text.get_center() + DOWN * 0.8 + LEFT * 1,
-                    step_text.get_center() + DOWN * 0.8 + RIGHT * 1,
-                    color=ORANGE,
-                    stroke_width=3,
-                    max_tip_length_to_length_ratio=0.3
-                )
-                chain_label = Text("Chain Rule!", font_size=20, color=ORANGE).next_to(chain_arrow1, DOWN, buff=0.1)
-                
-                self.play(Create(chain_arrow1), Write(chain_label))
-                self.wait(0.8)
-                self.play(FadeOut(chain_arrow1), FadeOut(chain_label))
-            elif i == 4:  # Chain rule result - animate differentiation
-                self.wait(1.2)
-            elif i == 5:  # Substitute known values
-                # Highlight the substitution
-                self.play(step_text.animate.set_color(YELLOW))
-                self.wait(0.8)
-                self.play(step_text.animate.set_color(WHITE))
-            elif i == 6:  # Solve for dr/dt
-                # Show solving step
-                solve_arrow = Arrow(UP * 0.5, DOWN * 0.5, color=PURPLE).next_to(step_text, RIGHT)
-                solve_label = Text("Solve!", font_size=18, color=PURPLE).next_to(solve_arrow, RIGHT)
-                self.play(Create(solve_arrow), Write(solve_label))
-                self.wait(0.8)
-                self.play(FadeOut(solve_arrow), FadeOut(solve_label))
-            elif i == len(steps) - 1:  # Final answer
-                self.wait(1)
-            else:
-                self.wait(1)
+        self.play(Create(chain_arrow1), Write(chain_label))
+        self.wait(0.8)
+        self.play(FadeOut(chain_arrow1), FadeOut(chain_label))
+
+    def highlight_substitution(self):
+        # Highlight the substitution
+        self.play(self.step_text.animate.set_color(YELLOW))
+        self.wait(0.8)
+        self.play(self.step_text.animate.set_color(WHITE))
 
+    def show_solve(self):
+        # Show solving step
+        solve_arrow = Arrow(UP * 0.5, DOWN * 0.5, color=PURPLE).next_to(self.step_text, RIGHT)
+        solve_label = Text("Solve!", font_size=18, color=PURPLE).next_to(solve_arrow, RIGHT)
+        self.play(Create(solve_arrow), Write(solve_label))
+        self.wait(0.8)
+        self.play(FadeOut(solve_arrow), FadeOut(solve_label))
+
+    def get_steps(self):
+        # Steps to show, centered below watermark/title
+        return [
+            Step(r"\text{Given: } \frac{dV}{dt} = 3 \text{ cm}^3\text{/s}", color=BLUE, hold=0.7),
+            Step(r"\text{Find: } \frac{dr}{dt} \text{ when } r = 5 \text{ cm}", hold=1),
+            Step(r"V = \frac{4}{3}\pi r^3", hook=self.pulse_balloon, hold=0.8),
+            Step(r"\frac{dV}{dt} = \frac{d}{dt}\left(\frac{4}{3}\pi r^3\right)", hook=self.show_chain_rule, hold=0),
+            Step(r"\frac{dV}{dt} = \frac{4}{3}\pi \cdot 3r^2 \cdot \frac{dr}{dt}", hold=1.2),
+            Step(r"3 = 4\pi r^2 \cdot \frac{dr}{dt}", hook=self.highlight_substitution, hold=0),
+            Step(r"\frac{dr}{dt} = \frac{3}{4\pi r^2}", hook=self.show_solve, hold=0),
+            Step(r"\frac{dr}{dt} = \frac{3}{4\pi (5)^2} = \frac{3}{100\pi} \text{ cm/s}", color=GREEN, hold=1),
+        ]
+
+    def construct_finale(self):
         # Highlight final answer with animated box
-        box = SurroundingRectangle(step_text, color=GREEN, buff=0.3)
+        box = SurroundingRectangle(self.step_text, color=GREEN, buff=0.3)
         self.play(Create(box))
         self.wait(0.3)
 
@@ -116,5 +105,3 @@ class RelatedRatesTikTok(Scene):
         end_text = Text("Radius growing at 3/(100π) cm/s!", font_size=36, color=GREEN).to_edge(DOWN).shift(UP * 0.7)
         self.play(Write(end_text))
         self.wait(0.8)
-
-       
\ No newline at end of file
@@ -0,0 +1,201 @@
+import functools
+import json
+import os
+import time
+from pathlib import Path
+
+# Opt-in per-call render profiler. Set CALC4DUMB_PROFILE=1 (or pass
+# --profile to batch_render.py) and each rendered scene writes
+#   <media_dir>/profiles/<Scene>.trace.json  (chrome://tracing / Perfetto)
+#   <media_dir>/profiles/<Scene>.folded      (flamegraph.pl / speedscope)
+#
+# Each play()/wait()/add() call is one event. Its time is split into
+#   build        constructing mobjects/TeX in construct() before the call
+#   setup        compiling and beginning the animations
+#   interpolate  updating mobjects for each frame
+#   render       rasterizing frames
+#   encode       piping frames to ffmpeg and closing partial movies
+#   other        whatever is left (hashing, cache lookups, ...)
+# and tagged with the scene's step_index when it has one (StepSequenceScene).
+#
+# The hooks go in when something calls install_from_env(): batch_render.py
+# does for every scene, and step_scene / quality_profile do on import, so a
+# plain `manim -qm foo.py Scene` is profiled when foo.py uses either. A scene
+# file that imports neither needs batch_render.py.
+
+PHASES = ("build", "setup", "interpolate", "render", "encode", "other")
+
+_profiler = None
+_installed = False
+
+
+class SceneProfiler:
+    def __init__(self, scene):
+        self.scene = scene
+        self.scene_name = type(scene).__name__
+        self.events = []
+        self.current = None
+        self.origin = time.perf_counter()
+        self.last_end = self.origin
+
+    def begin(self, kind, label=""):
+        now = time.perf_counter()
+        self.current = {
+            "kind": kind,
+            "index": len(self.events),
+            "label": label,
+            "step": getattr(self.scene, "step_index", None),
+            "start": now,
+            "frames": 0,
+            **{phase: 0.0 for phase in PHASES},
+        }
+        self.current["build"] = now - self.last_end
+
+    def end(self, label=None):
+        event = self.current
+        now = time.perf_counter()
+        event["duration"] = now - event["start"]
+        if label:
+            event["label"] = label
+        timed = sum(event[phase] for phase in PHASES if phase not in ("build", "other"))
+        event["other"] = max(event["duration"] - timed, 0.0)
+        self.events.append(event)
+        self.current = None
+        self.last_end = now
+
+    def charge(self, phase, seconds, frames=0):
+        if self.current is not None:
+            self.current[phase] += seconds
+            self.current["frames"] += frames
+
+    def _name(self, event):
+        name = f"{event['kind']} #{event['index']}"
+        if event["step"] is not None:
+            name += f" [step {event['step']}]"
+        if event["label"]:
+            name += f" {event['label']}"
+        return name
+
+    def trace(self):
+        us = 1e6
+        events = []
+        for event in self.events:
+            start = (event["start"] - self.origin) * us
+            name = self._name(event)
+            if event["build"] > 0:
+                events.append({"name": "build", "cat": "build", "ph": "X", "pid": 1, "tid": 1,
+                               "ts": start - event["build"] * us, "dur": event["build"] * us,
+                               "args": {"before": name}})
+            events.append({"name": name, "cat": event["kind"], "ph": "X", "pid": 1, "tid": 1,
+                           "ts": start, "dur": event["duration"] * us,
+                           "args": {"step": event["step"], "frames": event["frames"],
+                                    **{phase: round(event[phase], 6) for phase in PHASES}}})
+            # Phases interleave frame by frame; lay their totals out back to back
+            offset = start
+            for phase in PHASES[1:]:
+                if event[phase] > 0:
+                    events.append({"name": phase, "cat": phase, "ph": "X", "pid": 1, "tid": 1,
+                                   "ts": offset, "dur": event[phase] * us})
+                    offset += event[phase] * us
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"scene": self.scene_name}}
+
+    def folded(self):
+        lines = []
+        for event in self.events:
+            frame = self._name(event).replace(";", ",")
+            for phase in PHASES:
+                micros = int(round(event[phase] * 1e6))
+                if micros > 0:
+                    lines.append(f"{self.scene_name};{frame};{phase} {micros}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, output_dir):
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        trace_file = output_dir / f"{self.scene_name}.trace.json"
+        trace_file.write_text(json.dumps(self.trace()), encoding="utf-8")
+        (output_dir / f"{self.scene_name}.folded").write_text(self.folded(), encoding="utf-8")
+        return trace_file
+
+
+def _wrap_call(kind):
+    # play/wait/add become events; nested calls (wait -> play) stay inside the outer one
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = _profiler
+            if profiler is None or profiler.current is not None:
+                return method(self, *args, **kwargs)
+            profiler.begin(kind)
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                animations = getattr(self, "animations", None) if kind == "play" else None
+                label = ", ".join(type(a).__name__ for a in animations or [])
+                profiler.end(label)
+        return wrapper
+    return decorator
+
+
+def _wrap_phase(phase, counts_frames=False):
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return method(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                _profiler.charge(phase, time.perf_counter() - start, 1 if counts_frames else 0)
+        return wrapper
+    return decorator
+
+
+def output_dir():
+    from manim import config
+
+    return Path(os.environ.get("CALC4DUMB_PROFILE_DIR") or Path(config.media_dir) / "profiles")
+
+
+def install():
+    global _installed
+    if _installed:
+        return
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene import Scene
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    original_render = Scene.render
+
+    @functools.wraps(original_render)
+    def render(self, *args, **kwargs):
+        global _profiler
+        _profiler = SceneProfiler(self)
+        try:
+            return original_render(self, *args, **kwargs)
+        finally:
+            profiler, _profiler = _profiler, None
+            profiler.write(output_dir())
+
+    Scene.render = render
+    Scene.play = _wrap_call("play")(Scene.play)
+    Scene.wait = _wrap_call("wait")(Scene.wait)
+    Scene.add = _wrap_call("add")(Scene.add)
+    CairoRenderer.scene_finished = _wrap_call("finish")(CairoRenderer.scene_finished)
+
+    Scene.compile_animation_data = _wrap_phase("setup")(Scene.compile_animation_data)
+    Scene.begin_animations = _wrap_phase("setup")(Scene.begin_animations)
+    Scene.update_to_time = _wrap_phase("interpolate")(Scene.update_to_time)
+    CairoRenderer.update_frame = _wrap_phase("render")(CairoRenderer.update_frame)
+    SceneFileWriter.write_frame = _wrap_phase("encode", counts_frames=True)(SceneFileWriter.write_frame)
+    SceneFileWriter.end_animation = _wrap_phase("encode")(SceneFileWriter.end_animation)
+    SceneFileWriter.combine_to_movie = _wrap_phase("encode")(SceneFileWriter.combine_to_movie)
+    _installed = True
+
+
+def install_from_env():
+    if os.environ.get("CALC4DUMB_PROFILE", "").lower() not in ("", "0", "false", "no"):
+        install()
+        return True
+    return False
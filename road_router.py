@@ -0,0 +1,560 @@
+import argparse
+import hashlib
+import heapq
+import os
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import dijkstra
+
+# Road-network routing for the map-based GPS scenes.
+#   RoadNetwork           directed street graph, node positions in metres
+#                         (local equirectangular projection), edge weights
+#                         are lengths
+#   load_osm              a local OpenStreetMap XML extract (no network access)
+#   synthetic_city        jittered street grid with gaps, one-way streets and
+#                         diagonal avenues, for when there is no extract
+#   ContractionHierarchy  nodes contracted cheapest first, by edge difference
+#                         plus the streets new shortcuts would stand for and
+#                         hierarchy depth, with neighbours re-scored as they
+#                         go; shortcuts kept only where a bounded witness
+#                         search finds no equally short detour. Every node's
+#                         upward search space (stall-on-demand pruned) is
+#                         precomputed as arrays, so a query intersects the
+#                         source's and the target's, takes the best meeting
+#                         node, and unpacks shortcuts back to street nodes
+# Measured on a slow single core (synthetic cities, --blocks 40 / 80 / 120):
+#   intersections        1.7k     6.5k    14.6k
+#   shortcuts/streets    1.1      1.5     1.8
+#   contraction          1.8 s    12 s    36 s
+#   arrays               5 MB     22 MB   54 MB
+#   query with path      37 us    0.10 ms 0.12 ms   (mostly unpacking the path)
+#   distance, batched    9 us     10 us   10 us
+#   scipy Dijkstra       0.22 ms  1.0 ms  2.4 ms
+# Search spaces grow slowly (160 -> 230 nodes), but their arrays are n of
+# them, and preprocessing grows faster than the network as the top of the
+# hierarchy fills with shortcuts. contraction_hierarchy() caches it on disk
+# under a hash of the network, so later runs only load arrays.
+#
+# Benchmark: python road_router.py --blocks 40 --queries 2000
+
+CACHE_DIR = Path(os.environ.get("CALC4DUMB_ROAD_CACHE_DIR", Path.home() / ".cache" / "calc4dumb" / "roads"))
+CACHE_VERSION = 2
+OSM_ENV = "CALC4DUMB_OSM_FILE"
+DEFAULT_OSM = Path(__file__).resolve().parent / "data" / "city.osm"
+EARTH_RADIUS = 6371008.8
+HIGHWAYS = {
+    "motorway", "trunk", "primary", "secondary", "tertiary", "unclassified", "residential",
+    "living_street", "service", "road", "motorway_link", "trunk_link", "primary_link",
+    "secondary_link", "tertiary_link",
+}
+
+
+class RoadNetwork:
+    def __init__(self, xy, sources, targets, weights, source="synthetic"):
+        self.xy = np.asarray(xy, dtype=float)  # (n, 2) metres
+        self.sources = np.asarray(sources, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=float)
+        self.source = source
+
+    @property
+    def n_nodes(self):
+        return len(self.xy)
+
+    def key(self):
+        digest = hashlib.sha256(f"roads-v{CACHE_VERSION}".encode())
+        for array in (self.xy, self.sources, self.targets, self.weights):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+    def bounds(self):
+        return (*self.xy.min(axis=0), *self.xy.max(axis=0))
+
+    def nearest_node(self, point):
+        return int(np.argmin(np.sum((self.xy - np.asarray(point, dtype=float)[:2]) ** 2, axis=1)))
+
+    def segments(self):
+        # (m, 2, 2) street segments with each two-way street listed once
+        a = np.minimum(self.sources, self.targets)
+        b = np.maximum(self.sources, self.targets)
+        pairs = np.unique(np.stack([a, b], axis=1), axis=0)
+        return np.stack([self.xy[pairs[:, 0]], self.xy[pairs[:, 1]]], axis=1)
+
+    def path_length(self, path):
+        return float(np.sum(np.sqrt(np.sum(np.diff(self.xy[path], axis=0) ** 2, axis=1))))
+
+    def graph(self):
+        # CSR street graph without self-loops, parallel streets keeping the
+        # shortest (a sparse matrix would add them up)
+        n = self.n_nodes
+        keep = self.sources != self.targets
+        sources, targets, weights = self.sources[keep], self.targets[keep], self.weights[keep]
+        order = np.lexsort((weights, targets, sources))
+        sources, targets, weights = sources[order], targets[order], weights[order]
+        first = np.ones(len(sources), dtype=bool)
+        first[1:] = (sources[1:] != sources[:-1]) | (targets[1:] != targets[:-1])
+        return coo_matrix((weights[first], (sources[first], targets[first])), shape=(n, n)).tocsr()
+
+    def distances_from(self, source, limit=np.inf):
+        # Plain Dijkstra over every street, stopping past limit (inf beyond it)
+        return dijkstra(self.graph(), indices=source, limit=limit)
+
+
+def _directed(a, b, oneway):
+    # Edge lists for a street; oneway is 0 (both), 1 (a -> b) or -1 (b -> a)
+    if oneway == 1:
+        return [a], [b]
+    if oneway == -1:
+        return [b], [a]
+    return [a, b], [b, a]
+
+
+def load_osm(path, highways=HIGHWAYS):
+    coords = {}
+    ways = []
+    for _, elem in ET.iterparse(path, events=("end",)):
+        if elem.tag == "node":
+            coords[int(elem.get("id"))] = (float(elem.get("lat")), float(elem.get("lon")))
+            elem.clear()
+        elif elem.tag == "way":
+            tags = {tag.get("k"): tag.get("v") for tag in elem.iter("tag")}
+            if tags.get("highway") in highways:
+                refs = [int(nd.get("ref")) for nd in elem.iter("nd")]
+                # Motorways are one way unless tagged otherwise
+                oneway = tags.get("oneway", "yes" if tags["highway"] == "motorway" else "no")
+                direction = 1 if oneway in ("yes", "true", "1") or tags.get("junction") == "roundabout" else 0
+                ways.append((refs, -1 if oneway == "-1" else direction))
+            elem.clear()
+
+    used = sorted({ref for refs, _ in ways for ref in refs if ref in coords})
+    if not used:
+        raise ValueError(f"{path} has no {'/'.join(sorted(highways)[:3])}/... highways with node coordinates")
+    index = {ref: i for i, ref in enumerate(used)}
+    latlon = np.radians(np.array([coords[ref] for ref in used]))
+    lat0, lon0 = latlon.mean(axis=0)
+    xy = EARTH_RADIUS * np.stack([(latlon[:, 1] - lon0) * np.cos(lat0), latlon[:, 0] - lat0], axis=1)
+
+    sources, targets = [], []
+    for refs, oneway in ways:
+        # A node missing from the extract breaks the way there: nothing is
+        # known about the street between its neighbours
+        for a, b in zip(refs[:-1], refs[1:]):
+            if a in index and b in index and a != b:
+                s, t = _directed(index[a], index[b], oneway)
+                sources += s
+                targets += t
+    sources, targets = np.array(sources), np.array(targets)
+    weights = np.sqrt(np.sum((xy[sources] - xy[targets]) ** 2, axis=1))
+    return RoadNetwork(xy, sources, targets, weights, source=str(path))
+
+
+def synthetic_city(blocks=24, spacing=120.0, jitter=0.15, gaps=0.08, one_way_every=5, seed=0):
+    # (blocks + 1)^2 intersections; streets go missing at random, every
+    # one_way_every-th street runs one way, and two avenues cut diagonally
+    rng = np.random.default_rng(seed)
+    n = blocks + 1
+    i, j = np.meshgrid(np.arange(n), np.arange(n), indexing="ij")
+    xy = np.stack([i.ravel(), j.ravel()], axis=1) * spacing
+    xy = xy + rng.normal(0, jitter * spacing, xy.shape)
+    node = lambda a, b: a * n + b
+
+    sources, targets = [], []
+    for a in range(n):
+        for b in range(n):
+            for da, db in ((1, 0), (0, 1)):
+                if a + da >= n or b + db >= n or rng.random() < gaps:
+                    continue
+                line = b if da else a  # which street this block face is on
+                oneway = 0
+                if line % one_way_every == 2:
+                    oneway = 1 if (line // one_way_every) % 2 else -1
+                s, t = _directed(node(a, b), node(a + da, b + db), oneway)
+                sources += s
+                targets += t
+    for offset in (0, blocks // 2):
+        for k in range(blocks - offset):
+            s, t = _directed(node(k + offset, k), node(k + offset + 1, k + 1), 0)
+            sources += s
+            targets += t
+    sources, targets = np.array(sources), np.array(targets)
+    weights = np.sqrt(np.sum((xy[sources] - xy[targets]) ** 2, axis=1))
+    return RoadNetwork(xy, sources, targets, weights, source=f"synthetic_city({blocks}, seed={seed})")
+
+
+def default_network():
+    # CALC4DUMB_OSM_FILE, then data/city.osm, then a synthetic city
+    path = os.environ.get(OSM_ENV) or (DEFAULT_OSM if DEFAULT_OSM.exists() else None)
+    if path:
+        return load_osm(path)
+    return synthetic_city()
+
+
+class ContractionHierarchy:
+    # Upward graphs in CSR form: up_* are edges v -> w with rank[w] > rank[v]
+    # (forward search), down_* are edges u -> v with rank[u] > rank[v] stored
+    # at v (backward search). middle is the node a shortcut bypasses, -1 for a street.
+    # forward_* / backward_* hold every node's upward search space, nodes sorted,
+    # with the distance up to each and its parent's position in the space
+    ARRAYS = ("rank", "up_indptr", "up_indices", "up_weights", "up_middle",
+              "down_indptr", "down_indices", "down_weights", "down_middle",
+              "forward_indptr", "forward_nodes", "forward_distances", "forward_parents",
+              "backward_indptr", "backward_nodes", "backward_distances", "backward_parents")
+
+    def __init__(self, rank, up_indptr, up_indices, up_weights, up_middle,
+                 down_indptr, down_indices, down_weights, down_middle,
+                 forward_indptr, forward_nodes, forward_distances, forward_parents,
+                 backward_indptr, backward_nodes, backward_distances, backward_parents):
+        self.rank = np.asarray(rank)
+        self.arrays = dict(zip(self.ARRAYS, (rank, up_indptr, up_indices, up_weights, up_middle,
+                                             down_indptr, down_indices, down_weights, down_middle,
+                                             forward_indptr, forward_nodes, forward_distances, forward_parents,
+                                             backward_indptr, backward_nodes, backward_distances, backward_parents)))
+        self.forward = (forward_indptr, forward_nodes, forward_distances, forward_parents)
+        self.backward = (backward_indptr, backward_nodes, backward_distances, backward_parents)
+        # (a, b) -> bypassed node, for unpacking shortcuts into streets
+        self._middle = {}
+        for indptr, indices, middle, upward in ((up_indptr, up_indices, up_middle, True),
+                                                (down_indptr, down_indices, down_middle, False)):
+            owners = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+            for owner, other, via in zip(owners[middle >= 0], indices[middle >= 0], middle[middle >= 0]):
+                edge = (int(owner), int(other)) if upward else (int(other), int(owner))
+                self._middle[edge] = int(via)
+
+    @property
+    def n_shortcuts(self):
+        return len(self._middle)
+
+    @classmethod
+    def build(cls, network, witness_settles=1000, recheck_degree=12):
+        n = network.n_nodes
+        inf = float("inf")
+        # out_edges[v][w] = in_edges[w][v] = (weight, middle, streets it stands for),
+        # parallel streets keep the shortest
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        for s, t, w in zip(network.sources.tolist(), network.targets.tolist(), network.weights.tolist()):
+            if s != t and w < out_edges[s].get(t, (inf,))[0]:
+                out_edges[s][t] = in_edges[t][s] = (w, -1, 1)
+
+        def witness(u, skip, limit, targets):
+            # Distances from u avoiding skip, settling at most witness_settles
+            # nodes and stopping early once every target is settled
+            dist = {u: 0.0}
+            heap = [(0.0, u)]
+            settled = 0
+            left = len(targets)
+            pop, push = heapq.heappop, heapq.heappush
+            while heap and settled < witness_settles:
+                d, x = pop(heap)
+                if d > limit:
+                    break
+                if d > dist[x]:
+                    continue
+                settled += 1
+                if x in targets:
+                    left -= 1
+                    if not left:
+                        break
+                for y, (w, _, _) in out_edges[x].items():
+                    w += d
+                    if w <= limit and w < dist.get(y, inf) and y != skip:
+                        dist[y] = w
+                        push(heap, (w, y))
+            return dist
+
+        def shortcuts(v):
+            found = []
+            outgoing = out_edges[v]
+            if not outgoing:
+                return found
+            longest = max(w for w, _, _ in outgoing.values())
+            for u, (w_in, _, streets_in) in in_edges[v].items():
+                targets = outgoing.keys() - {u}
+                if not targets:
+                    continue
+                dist = witness(u, v, w_in + longest, targets)
+                for w in targets:
+                    if dist.get(w, inf) > w_in + outgoing[w][0]:
+                        found.append((u, w, w_in + outgoing[w][0], streets_in + outgoing[w][2]))
+            return found
+
+        # Edge difference, plus twice the streets the new shortcuts would stand
+        # for over those of the edges they replace (so contracting one region
+        # doesn't snowball into long shortcuts across it), plus how deep in the
+        # hierarchy v already sits (so it stays shallow and search spaces small)
+        depth = [0] * n
+
+        def priority(v, found):
+            removed = list(in_edges[v].values()) + list(out_edges[v].values())
+            return (len(found) - len(removed) + depth[v]
+                    + 2 * (sum(streets for *_, streets in found) - sum(streets for *_, streets in removed)))
+
+        # Every node's shortcuts and priority are redone as its neighbours go,
+        # so the heap's top is ready to contract. Busy nodes (more than
+        # recheck_degree edges) cost the most to redo and change the most
+        # often; they're only marked stale and checked when they come up
+        pending = [shortcuts(v) for v in range(n)]
+        current = [priority(v, pending[v]) for v in range(n)]
+        stale = [False] * n
+        heap = [(p, v) for v, p in enumerate(current)]
+        heapq.heapify(heap)
+        rank = np.full(n, -1, dtype=np.int64)
+        up, down = [None] * n, [None] * n
+        order = 0
+        while heap:
+            p, v = heapq.heappop(heap)
+            if rank[v] >= 0 or p != current[v]:
+                continue
+            if stale[v]:
+                stale[v] = False
+                pending[v] = shortcuts(v)
+                current[v] = priority(v, pending[v])
+                if heap and current[v] > heap[0][0]:
+                    heapq.heappush(heap, (current[v], v))
+                    continue
+            for u, w, weight, streets in pending[v]:
+                if weight < out_edges[u].get(w, (inf,))[0]:
+                    out_edges[u][w] = in_edges[w][u] = (weight, v, streets)
+            rank[v] = order
+            order += 1
+            up[v], down[v] = out_edges[v], in_edges[v]
+            for w in out_edges[v]:
+                del in_edges[w][v]
+            for u in in_edges[v]:
+                del out_edges[u][v]
+            out_edges[v], in_edges[v], pending[v] = {}, {}, None
+            for x in up[v].keys() | down[v].keys():
+                depth[x] = max(depth[x], depth[v] + 1)
+                if len(in_edges[x]) + len(out_edges[x]) > recheck_degree:
+                    stale[x] = True
+                    continue
+                pending[x] = shortcuts(x)
+                current[x] = priority(x, pending[x])
+                heapq.heappush(heap, (current[x], x))
+
+        def csr(rows):
+            indptr = np.zeros(n + 1, dtype=np.int64)
+            indptr[1:] = np.cumsum([len(row) for row in rows])
+            items = [(other, w, m) for row in rows for other, (w, m, _) in row.items()]
+            indices, weights, middle = (np.array(column) for column in zip(*items)) if items else ([], [], [])
+            return (indptr, np.asarray(indices, dtype=np.int64), np.asarray(weights, dtype=float),
+                    np.asarray(middle, dtype=np.int64))
+
+        up, down = csr(up), csr(down)
+        forward = cls._search_spaces(rank, up, down)
+        backward = cls._search_spaces(rank, down, up)
+        return cls(rank, *up, *down, *forward, *backward)
+
+    @staticmethod
+    def _search_spaces(rank, climb, stall):
+        # Every node's upward search space over the climb edges, worked out from
+        # the top of the hierarchy down: a node's space is itself plus its upper
+        # neighbours' spaces, one edge further, keeping the shortest. Entries the
+        # stall edges (the other direction's, i.e. coming down into a node) show
+        # a shorter way to can't be on a shortest path, and are dropped, as in a
+        # stall-on-demand search. Returns them as CSR: indptr, sorted nodes,
+        # distances, parent positions (-1 for the node itself)
+        n = len(rank)
+        climb_indptr, climb_indices, climb_weights, _ = climb
+        stall_indptr, stall_indices, stall_weights, _ = stall
+        spaces = [None] * n
+        for v in np.argsort(-rank).tolist():
+            a, b = climb_indptr[v], climb_indptr[v + 1]
+            nodes, distances, parents = [np.array([v])], [np.zeros(1)], [np.array([-1])]
+            for w, weight in zip(climb_indices[a:b].tolist(), climb_weights[a:b].tolist()):
+                above = spaces[w]
+                nodes.append(above[0])
+                distances.append(above[1] + weight)
+                parents.append(np.where(above[2] < 0, v, above[2]))
+            nodes, distances, parents = np.concatenate(nodes), np.concatenate(distances), np.concatenate(parents)
+            order = np.lexsort((distances, nodes))
+            nodes, distances, parents = nodes[order], distances[order], parents[order]
+            first = np.ones(len(nodes), dtype=bool)
+            np.not_equal(nodes[1:], nodes[:-1], out=first[1:])
+            nodes, distances, parents = nodes[first], distances[first], parents[first]
+
+            # Stall edges u -> x of every entry x, all at once
+            starts = stall_indptr[nodes]
+            counts = stall_indptr[nodes + 1] - starts
+            entry = np.repeat(np.arange(len(nodes)), counts)
+            edge = np.arange(counts.sum()) + np.repeat(starts - np.cumsum(counts) + counts, counts)
+            other = stall_indices[edge]
+            found = np.minimum(np.searchsorted(nodes, other), len(nodes) - 1)
+            beaten = (nodes[found] == other) & (distances[found] + stall_weights[edge] < distances[entry])
+            keep = np.ones(len(nodes), dtype=bool)
+            keep[entry[beaten]] = False
+            spaces[v] = nodes[keep], distances[keep], parents[keep]
+
+        # Parents as positions within the space, so a query walks them without
+        # lookups. Only entries on no shortest path can have lost theirs
+        for v, (nodes, distances, parents) in enumerate(spaces):
+            position = np.minimum(np.searchsorted(nodes, parents), len(nodes) - 1)
+            spaces[v] = nodes, distances, np.where(nodes[position] == parents, position, -1)
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(space[0]) for space in spaces])
+        return (indptr, *(np.concatenate([space[k] for space in spaces]).astype(dtype)
+                          for k, dtype in enumerate((np.int32, float, np.int32))))
+
+    def save(self, path):
+        np.savez_compressed(path, version=CACHE_VERSION, **self.arrays)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            if int(data["version"]) != CACHE_VERSION:
+                raise ValueError(f"{path} is from cache version {int(data['version'])}")
+            return cls(*(data[name] for name in cls.ARRAYS))
+
+    @staticmethod
+    def _space(spaces, node):
+        indptr, nodes, distances, parents = spaces
+        a, b = indptr[node], indptr[node + 1]
+        return nodes[a:b], distances[a:b], parents[a:b]
+
+    def query(self, source, target):
+        # (distance, street nodes from source to target), (inf, None) if unreachable.
+        # The source's forward and the target's backward search spaces are
+        # precomputed, so a query is their intersection and the best meeting
+        # node on it, then the parents back down either side
+        if source == target:
+            return 0.0, [source]
+        forward_nodes, forward_distances, forward_parents = self._space(self.forward, source)
+        backward_nodes, backward_distances, backward_parents = self._space(self.backward, target)
+        # Both sorted: look each forward node up among the backward ones
+        j = np.minimum(np.searchsorted(backward_nodes, forward_nodes), len(backward_nodes) - 1)
+        common = np.flatnonzero(backward_nodes[j] == forward_nodes)
+        if not len(common):
+            return np.inf, None
+        total = forward_distances[common] + backward_distances[j[common]]
+        best = int(np.argmin(total))
+
+        hops = []
+        nodes, parents = forward_nodes.tolist(), forward_parents.tolist()
+        k = int(common[best])
+        while k >= 0:
+            hops.append(nodes[k])
+            k = parents[k]
+        hops.reverse()
+        nodes, parents = backward_nodes.tolist(), backward_parents.tolist()
+        k = parents[int(j[common[best]])]
+        while k >= 0:
+            hops.append(nodes[k])
+            k = parents[k]
+        path = [hops[0]]
+        for a, b in zip(hops[:-1], hops[1:]):
+            path += self._unpack(a, b)
+        return float(total[best]), path
+
+    def search_space(self, source, target):
+        # Nodes a query between source and target looks at on either side
+        return self._space(self.forward, source)[0], self._space(self.backward, target)[0]
+
+    def distances(self, sources, targets):
+        # Distances for many (source, target) pairs, no paths: every pair's two
+        # search spaces gathered into one array each, keyed by (pair, node), and
+        # intersected in one go
+        sources, targets = np.asarray(sources, dtype=np.int64), np.asarray(targets, dtype=np.int64)
+        n = len(self.rank)
+
+        def gather(spaces, nodes):
+            indptr, space_nodes, space_distances, _ = spaces
+            starts = indptr[nodes]
+            counts = indptr[nodes + 1] - starts
+            entry = np.arange(counts.sum()) + np.repeat(starts - np.cumsum(counts) + counts, counts)
+            return np.repeat(np.arange(len(nodes)) * n, counts) + space_nodes[entry], space_distances[entry]
+
+        forward_keys, forward_distances = gather(self.forward, sources)
+        backward_keys, backward_distances = gather(self.backward, targets)
+        common, i, j = np.intersect1d(forward_keys, backward_keys, assume_unique=True, return_indices=True)
+        result = np.full(len(sources), np.inf)
+        np.minimum.at(result, common // n, forward_distances[i] + backward_distances[j])
+        result[sources == targets] = 0.0
+        return result
+
+    def _unpack(self, a, b):
+        # Street nodes after a along edge a -> b, expanding shortcuts
+        stack, out = [(a, b)], []
+        while stack:
+            a, b = stack.pop()
+            via = self._middle.get((a, b), -1)
+            if via < 0:
+                out.append(b)
+            else:
+                stack += [(via, b), (a, via)]
+        return out
+
+
+def contraction_hierarchy(network, cache=True, cache_dir=CACHE_DIR):
+    cache_dir = Path(cache_dir)
+    path = cache_dir / f"{network.key()}.npz"
+    if cache and path.exists():
+        try:
+            return ContractionHierarchy.load(path)
+        except (ValueError, KeyError, OSError):
+            pass
+    hierarchy = ContractionHierarchy.build(network)
+    if cache:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write next to the target and rename so readers never see half a file
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".npz")
+        os.close(fd)
+        try:
+            hierarchy.save(tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    return hierarchy
+
+
+def benchmark(blocks, queries, osm=None, seed=0):
+    network = load_osm(osm) if osm else synthetic_city(blocks, seed=seed)
+    print(f"{network.source}: {network.n_nodes:,} nodes, {len(network.weights):,} directed edges")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        hierarchy = contraction_hierarchy(network, cache_dir=cache_dir)
+        built = time.perf_counter() - start
+        start = time.perf_counter()
+        hierarchy = contraction_hierarchy(network, cache_dir=cache_dir)
+        loaded = time.perf_counter() - start
+    size = sum(array.nbytes for array in hierarchy.arrays.values())
+    print(f"  contraction  {built:7.2f} s   ({hierarchy.n_shortcuts:,} shortcuts, {size / 1e6:.1f} MB of arrays)")
+    print(f"  cache load   {loaded * 1000:7.1f} ms")
+
+    rng = np.random.default_rng(seed)
+    pairs = rng.integers(0, network.n_nodes, (queries, 2))
+    start = time.perf_counter()
+    results = [hierarchy.query(int(s), int(t)) for s, t in pairs]
+    elapsed = time.perf_counter() - start
+    print(f"  CH query     {elapsed / queries * 1e6:7.1f} us  ({queries / elapsed:,.0f} routes/s, paths unpacked)")
+    start = time.perf_counter()
+    batched = hierarchy.distances(pairs[:, 0], pairs[:, 1])
+    elapsed = time.perf_counter() - start
+    looked_at = np.mean([sum(map(len, hierarchy.search_space(int(s), int(t)))) for s, t in pairs[:200]])
+    print(f"  CH distance  {elapsed / queries * 1e6:7.1f} us  ({queries / elapsed:,.0f} distances/s batched, "
+          f"{looked_at:.0f} search-space nodes per query)")
+
+    # Check against plain Dijkstra on the street graph
+    graph = network.graph()
+    check = pairs[:min(queries, 50)]
+    start = time.perf_counter()
+    reference = dijkstra(graph, indices=check[:, 0])
+    per_source = (time.perf_counter() - start) / len(check)
+    expected = reference[np.arange(len(check)), check[:, 1]]
+    got = np.array([results[i][0] for i in range(len(check))])
+    print(f"  Dijkstra     {per_source * 1e6:7.1f} us per source (scipy), CH distances match: "
+          f"{np.allclose(got, expected) and np.allclose(batched[:len(check)], expected)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Contraction-hierarchy road routing benchmark")
+    parser.add_argument("--blocks", type=int, default=40, help="synthetic city size in blocks")
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--osm", help="route on a local OSM XML extract instead")
+    args = parser.parse_args()
+    benchmark(args.blocks, args.queries, args.osm)
@@ -0,0 +1,178 @@
+import argparse
+import time
+
+import numpy as np
+
+# Every solution of f(x) = k on [a, b] for a whole batch of levels k at once,
+# for IntermediateValueTikTok.
+#   scan    f is sampled once on a dense grid. A grid cell holds a crossing of k
+#           exactly when k lies strictly between its two end values, so with
+#           the levels sorted, two searchsorted calls give every (level, cell)
+#           bracket without building a levels x grid table. Levels that land
+#           exactly on a sample are roots already.
+#   refine  all brackets are then narrowed together: one vectorized call of f
+#           per iteration, Illinois (modified regula falsi) steps with a
+#           bisection fallback whenever the secant point leaves the bracket,
+#           and finished brackets dropped from the batch as they converge.
+# A touching root (f just reaches k and turns back) has no sign change, so it
+# is only found if it falls on a grid sample; a denser grid narrows the gap.
+#
+# Benchmark: python roots.py --levels 10000 --grid 4096
+
+
+def scan(f, a, b, levels, n_grid=2048):
+    # (grid, samples, level index, left cell index) for the sign changes, plus
+    # (level index, x) for levels hit exactly on a grid sample
+    x = np.linspace(a, b, n_grid)
+    y = np.asarray(f(x), dtype=float)
+    levels = np.asarray(levels, dtype=float)
+
+    lo, hi = np.minimum(y[:-1], y[1:]), np.maximum(y[:-1], y[1:])
+    first = np.searchsorted(levels, lo, side="right")
+    count = np.maximum(np.searchsorted(levels, hi, side="left") - first, 0)
+    cells = np.repeat(np.arange(n_grid - 1), count)
+    # Level indices first[i], first[i] + 1, ... for each cell i
+    offsets = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+    level_index = np.repeat(first, count) + offsets
+
+    first = np.searchsorted(levels, y, side="left")
+    count = np.searchsorted(levels, y, side="right") - first
+    hits = np.repeat(np.arange(n_grid), count)
+    offsets = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+    exact = (np.repeat(first, count) + offsets, x[hits])
+    return x, y, level_index, cells, exact
+
+
+def refine(g, x0, x1, g0, g1, xtol=1e-12, max_iter=100):
+    # Narrow brackets [x0, x1] where g changes sign, all at once. g(x, which)
+    # evaluates bracket number which[i] at x[i], so each bracket can carry its
+    # own function (a level to subtract, a curve to walk along)
+    x0, x1 = np.array(x0, dtype=float), np.array(x1, dtype=float)
+    g0, g1 = np.array(g0, dtype=float), np.array(g1, dtype=float)
+    roots = 0.5 * (x0 + x1)
+    active = np.arange(len(x0))
+    for _ in range(max_iter):
+        if not len(active):
+            break
+        # Secant through the bracket ends, or the midpoint if that misbehaves
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = x1 - g1 * (x1 - x0) / (g1 - g0)
+        inside = (x - np.minimum(x0, x1)) * (np.maximum(x0, x1) - x) > 0
+        x = np.where(inside, x, 0.5 * (x0 + x1))
+        gx = np.asarray(g(x, active), dtype=float)
+
+        # Keep the root between the new point and whichever end g flips against;
+        # halving the stale end's value (Illinois) stops one side sticking forever
+        flip = gx * g1 < 0
+        x0 = np.where(flip, x1, x0)
+        g0 = np.where(flip, g1, 0.5 * g0)
+        x1, g1 = x, gx
+
+        done = (gx == 0) | (np.abs(x1 - x0) <= xtol * np.maximum(1, np.abs(x1)))
+        roots[active[done]] = x1[done]
+        keep = ~done
+        active, x0, x1, g0, g1 = active[keep], x0[keep], x1[keep], g0[keep], g1[keep]
+    roots[active] = x1
+    return roots
+
+
+class LevelCrossings:
+    def __init__(self, levels, roots, counts):
+        self.levels = levels  # sorted ascending
+        self.roots = roots  # (len(levels), most roots) ascending per row, NaN padded
+        self.counts = counts  # number of roots per level
+
+    def for_level(self, i):
+        return self.roots[i, :self.counts[i]]
+
+    def at(self, level):
+        # Roots at any level inside the table: blended between the two nearest
+        # levels when both have the same number of roots, otherwise the nearer one
+        levels = self.levels
+        if len(levels) == 1 or level <= levels[0]:
+            return self.for_level(0)
+        if level >= levels[-1]:
+            return self.for_level(len(levels) - 1)
+        i = int(np.searchsorted(levels, level)) - 1
+        frac = (level - levels[i]) / (levels[i + 1] - levels[i])
+        if self.counts[i] == self.counts[i + 1]:
+            return (1 - frac) * self.for_level(i) + frac * self.for_level(i + 1)
+        return self.for_level(i if frac < 0.5 else i + 1)
+
+
+def level_crossings(f, a, b, levels, n_grid=2048, xtol=1e-12):
+    # f: vectorized, array in -> array out. Every x in [a, b] with f(x) = k, for each k in levels
+    levels = np.unique(np.asarray(levels, dtype=float))
+    x, y, level_index, cells, (exact_index, exact_x) = scan(f, a, b, levels, n_grid)
+    targets = levels[level_index]
+    found = refine(lambda t, which: f(t) - targets[which], x[cells], x[cells + 1],
+                   y[cells] - targets, y[cells + 1] - targets, xtol)
+
+    level_index = np.concatenate([level_index, exact_index])
+    found = np.concatenate([found, exact_x])
+    order = np.lexsort((found, level_index))
+    level_index, found = level_index[order], found[order]
+    counts = np.bincount(level_index, minlength=len(levels))
+    # Column of each root within its level's row
+    column = np.arange(len(found)) - np.repeat(np.cumsum(counts) - counts, counts)
+    roots = np.full((len(levels), max(int(counts.max(initial=0)), 1)), np.nan)
+    roots[level_index, column] = found
+    return LevelCrossings(levels, roots, counts)
+
+
+def crossings(f, a, b, level, n_grid=2048, xtol=1e-12):
+    # Every x in [a, b] with f(x) = level, ascending
+    return level_crossings(f, a, b, [level], n_grid, xtol).for_level(0)
+
+
+def benchmark(n_levels, n_grid, n_scalar=200):
+    from scipy.optimize import brentq
+
+    f = lambda x: np.sin(3 * x) + 0.5 * np.sin(17 * x) + 0.05 * x
+    a, b = 0.0, 20.0
+    levels = np.linspace(-1.2, 2.2, n_levels)
+    calls = [0]
+
+    def counted(x):
+        calls[0] += 1
+        return f(x)
+
+    t0 = time.perf_counter()
+    table = level_crossings(counted, a, b, levels, n_grid)
+    elapsed = time.perf_counter() - t0
+    total = int(table.counts.sum())
+    print(f"{n_levels:,} levels x {n_grid:,} grid on [{a:g}, {b:g}]: {total:,} roots in {elapsed * 1000:.0f} ms "
+          f"({elapsed / total * 1e6:.2f} us/root, {calls[0]} vectorized calls of f)")
+
+    x = np.concatenate([table.for_level(i) for i in range(n_levels)])
+    k = np.repeat(table.levels, table.counts)
+    print(f"  max |f(x) - k| {np.max(np.abs(f(x) - k)):.2e}, most roots on one level {table.counts.max()}")
+
+    # The scalar way: scan each level, then brentq one bracket at a time
+    picks = np.linspace(0, n_levels - 1, min(n_scalar, n_levels)).astype(int)
+    grid = np.linspace(a, b, n_grid)
+    t0 = time.perf_counter()
+    scalar = []
+    for i in picks:
+        g = f(grid) - table.levels[i]
+        change = np.nonzero(g[:-1] * g[1:] < 0)[0]
+        scalar.append([brentq(lambda t: f(t) - table.levels[i], grid[j], grid[j + 1], xtol=1e-12) for j in change])
+    per_level = (time.perf_counter() - t0) / len(picks)
+    agree = max((np.max(np.abs(np.array(s) - table.for_level(i))) for s, i in zip(scalar, picks) if len(s)),
+                default=0.0)
+    print(f"  scan + scalar brentq: {per_level * 1000:.2f} ms/level -> {per_level * n_levels * 1000:.0f} ms "
+          f"for all levels ({per_level * n_levels / elapsed:.0f}x slower), max difference {agree:.1e}")
+
+    lookups = np.linspace(levels[0], levels[-1], 1000)
+    t0 = time.perf_counter()
+    for level in lookups:
+        table.at(level)
+    print(f"  table lookup at an arbitrary level {(time.perf_counter() - t0) / len(lookups) * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batched level-crossing root finder benchmark")
+    parser.add_argument("--levels", type=int, default=10000)
+    parser.add_argument("--grid", type=int, default=4096)
+    args = parser.parse_args()
+    benchmark(args.levels, args.grid)
@@ -0,0 +1,101 @@
+from manim import *
+
+import incremental
+import render_profile
+import tex_cache
+
+# Every scene built on StepSequenceScene shares the on-disk LaTeX cache and
+# only re-renders the segments whose content changed (and is profiled when
+# CALC4DUMB_PROFILE is set)
+tex_cache.install()
+incremental.install()
+render_profile.install_from_env()
+
+
+class Step:
+    # One entry in a step sequence. hold is the wait after the step lands,
+    # label is an optional caption written under it, hook is called right
+    # after the step appears (before the hold) for step-specific animations.
+    def __init__(self, tex, color=WHITE, font_size=None, hold=1.0, run_time=None, label=None, hook=None):
+        self.tex = tex
+        self.color = color
+        self.font_size = font_size
+        self.hold = hold
+        self.run_time = run_time
+        self.label = label
+        self.hook = hook
+
+
+class StepSequenceScene(Scene):
+    # Title + @calc4dumb watermark, then a list of MathTex steps transformed
+    # one into the next below the watermark. Subclasses fill in
+    # construct_visual(), get_steps() and construct_finale().
+    title_text = ""
+    title_font_size = 48
+    title_color = BLUE
+    step_font_size = 48
+    step_buff = 1
+    label_font_size = 32
+    label_color = ORANGE
+    label_buff = 0.3
+    label_fade_time = None
+
+    def setup(self):
+        # Title and watermark (persistent)
+        self.title = Text(self.title_text, font_size=self.title_font_size, color=self.title_color).to_edge(UP)
+        self.watermark = Text("@calc4dumb", font_size=24, color=GREY).next_to(self.title, DOWN, buff=0.1)
+        self.add(self.title, self.watermark)
+        self.step_text = None
+        self.step_index = None
+
+    def construct(self):
+        self.construct_visual()
+        self.play_steps(self.get_steps())
+        self.construct_finale()
+
+    def construct_visual(self):
+        pass
+
+    def get_steps(self):
+        return []
+
+    def construct_finale(self):
+        pass
+
+    def build_steps(self, steps):
+        # Build every step up front: all uncached step strings go through a
+        # single LaTeX document, then each MathTex is a cache hit
+        tex_cache.compile_batch([step.tex for step in steps])
+        return [
+            MathTex(step.tex, font_size=step.font_size or self.step_font_size, color=step.color)
+            .next_to(self.watermark, DOWN, buff=self.step_buff)
+            for step in steps
+        ]
+
+    def play_steps(self, steps):
+        step_mobs = self.build_steps(steps)
+        self.step_text = step_mobs[0]
+        label = None
+
+        for i, (step, step_mob) in enumerate(zip(steps, step_mobs)):
+            self.step_index = i
+            animations = [Write(step_mob) if i == 0 else Transform(self.step_text, step_mob)]
+            if step.label:
+                label = Text(step.label, font_size=self.label_font_size, color=self.label_color)
+                label.next_to(step_mob, DOWN, buff=self.label_buff)
+                animations.append(Write(label))
+
+            play_kwargs = {} if step.run_time is None else {"run_time": step.run_time}
+            self.play(*animations, **play_kwargs)
+            if step.hook is not None:
+                step.hook()
+            if step.hold:
+                self.wait(step.hold)
+
+            # Remove the label before next step
+            if label is not None and i < len(steps) - 1:
+                fade_kwargs = {} if self.label_fade_time is None else {"run_time": self.label_fade_time}
+                self.play(FadeOut(label), **fade_kwargs)
+                label = None
+
+        return self.step_text
@@ -2,6 +2,13 @@ from manim import *
 import numpy as np
 import random
 
+from bs_pde import crank_nicolson
+from curve_utils import coords_to_points, smooth_curve
+from fan_chart import FanChart, path_quantiles
+from quadratic_variation import QuadraticVariation
+from quality_profile import QUALITY
+from stochastic_paths import brownian_paths
+
 class StochasticCalculusTikTok(Scene):
     def construct(self):
         # Title and watermark (persistent)
@@ -54,7 +61,7 @@ class StochasticCalculusTikTok(Scene):
         )
         regular_func = axes_regular.plot(lambda x: 1 + 0.5*x + 0.3*np.sin(2*x), color=BLUE, stroke_width=5)
         # Add subtle glow effect
-        regular_glow = axes_regular.plot(lambda x: 1 + 0.5*x + 0.3*np.sin(2*x), color=BLUE, stroke_width=12)
+        regular_glow = axes_regular.plot(lambda x: 1 + 0.5*x + 0.3*np.sin(2*x), color=BLUE, stroke_width=QUALITY.glow_width(12))
         regular_glow.set_stroke(opacity=0.3)
         self.play(Create(regular_glow), Create(regular_func, run_time=2))
         self.wait(1)
@@ -76,14 +83,12 @@ class StochasticCalculusTikTok(Scene):
         )
         
         # Generate random walk for stochastic function
-        np.random.seed(42)
-        t_vals = np.linspace(0, 4, 300)
+        t_vals = np.linspace(0, 4, QUALITY.samples(300))
         dt = t_vals[1] - t_vals[0]
-        random_increments = np.random.normal(0, np.sqrt(dt), len(t_vals))
-        brownian_path = np.cumsum(random_increments)
+        brownian_path = brownian_paths(1, len(t_vals) - 1, dt, seed=42)[0]
         stochastic_vals = 1 + 0.5*t_vals + 0.6*brownian_path
         
-        stochastic_points = [axes_stochastic.c2p(t, val) for t, val in zip(t_vals, stochastic_vals)]
+        stochastic_points = coords_to_points(axes_stochastic, t_vals, stochastic_vals)
         stochastic_func = VMobject()
         stochastic_func.set_points_smoothly(stochastic_points)
         stochastic_func.set_color(RED)
@@ -93,7 +98,7 @@ class StochasticCalculusTikTok(Scene):
         stochastic_glow = VMobject()
         stochastic_glow.set_points_smoothly(stochastic_points)
         stochastic_glow.set_color(RED)
-        stochastic_glow.set_stroke(width=15)
+        stochastic_glow.set_stroke(width=QUALITY.glow_width(15))
         stochastic_glow.set_stroke(opacity=0.2)
         
         self.play(Create(stochastic_glow), Create(stochastic_func, run_time=2.5))
@@ -102,7 +107,18 @@ class StochasticCalculusTikTok(Scene):
         # Step 4: Introduce stochastic calculus
         new_step = MathTex(steps[3], font_size=42, color=PURPLE).next_to(watermark, DOWN, buff=1)
         self.play(Transform(step_text, new_step))
-        self.wait(1.5)
+
+        # Every path is random, but the spread of all of them follows the calculus
+        fan_values = path_quantiles(
+            lambda count, rng: 1 + 0.5*t_vals + 0.6*brownian_paths(count, len(t_vals) - 1, dt, seed=rng),
+            QUALITY.samples(2000),
+            seed=7,
+        )
+        # The outer band outgrows the chart by t = 4, so keep it inside the axes
+        stochastic_fan = FanChart(axes_stochastic, t_vals, np.clip(fan_values, -1, 3), color=PURPLE)
+        self.add_foreground_mobjects(stochastic_glow, stochastic_func)
+        self.play(FadeIn(stochastic_fan), run_time=1.5)
+        self.wait(1)
 
         # Step 5: The shocking rule
         new_step = MathTex(steps[4], font_size=38, color=YELLOW).next_to(watermark, DOWN, buff=1)
@@ -111,9 +127,9 @@ class StochasticCalculusTikTok(Scene):
         # Animate the "shock" with some visual effects
         self.play(
             stochastic_func.animate.set_stroke(width=7, color=GOLD),
-            stochastic_glow.animate.set_stroke(width=20, color=GOLD).set_stroke(opacity=0.4),
+            stochastic_glow.animate.set_stroke(width=QUALITY.glow_width(20), color=GOLD).set_stroke(opacity=0.4),
             regular_func.animate.set_stroke(width=3, color=DARK_GREY),
-            regular_glow.animate.set_stroke(width=8, color=DARK_GREY).set_stroke(opacity=0.1)
+            regular_glow.animate.set_stroke(width=QUALITY.glow_width(8), color=DARK_GREY).set_stroke(opacity=0.1)
         )
         self.wait(2)
 
@@ -121,11 +137,61 @@ class StochasticCalculusTikTok(Scene):
         self.play(
             *[FadeOut(obj, shift=DOWN*0.5) for obj in [
                 axes_regular, axes_stochastic, regular_func, stochastic_func,
-                regular_glow, stochastic_glow, regular_label, stochastic_label
+                regular_glow, stochastic_glow, regular_label, stochastic_label, stochastic_fan
             ]],
             run_time=1.5
         )
 
+        # (dW)^2 = dt, measured: quadratic variation of one path over [0, 1] on
+        # nested partitions, down to 2^27 (~1.3e8) increments streamed in chunks
+        qv = QuadraticVariation(t=1.0, max_level=int(np.log2(QUALITY.samples(2**27))), seed=7)
+        progress = list(qv.iter_chunks())
+
+        qv_axes = Axes(
+            x_range=[0, qv.max_level, 5],
+            y_range=[0, 2, 0.5],
+            x_length=6,
+            y_length=2.4,
+            axis_config={"color": DARK_GREY, "stroke_width": 2},
+        ).to_edge(DOWN, buff=0.7)
+        qv_axes_labels = VGroup(
+            MathTex(r"\log_2 n", font_size=24).next_to(qv_axes.x_axis, DOWN, buff=0.15),
+            MathTex(r"\sum (\Delta W)^2", font_size=24).next_to(qv_axes.y_axis, UP, buff=0.1),
+        )
+        target_line = DashedLine(qv_axes.c2p(0, 1), qv_axes.c2p(qv.max_level, 1), color=GREEN)
+        target_label = MathTex("t = 1", font_size=24, color=GREEN).next_to(target_line, RIGHT, buff=0.1)
+
+        # Live counter while the finest partition streams through
+        count_value = Integer(0, font_size=28, color=YELLOW)
+        sum_value = DecimalNumber(0, num_decimal_places=5, font_size=28, color=YELLOW)
+        time_value = DecimalNumber(0, num_decimal_places=3, font_size=28, color=GREEN)
+        counter = VGroup(
+            VGroup(MathTex("n =", font_size=28), count_value).arrange(RIGHT, buff=0.15),
+            VGroup(MathTex(r"\sum (\Delta W)^2 =", font_size=28), sum_value).arrange(RIGHT, buff=0.15),
+            VGroup(MathTex("s =", font_size=28, color=GREEN), time_value).arrange(RIGHT, buff=0.15),
+        ).arrange(RIGHT, buff=0.6).next_to(qv_axes, UP, buff=0.4)
+
+        def stream(group, alpha):
+            processed, covered, running = progress[min(int(alpha * len(progress)), len(progress) - 1)]
+            count_value.set_value(processed)
+            sum_value.set_value(running)
+            time_value.set_value(covered)
+
+        self.play(Create(qv_axes), Write(qv_axes_labels), FadeIn(counter), run_time=1)
+        self.play(UpdateFromAlphaFunc(counter, stream), run_time=4, rate_func=linear)
+
+        # Convergence: coarse partitions scatter, fine ones pin the sum to t
+        qv_points = coords_to_points(qv_axes, qv.levels, np.clip(qv.sums, 0, 2))
+        qv_dots = VGroup(*[Dot(point, radius=0.05, color=YELLOW) for point in qv_points])
+        qv_path = VMobject(color=YELLOW, stroke_width=2).set_points_as_corners(qv_points)
+        self.play(Create(target_line), Write(target_label))
+        self.play(LaggedStart(*[FadeIn(dot, scale=0.5) for dot in qv_dots], lag_ratio=0.1), Create(qv_path), run_time=2.5)
+        self.wait(1.5)
+        self.play(
+            *[FadeOut(obj) for obj in [qv_axes, qv_axes_labels, target_line, target_label, counter, qv_dots, qv_path]],
+            run_time=1
+        )
+
         # Step 6: Itô's lemma - the big reveal with better styling
         new_step = MathTex(steps[5], font_size=32, color=GREEN).next_to(watermark, DOWN, buff=1)
         self.play(Transform(step_text, new_step))
@@ -206,4 +272,50 @@ class StochasticCalculusTikTok(Scene):
             run_time=1
         )
         
+        self.wait(1)
+
+        # Solve that PDE: Crank-Nicolson from the payoff at expiry back to today,
+        # keeping only the slices the sweep shows
+        strike, rate, sigma, maturity = 100, 0.05, 0.4, 1.0
+        solution = crank_nicolson(
+            strike, rate, sigma, maturity,
+            n_space=QUALITY.samples(400),
+            n_time=QUALITY.samples(200),
+            store_times=np.linspace(0, maturity, QUALITY.samples(60)),
+        )
+        in_view = (solution.s >= 50) & (solution.s <= 150)
+        s_view = solution.s[in_view]
+
+        value_axes = Axes(
+            x_range=[50, 150, 25],
+            y_range=[0, 60, 20],
+            x_length=6,
+            y_length=2.2,
+            axis_config={"color": DARK_GREY, "stroke_width": 2},
+        ).to_edge(DOWN, buff=0.5)
+        value_axes_labels = VGroup(
+            MathTex("S", font_size=24).next_to(value_axes.x_axis, RIGHT, buff=0.15),
+            MathTex("V(S,t)", font_size=24, color=GOLD).next_to(value_axes.y_axis, UP, buff=0.1),
+        )
+        payoff_line = DashedVMobject(value_axes.plot(
+            lambda x: max(x - strike, 0), x_range=[50, 150], use_smoothing=False, color=GREY, stroke_width=2
+        ))
+
+        def value_points(alpha):
+            return coords_to_points(value_axes, s_view, solution.slice_at(alpha)[1][in_view])
+
+        # Start at expiry (the payoff) and sweep back to t = 0
+        value_curve = smooth_curve(value_axes, s_view, solution.slice_at(1)[1][in_view], color=GOLD, stroke_width=4)
+        time_value = DecimalNumber(maturity, num_decimal_places=2, font_size=28, color=GOLD)
+        time_label = VGroup(MathTex("t =", font_size=28, color=GOLD), time_value).arrange(RIGHT, buff=0.15)
+        time_label.next_to(value_axes, RIGHT, buff=0.2).align_to(value_axes, UP)
+
+        self.play(Create(value_axes), Write(value_axes_labels), Create(payoff_line), run_time=1.2)
+        self.play(Create(value_curve), Write(time_label))
+
+        def sweep(curve, alpha):
+            curve.set_points_smoothly(value_points(1 - alpha))
+            time_value.set_value(solution.slice_at(1 - alpha)[0])
+
+        self.play(UpdateFromAlphaFunc(value_curve, sweep), run_time=4, rate_func=linear)
         self.wait(2)
\ No newline at end of file
@@ -0,0 +1,110 @@
+import numpy as np
+
+# Shared Brownian / geometric Brownian motion engine for the finance scenes.
+# Everything is (paths x steps) NumPy arrays from one seeded Generator, so
+# 10k paths cost about as much as one. Normals are drawn time-major, which
+# makes iter_*_chunks() produce the same paths as the one-shot functions
+# (up to float rounding) while only holding chunk_steps columns at a time.
+#
+# Barriers replace clipping:
+#   barrier="reflect"  paths bounce off lower/upper (mirrored each step)
+#   barrier="absorb"   paths stop at the first barrier they touch
+
+BARRIERS = ("reflect", "absorb")
+
+
+def time_grid(n_steps, dt, t0=0.0):
+    return t0 + dt * np.arange(n_steps + 1)
+
+
+def _normals(rng, n_steps, n_paths, antithetic):
+    # (n_steps, n_paths) standard normals; antithetic pairs path i with -path i
+    if not antithetic:
+        return rng.standard_normal((n_steps, n_paths))
+    half = rng.standard_normal((n_steps, (n_paths + 1) // 2))
+    return np.concatenate([half, -half], axis=1)[:, :n_paths]
+
+
+def _reflect(x, lower, upper):
+    # Mirror back inside [lower, upper], folding as often as a big step needs
+    if lower is not None and upper is not None:
+        width = upper - lower
+        y = np.mod(x - lower, 2 * width)
+        return lower + np.where(y > width, 2 * width - y, y)
+    if lower is not None:
+        return np.where(x < lower, 2 * lower - x, x)
+    return np.where(x > upper, 2 * upper - x, x)
+
+
+def _absorb(block, absorbed, lower, upper):
+    # block is (steps, paths); freeze every path from its first barrier touch on
+    low = np.full(block.shape, False) if lower is None else block <= lower
+    high = np.full(block.shape, False) if upper is None else block >= upper
+    hit = low | high
+    first = np.argmax(hit, axis=0)
+    touched = hit.any(axis=0)
+    cols = np.arange(block.shape[1])
+    level = np.where(low[first, cols], lower if lower is not None else 0.0,
+                     upper if upper is not None else 0.0)
+    after = touched & (np.arange(block.shape[0])[:, None] >= first[None, :])
+    block = np.where(after, level[None, :], block)
+    return block, absorbed | touched
+
+
+def iter_brownian_chunks(n_paths, n_steps, dt, x0=0.0, drift=0.0, sigma=1.0, seed=None,
+                         chunk_steps=1024, lower=None, upper=None, barrier="reflect", antithetic=False):
+    # Yields (n_paths, k) blocks of X after each step, dX = drift dt + sigma dW
+    if barrier not in BARRIERS:
+        raise ValueError(f"Unknown barrier {barrier!r}, expected one of {', '.join(BARRIERS)}")
+    rng = np.random.default_rng(seed)
+    current = np.broadcast_to(np.asarray(x0, dtype=float), (n_paths,)).copy()
+    absorbed = np.zeros(n_paths, dtype=bool)
+    bounded = lower is not None or upper is not None
+    scale = sigma * np.sqrt(dt)
+
+    for start in range(0, n_steps, chunk_steps):
+        k = min(chunk_steps, n_steps - start)
+        steps = drift * dt + scale * _normals(rng, k, n_paths, antithetic)
+
+        if bounded and barrier == "reflect":
+            # Reflection depends on where each path is, so step through time
+            # (still vectorized across paths)
+            block = np.empty((k, n_paths))
+            for i in range(k):
+                current = _reflect(current + steps[i], lower, upper)
+                block[i] = current
+        else:
+            block = current + np.cumsum(steps, axis=0)
+            if bounded:
+                block = np.where(absorbed[None, :], current[None, :], block)
+                block, absorbed = _absorb(block, absorbed, lower, upper)
+            current = block[-1].copy()
+        yield block.T
+
+
+def brownian_paths(n_paths, n_steps, dt, x0=0.0, drift=0.0, sigma=1.0, seed=None, **kwargs):
+    # (n_paths, n_steps + 1) including the starting value
+    start = np.broadcast_to(np.asarray(x0, dtype=float), (n_paths,))[:, None]
+    chunks = iter_brownian_chunks(n_paths, n_steps, dt, x0, drift, sigma, seed, **kwargs)
+    return np.concatenate([start, *chunks], axis=1)
+
+
+def _log_barrier(level):
+    return None if level is None else np.log(level)
+
+
+def iter_gbm_chunks(n_paths, n_steps, dt, s0, mu, sigma, seed=None, lower=None, upper=None, **kwargs):
+    # dS = mu S dt + sigma S dW, simulated exactly in log space; barriers are prices
+    chunks = iter_brownian_chunks(
+        n_paths, n_steps, dt, np.log(s0), mu - 0.5 * sigma**2, sigma, seed,
+        lower=_log_barrier(lower), upper=_log_barrier(upper), **kwargs,
+    )
+    for block in chunks:
+        yield np.exp(block)
+
+
+def gbm_paths(n_paths, n_steps, dt, s0, mu, sigma, seed=None, **kwargs):
+    # (n_paths, n_steps + 1) prices including s0
+    start = np.broadcast_to(np.asarray(s0, dtype=float), (n_paths,))[:, None]
+    chunks = iter_gbm_chunks(n_paths, n_steps, dt, s0, mu, sigma, seed, **kwargs)
+    return np.concatenate([start, *chunks], axis=1)
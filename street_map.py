@@ -0,0 +1,64 @@
+from manim import *
+import numpy as np
+
+# Street maps as a couple of mobjects instead of one Line per street.
+# MapFrame places network metres in a box on screen (optionally zoomed in),
+# StreetNetwork drops every segment outside the viewport and draws the rest
+# as one compound VMobject (each segment a straight cubic, so the renderer
+# sees one path with many subpaths), and RouteLine is one polyline along a
+# route's street nodes.
+
+
+class MapFrame:
+    def __init__(self, bounds, width, height, center=ORIGIN, zoom=1.0):
+        xmin, ymin, xmax, ymax = bounds
+        self.width = width
+        self.height = height
+        self.scale = zoom * min(width / (xmax - xmin), height / (ymax - ymin))
+        self.origin = np.array([(xmin + xmax) / 2, (ymin + ymax) / 2])
+        self.center = np.asarray(center, dtype=float)
+
+    def to_scene(self, xy):
+        xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+        points = np.zeros((len(xy), 3))
+        points[:, :2] = (xy - self.origin) * self.scale + self.center[:2]
+        return points
+
+    def to_network(self, point):
+        return (np.asarray(point, dtype=float)[:2] - self.center[:2]) / self.scale + self.origin
+
+    def viewport(self):
+        # (xmin, ymin, xmax, ymax) of the on-screen box
+        x, y = self.center[:2]
+        return (x - self.width / 2, y - self.height / 2, x + self.width / 2, y + self.height / 2)
+
+
+def segment_curves(starts, ends):
+    # (m, 3) starts and ends -> (4m, 3) points, one straight cubic per segment
+    starts, ends = np.asarray(starts, dtype=float), np.asarray(ends, dtype=float)
+    step = (ends - starts) / 3
+    return np.stack([starts, starts + step, ends - step, ends], axis=1).reshape(-1, 3)
+
+
+class StreetNetwork(VMobject):
+    def __init__(self, network, frame, viewport=None, color=GREY, stroke_width=1.5, **kwargs):
+        super().__init__(stroke_color=color, stroke_width=stroke_width, fill_opacity=0, **kwargs)
+        segments = network.segments()
+        starts = frame.to_scene(segments[:, 0])
+        ends = frame.to_scene(segments[:, 1])
+        xmin, ymin, xmax, ymax = frame.viewport() if viewport is None else viewport
+        # Keep a segment unless its bounding box misses the viewport entirely
+        keep = ~(
+            (np.maximum(starts[:, 0], ends[:, 0]) < xmin) | (np.minimum(starts[:, 0], ends[:, 0]) > xmax)
+            | (np.maximum(starts[:, 1], ends[:, 1]) < ymin) | (np.minimum(starts[:, 1], ends[:, 1]) > ymax)
+        )
+        self.n_segments = int(keep.sum())
+        self.n_culled = len(keep) - self.n_segments
+        if self.n_segments:
+            self.set_points(segment_curves(starts[keep], ends[keep]))
+
+
+class RouteLine(VMobject):
+    def __init__(self, network, frame, path, color=GREEN, stroke_width=6, **kwargs):
+        super().__init__(stroke_color=color, stroke_width=stroke_width, fill_opacity=0, **kwargs)
+        self.set_points_as_corners(frame.to_scene(network.xy[np.asarray(path)]))
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from scipy.optimize import least_squares
+
+# Raw SVI fit of the implied-vol surface, one slice per expiry:
+#   w(k) = a + b * (rho * (k - m) + sqrt((k - m)^2 + sigma^2))
+# with w = iv^2 * T the total implied variance and k = log(K / F).
+# Slices are fitted shortest expiry first, each one warm-started from the
+# previous fit, and the whole calibration is cached on disk under a hash of
+# the input quotes, so re-rendering a scene never refits the same data.
+
+CACHE_DIR = Path(os.environ.get("CALC4DUMB_SVI_CACHE_DIR", Path.home() / ".cache" / "calc4dumb" / "svi"))
+CACHE_VERSION = 1
+PARAMS = ("a", "b", "rho", "m", "sigma")
+# Bounds on (m, sigma); a, b, rho come out of the inner linear solve
+LOWER = np.array([-np.inf, 0.0, -1.0, -2.0, 1e-4])
+UPPER = np.array([np.inf, np.inf, 1.0, 2.0, 5.0])
+
+
+def total_variance(k, params):
+    a, b, rho, m, sigma = params
+    x = np.asarray(k, dtype=float) - m
+    return a + b * (rho * x + np.sqrt(x**2 + sigma**2))
+
+
+def _linear_params(m, sigma, k, w, weights):
+    # For fixed (m, sigma), w = a + d y + c sqrt(y^2 + 1) with y = (k - m) / sigma
+    # is linear in (a, d, c): one weighted least-squares solve. Clip to b >= 0, |rho| < 1.
+    y = (k - m) / sigma
+    design = np.column_stack([np.ones_like(y), y, np.sqrt(y**2 + 1)]) * weights[:, None]
+    (a, d, c), *_ = np.linalg.lstsq(design, w * weights, rcond=None)
+    c = max(c, 1e-10)
+    d = np.clip(d, -0.999 * c, 0.999 * c)
+    return np.array([a, c / sigma, d / c, m, sigma])
+
+
+def fit_slice(k, w, weights=None, x0=None):
+    # Quasi-explicit SVI (Zeliade): least squares over (m, sigma) only, with
+    # (a, b, rho) solved exactly inside, which is far better conditioned than
+    # fitting all five at once. x0 is a full parameter vector (warm start).
+    k = np.asarray(k, dtype=float)
+    w = np.asarray(w, dtype=float)
+    weights = np.ones_like(k) if weights is None else np.asarray(weights, dtype=float)
+    start = np.array([0.0, 0.1]) if x0 is None else np.asarray(x0, dtype=float)[3:]
+    start = np.clip(start, LOWER[3:] + 1e-9, UPPER[3:] - 1e-9)
+
+    def residuals(ms):
+        return weights * (total_variance(k, _linear_params(*ms, k, w, weights)) - w)
+
+    result = least_squares(residuals, start, bounds=(LOWER[3:], UPPER[3:]))
+    return _linear_params(*result.x, k, w, weights), result.nfev
+
+
+class SVISurface:
+    def __init__(self, maturities, params, forwards=None, spot=None):
+        order = np.argsort(maturities)
+        self.maturities = np.asarray(maturities, dtype=float)[order]
+        self.params = np.asarray(params, dtype=float).reshape(-1, 5)[order]
+        self.forwards = None if forwards is None else np.asarray(forwards, dtype=float)[order]
+        self.spot = spot
+
+    def slice_variance(self, k, index):
+        return total_variance(k, self.params[index])
+
+    def total_variance(self, k, t):
+        # Linear in total variance between fitted expiries (flat-vol extrapolation outside)
+        k, t = np.broadcast_arrays(np.asarray(k, dtype=float), np.asarray(t, dtype=float))
+        ts = self.maturities
+        slices = np.stack([total_variance(k, p) for p in self.params])
+        hi = np.clip(np.searchsorted(ts, t), 1, len(ts) - 1) if len(ts) > 1 else np.zeros(t.shape, dtype=int)
+        lo = np.maximum(hi - 1, 0)
+        grid = np.indices(k.shape)
+        w_lo = slices[(lo, *grid)]
+        w_hi = slices[(hi, *grid)]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frac = np.where(ts[hi] > ts[lo], (t - ts[lo]) / (ts[hi] - ts[lo]), 0.0)
+        w = w_lo + np.clip(frac, 0, 1) * (w_hi - w_lo)
+        # Outside the fitted expiries keep the nearest slice's implied vol
+        w = np.where(t < ts[0], slices[0] * t / ts[0], w)
+        return np.where(t > ts[-1], slices[-1] * t / ts[-1], w)
+
+    def implied_vol(self, k, t):
+        t = np.asarray(t, dtype=float)
+        return np.sqrt(np.maximum(self.total_variance(k, t), 0.0) / np.maximum(t, 1e-12))
+
+    def implied_vol_moneyness(self, moneyness, t):
+        # Surface against K/S0, like the smile axes (forward drift interpolated by expiry)
+        t = np.asarray(t, dtype=float)
+        if self.forwards is None or self.spot is None:
+            k = np.log(moneyness)
+        else:
+            carry = np.log(self.forwards / self.spot) / self.maturities
+            k = np.log(moneyness) - np.interp(t, self.maturities, carry) * t
+        return self.implied_vol(k, t)
+
+    def to_dict(self):
+        return {
+            "version": CACHE_VERSION,
+            "maturities": self.maturities.tolist(),
+            "params": self.params.tolist(),
+            "forwards": None if self.forwards is None else self.forwards.tolist(),
+            "spot": self.spot,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["maturities"], data["params"], data.get("forwards"), data.get("spot"))
+
+
+def chain_key(chain, min_quotes=5):
+    # min_quotes decides which expiries get a slice, so it is part of the fit
+    digest = hashlib.sha256(f"svi-v{CACHE_VERSION}-min{min_quotes}".encode())
+    for array in (chain.spot, chain.strike, chain.maturity, chain.price, chain.is_call, chain.rate, chain.dividend):
+        data = np.ascontiguousarray(array)
+        digest.update(str(data.dtype).encode())
+        digest.update(data.tobytes())
+    return digest.hexdigest()
+
+
+def _slices(chain, min_quotes):
+    # (expiry, forward, k, w, weights) per expiry with enough solved quotes
+    vols = chain.implied_vols()
+    forward = chain.forward
+    otm = np.where(chain.is_call, chain.strike >= forward, chain.strike < forward)
+    for expiry in chain.maturities():
+        mask = (chain.maturity == expiry) & np.isfinite(vols) & otm
+        if mask.sum() < min_quotes:
+            continue
+        k = np.log(chain.strike[mask] / forward[mask])
+        order = np.argsort(k)
+        w = (vols[mask] ** 2 * expiry)[order]
+        # Near-the-money quotes matter most; the far wings only shape the asymptotes
+        weights = 1 / np.sqrt(1 + (k[order] / 0.2) ** 2)
+        yield expiry, float(np.median(forward[mask])), k[order], w, weights
+
+
+def calibrate(chain, min_quotes=5, cache=True, cache_dir=CACHE_DIR):
+    cache_dir = Path(cache_dir)
+    path = cache_dir / f"{chain_key(chain, min_quotes)}.json"
+    if cache and path.exists():
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == CACHE_VERSION:
+            return SVISurface.from_dict(data)
+
+    maturities, forwards, fitted = [], [], []
+    previous = None
+    for expiry, forward, k, w, weights in _slices(chain, min_quotes):
+        params, _ = fit_slice(k, w, weights, x0=previous)
+        maturities.append(expiry)
+        forwards.append(forward)
+        fitted.append(params)
+        previous = params
+    if not fitted:
+        raise ValueError("No expiry has enough solved quotes for an SVI fit")
+    surface = SVISurface(maturities, fitted, forwards, float(np.median(chain.spot)))
+
+    if cache:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write next to the target and rename so readers never see half a file
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(surface.to_dict(), f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    return surface
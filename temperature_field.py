@@ -0,0 +1,291 @@
+import argparse
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+
+from roots import refine
+
+# Antipodal equal-temperature points for the IVT scene's Earth claim.
+# A field is temperatures (C) on a lat/lon grid, latitudes south to north and
+# longitudes wrapping round once, read bilinearly anywhere on the sphere. For a
+# point p, g(p) = T(p) - T(-p) satisfies g(-p) = -g(p), so along any great
+# circle g changes sign between t = 0 and t = pi (p and its antipode) and the
+# IVT gives a t where T(p) = T(-p). Every circle's half is sampled in one
+# (circles, samples) pass, each sign change becomes a bracket, and all the
+# brackets are narrowed together with roots.refine.
+#
+# Fields come from synthetic_field (zonal mean, a summer tilt and smooth random
+# warm/cold patches, all broadcast on the grid) or load_field: .npy (a
+# (lat, lon) array on a regular global grid, south to north unless the lat
+# axis or north_first says otherwise), .npz (lat, lon, temperature) or NetCDF
+# (needs netCDF4 or xarray). CALC4DUMB_TEMPERATURE_FILE points the scene at a
+# file instead of the synthetic field; CALC4DUMB_TEMPERATURE_NORTH_FIRST=1
+# says a .npy file's first row is the north pole.
+#
+# Benchmark: python temperature_field.py --resolution 1 --circles 2000
+
+FIELD_ENV = "CALC4DUMB_TEMPERATURE_FILE"
+NORTH_FIRST_ENV = "CALC4DUMB_TEMPERATURE_NORTH_FIRST"
+# Names tried, in order, when reading .npz and NetCDF files
+LAT_NAMES = ("lat", "latitude", "y")
+LON_NAMES = ("lon", "longitude", "x")
+TEMPERATURE_NAMES = ("temperature", "t2m", "tas", "air", "t", "temp", "sst")
+
+
+def to_unit(lat, lon):
+    # Degrees -> (..., 3) unit vectors, z through the north pole
+    lat, lon = np.broadcast_arrays(np.radians(lat), np.radians(lon))
+    return np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def to_lat_lon(points):
+    # (..., 3) vectors -> latitude, longitude in degrees, longitude in [-180, 180]
+    x, y, z = points[..., 0], points[..., 1], points[..., 2]
+    return np.degrees(np.arctan2(z, np.hypot(x, y))), np.degrees(np.arctan2(y, x))
+
+
+class TemperatureField:
+    def __init__(self, lat, lon, temperature, source="synthetic"):
+        self.source = source  # "synthetic" or the file it was read from
+        self.lat = np.asarray(lat, dtype=float)  # ascending, degrees
+        self.lon = np.asarray(lon, dtype=float)  # ascending, spanning under 360 degrees
+        self.temperature = np.asarray(temperature, dtype=float).reshape(len(self.lat), len(self.lon))
+        # Longitude wraps: repeat the first column one turn later
+        self._lon = np.append(self.lon, self.lon[0] + 360)
+        self._values = np.concatenate([self.temperature, self.temperature[:, :1]], axis=1)
+
+    def at(self, lat, lon):
+        # Bilinear temperature at any (broadcast) lat/lon in degrees
+        lat, lon = np.broadcast_arrays(np.asarray(lat, dtype=float), np.asarray(lon, dtype=float))
+        row = np.interp(lat, self.lat, np.arange(len(self.lat)))
+        col = np.interp((lon - self.lon[0]) % 360 + self.lon[0], self._lon, np.arange(len(self._lon)))
+        r0 = np.minimum(row.astype(int), len(self.lat) - 2)
+        c0 = np.minimum(col.astype(int), len(self._lon) - 2)
+        fr, fc = row - r0, col - c0
+        v = self._values
+        return ((1 - fr) * ((1 - fc) * v[r0, c0] + fc * v[r0, c0 + 1])
+                + fr * ((1 - fc) * v[r0 + 1, c0] + fc * v[r0 + 1, c0 + 1]))
+
+    def at_points(self, points):
+        return self.at(*to_lat_lon(np.asarray(points, dtype=float)))
+
+    def antipodal_gap(self, points):
+        # g(p) = T(p) - T(-p)
+        points = np.asarray(points, dtype=float)
+        return self.at_points(points) - self.at_points(-points)
+
+    def coarsen(self, step):
+        # Every step-th row and column, keeping both poles' rows if present
+        rows = np.arange(0, len(self.lat), step)
+        if rows[-1] != len(self.lat) - 1:
+            rows = np.append(rows, len(self.lat) - 1)
+        cols = np.arange(0, len(self.lon), step)
+        return TemperatureField(self.lat[rows], self.lon[cols], self.temperature[np.ix_(rows, cols)], self.source)
+
+
+def synthetic_field(resolution=1.0, seed=0, n_patches=40, summer_tilt=8.0):
+    # Global grid at resolution degrees, poles included: warm equator, cold
+    # poles, the north in summer, plus smooth patches of +-8 C (von Mises-Fisher
+    # bumps round random centres) so the isotherms wander like real ones
+    lat = np.linspace(-90, 90, int(round(180 / resolution)) + 1)
+    lon = np.linspace(-180, 180, int(round(360 / resolution)), endpoint=False)
+    points = to_unit(lat[:, None], lon[None, :])
+    sin_lat = points[..., 2]
+    temperature = -25 + 52 * (1 - sin_lat ** 2) + summer_tilt * sin_lat
+
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(n_patches, 3))
+    centres /= np.linalg.norm(centres, axis=1, keepdims=True)
+    sharpness = rng.uniform(4, 20, n_patches)
+    strength = rng.uniform(-8, 8, n_patches)
+    # (lat, lon, patches) in one product; a 1 degree grid is 2.6M entries at 40 patches
+    closeness = np.einsum("ijk,pk->ijp", points, centres)
+    temperature += (strength * np.exp(sharpness * (closeness - 1))).sum(axis=-1)
+    return TemperatureField(lat, lon, temperature)
+
+
+def _pick(names, candidates, what, path):
+    lowered = {name.lower(): name for name in names}
+    for candidate in candidates:
+        if candidate in lowered:
+            return lowered[candidate]
+    raise ValueError(f"{path}: no {what} variable (tried {', '.join(candidates)})")
+
+
+def _read_netcdf(path):
+    # (lat, lon, temperature) from the first time/level of a NetCDF variable
+    try:
+        import netCDF4
+    except ImportError:
+        try:
+            import xarray
+        except ImportError as e:
+            raise ImportError("Reading NetCDF temperature fields needs netCDF4 or xarray") from e
+        with xarray.open_dataset(path) as data:
+            names = list(data.variables)
+            lat = data[_pick(names, LAT_NAMES, "latitude", path)].values
+            lon = data[_pick(names, LON_NAMES, "longitude", path)].values
+            values = data[_pick(names, TEMPERATURE_NAMES, "temperature", path)].values
+    else:
+        with netCDF4.Dataset(path) as data:
+            names = list(data.variables)
+            lat = data.variables[_pick(names, LAT_NAMES, "latitude", path)][:]
+            lon = data.variables[_pick(names, LON_NAMES, "longitude", path)][:]
+            values = np.ma.filled(data.variables[_pick(names, TEMPERATURE_NAMES, "temperature", path)][:], np.nan)
+    values = np.asarray(values, dtype=float)
+    return np.asarray(lat, dtype=float), np.asarray(lon, dtype=float), values.reshape((-1,) + values.shape[-2:])[0]
+
+
+def load_field(path, lat=None, lon=None, north_first=False):
+    # lat, lon, north_first only apply to .npy, which carries no axes of its
+    # own: the grid's latitudes and longitudes, or else a regular global grid
+    # from the south pole up (north_first: from the north pole down)
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".npy":
+        temperature = np.load(path)
+        if lat is None:
+            lat = np.linspace(-90, 90, temperature.shape[0])
+            if north_first:
+                lat = lat[::-1]
+        if lon is None:
+            lon = np.linspace(-180, 180, temperature.shape[1], endpoint=False)
+        lat, lon = np.asarray(lat, dtype=float), np.asarray(lon, dtype=float)
+        if temperature.shape != (len(lat), len(lon)):
+            raise ValueError(f"{path}: temperature is {temperature.shape}, lat/lon give ({len(lat)}, {len(lon)})")
+    elif suffix == ".npz":
+        with np.load(path) as data:
+            names = list(data.files)
+            lat = data[_pick(names, LAT_NAMES, "latitude", path)]
+            lon = data[_pick(names, LON_NAMES, "longitude", path)]
+            temperature = data[_pick(names, TEMPERATURE_NAMES, "temperature", path)]
+    elif suffix in (".nc", ".nc4", ".netcdf"):
+        lat, lon, temperature = _read_netcdf(path)
+    else:
+        raise ValueError(f"{path}: expected .npy, .npz or NetCDF")
+
+    temperature = np.asarray(temperature, dtype=float)
+    # Kelvin -> Celsius; land/sea masks and gaps -> the latitude's mean
+    if np.nanmean(temperature) > 150:
+        temperature = temperature - 273.15
+    gaps = ~np.isfinite(temperature)
+    if gaps.any():
+        temperature = np.where(gaps, np.nanmean(temperature, axis=1, keepdims=True), temperature)
+    # South to north, longitudes in [-180, 180) ascending
+    lat_order = np.argsort(lat)
+    lon = (np.asarray(lon, dtype=float) + 180) % 360 - 180
+    lon_order = np.argsort(lon)
+    return TemperatureField(lat[lat_order], lon[lon_order], temperature[np.ix_(lat_order, lon_order)], str(path))
+
+
+def default_field(resolution=1.0, seed=0):
+    path = os.environ.get(FIELD_ENV)
+    if not path:
+        return synthetic_field(resolution, seed)
+    return load_field(path, north_first=os.environ.get(NORTH_FIRST_ENV, "") not in ("", "0"))
+
+
+def fibonacci_normals(n):
+    # n roughly even directions over the upper hemisphere (a normal and its
+    # negative give the same circle)
+    i = np.arange(n) + 0.5
+    z = i / n
+    angle = np.pi * (1 + 5 ** 0.5) * i
+    r = np.sqrt(1 - z * z)
+    return np.stack([r * np.cos(angle), r * np.sin(angle), z], axis=1)
+
+
+def great_circle_basis(normals):
+    # Orthonormal (u, v) spanning each normal's great circle: p(t) = cos t u + sin t v
+    normals = np.asarray(normals, dtype=float).reshape(-1, 3)
+    normals = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+    # Any axis not parallel to the normal, crossed in
+    helper = np.where(np.abs(normals[:, 2:3]) < 0.9, [[0.0, 0.0, 1.0]], [[1.0, 0.0, 0.0]])
+    u = np.cross(normals, helper)
+    u /= np.linalg.norm(u, axis=1, keepdims=True)
+    return u, np.cross(normals, u)
+
+
+class AntipodalPairs:
+    def __init__(self, points, temperatures, circles, t, n_circles):
+        self.points = points  # (n, 3) unit vectors p with T(p) = T(-p); the partner is -p
+        self.temperatures = temperatures
+        self.circles = circles  # which great circle each pair was found on
+        self.t = t  # angle along that circle, in [0, pi)
+        self.n_circles = n_circles
+
+    def on_circle(self, circle):
+        return self.points[self.circles == circle]
+
+
+def antipodal_pairs(field, normals=None, n_circles=360, n_samples=721, xtol=1e-10):
+    # Equal-temperature antipodes on each great circle (default: n_circles spread
+    # evenly). g is odd under t -> t + pi, so only t in [0, pi] is sampled; a
+    # zero at t = pi is the t = 0 pair seen from the other side and is skipped
+    u, v = great_circle_basis(fibonacci_normals(n_circles) if normals is None else normals)
+    n_circles = len(u)
+    t = np.linspace(0, np.pi, n_samples)
+    along = lambda angle, which: (np.cos(angle)[..., None] * u[which] + np.sin(angle)[..., None] * v[which])
+    circle_index = np.arange(n_circles)[:, None]
+    g = field.antipodal_gap(along(t[None, :], circle_index))
+
+    circles, cells = np.nonzero(g[:, :-1] * g[:, 1:] < 0)
+    exact_circles, exact_cells = np.nonzero(g[:, :-1] == 0)
+    found = refine(lambda angle, which: field.antipodal_gap(along(angle, circles[which])),
+                   t[cells], t[cells + 1], g[circles, cells], g[circles, cells + 1], xtol)
+
+    circles = np.concatenate([circles, exact_circles])
+    found = np.concatenate([found, t[exact_cells]])
+    order = np.lexsort((found, circles))
+    circles, found = circles[order], found[order]
+    points = along(found, circles)
+    return AntipodalPairs(points, field.at_points(points), circles, found, n_circles)
+
+
+def benchmark(resolution, n_circles, n_samples):
+    t0 = time.perf_counter()
+    field = synthetic_field(resolution)
+    built = time.perf_counter() - t0
+    print(f"{len(field.lat)}x{len(field.lon)} field ({resolution:g} degree) built in {built * 1000:.0f} ms, "
+          f"{field.temperature.min():.1f} to {field.temperature.max():.1f} C")
+
+    t0 = time.perf_counter()
+    pairs = antipodal_pairs(field, n_circles=n_circles, n_samples=n_samples)
+    elapsed = time.perf_counter() - t0
+    per_circle = np.bincount(pairs.circles, minlength=n_circles)
+    gap = np.abs(field.antipodal_gap(pairs.points))
+    print(f"  {n_circles:,} great circles x {n_samples} samples: {len(pairs.points):,} antipodal pairs "
+          f"in {elapsed * 1000:.0f} ms ({elapsed / n_circles * 1e6:.0f} us/circle)")
+    print(f"  pairs per circle {per_circle.min()}-{per_circle.max()} (every circle has one: {per_circle.min() >= 1}), "
+          f"max |T(p) - T(-p)| {gap.max():.1e} C")
+
+    # The same search one circle at a time, for comparison
+    picks = np.arange(0, n_circles, max(n_circles // 50, 1))
+    u, v = great_circle_basis(fibonacci_normals(n_circles))
+    t = np.linspace(0, np.pi, n_samples)
+    t0 = time.perf_counter()
+    for c in picks:
+        gc = field.antipodal_gap(np.cos(t)[:, None] * u[c] + np.sin(t)[:, None] * v[c])
+        for j in np.nonzero(gc[:-1] * gc[1:] < 0)[0]:
+            a, b = t[j], t[j + 1]
+            ga = gc[j]
+            for _ in range(40):
+                m = 0.5 * (a + b)
+                gm = field.antipodal_gap(np.cos(m) * u[c] + np.sin(m) * v[c])
+                if gm * ga > 0:
+                    a, ga = m, gm
+                else:
+                    b = m
+    loop = (time.perf_counter() - t0) / len(picks)
+    print(f"  circle-by-circle scalar bisection: {loop * 1e6:.0f} us/circle ({loop * n_circles / elapsed:.0f}x slower)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Antipodal equal-temperature search benchmark")
+    parser.add_argument("--resolution", type=float, default=1.0)
+    parser.add_argument("--circles", type=int, default=2000)
+    parser.add_argument("--samples", type=int, default=721)
+    args = parser.parse_args()
+    benchmark(args.resolution, args.circles, args.samples)
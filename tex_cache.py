@@ -0,0 +1,237 @@
+import copy
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+# Content-addressed store of compiled LaTeX SVGs shared by every scene and
+# every render process. Call install() before building any MathTex/Tex.
+
+CACHE_DIR = Path(os.environ.get("CALC4DUMB_TEX_CACHE_DIR", Path.home() / ".cache" / "calc4dumb" / "tex"))
+MAX_BYTES = int(float(os.environ.get("CALC4DUMB_TEX_CACHE_MB", "256")) * 1024 * 1024)
+EVICT_EVERY = 32  # puts between size checks
+BATCH_PAGE_ENV = "calcpage"
+
+
+class TexCache:
+    def __init__(self, root=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.batched = 0
+        self._puts = 0
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def key(self, expression, environment=None, tex_template=None):
+        # The SVG only depends on what LaTeX sees; font_size is applied as a
+        # scale afterwards, so it is deliberately not part of the key
+        digest = hashlib.sha256()
+        parts = [environment or "", expression]
+        if tex_template is not None:
+            parts = [tex_template.body, tex_template.tex_compiler, tex_template.output_format] + parts
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def path_for(self, key):
+        return self.root / key[:2] / f"{key}.svg"
+
+    def get(self, key):
+        path = self.path_for(key)
+        try:
+            # mtime doubles as the LRU clock, so a hit refreshes the entry
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def put(self, key, svg_file):
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write next to the target and rename so readers never see half a file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as dst, open(svg_file, "rb") as src:
+                shutil.copyfileobj(src, dst)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        self._puts += 1
+        if self._puts % EVICT_EVERY == 0:
+            self.evict()
+        return path
+
+    def _entries(self):
+        entries = []
+        for path in self.root.glob("*/*.svg"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue  # evicted by another process
+            entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def evict(self):
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return 0
+        # Trim to 90% so we don't rescan on every put right at the limit
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        self.evictions += removed
+        return removed
+
+    def stats(self):
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "batched": self.batched,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+        }
+
+
+_cache = None
+_original_tex_to_svg_file = None
+
+
+def get_cache():
+    global _cache
+    if _cache is None:
+        _cache = TexCache()
+    return _cache
+
+
+def cached_tex_to_svg_file(expression, environment=None, tex_template=None):
+    from manim import config
+
+    if tex_template is None:
+        tex_template = config.tex_template
+    cache = get_cache()
+    key = cache.key(expression, environment, tex_template)
+    path = cache.get(key)
+    if path is not None:
+        return path
+    svg_file = _original_tex_to_svg_file(expression, environment=environment, tex_template=tex_template)
+    return cache.put(key, svg_file)
+
+
+def install():
+    # Route manim's LaTeX -> SVG step through the shared cache (idempotent)
+    global _original_tex_to_svg_file
+    if _original_tex_to_svg_file is not None:
+        return get_cache()
+
+    import manim.mobject.text.tex_mobject as tex_mobject
+    import manim.utils.tex_file_writing as tex_file_writing
+
+    _original_tex_to_svg_file = tex_file_writing.tex_to_svg_file
+    tex_file_writing.tex_to_svg_file = cached_tex_to_svg_file
+    tex_mobject.tex_to_svg_file = cached_tex_to_svg_file
+    return get_cache()
+
+
+def _batch_template(tex_template):
+    # Same preamble, but standalone's multi mode turns every calcpage
+    # environment into its own page
+    documentclass = getattr(tex_template, "documentclass", "").strip()
+    match = re.match(r"\\documentclass(?:\[(.*?)\])?\{standalone\}", documentclass)
+    if match is None:
+        return None
+    options = [opt for opt in (match.group(1) or "").split(",") if opt.strip()]
+    batch_template = copy.deepcopy(tex_template)
+    batch_template.documentclass = rf"\documentclass[{','.join(options + ['multi'])}]{{standalone}}"
+    batch_template.add_to_preamble(
+        rf"\newenvironment{{{BATCH_PAGE_ENV}}}{{}}{{}}" + "\n" + rf"\standaloneenv{{{BATCH_PAGE_ENV}}}"
+    )
+    return batch_template
+
+
+def _split_pages(dvi_file, output_format, count):
+    # One dvisvgm run writes every page as <stem>-<page>.svg
+    stem = dvi_file.with_suffix("")
+    commands = [
+        "dvisvgm",
+        *(["--pdf"] if output_format == ".pdf" else []),
+        f"--page=1-{count}",
+        "--no-fonts",
+        "--verbosity=0",
+        f"--output={stem.as_posix()}-%p.svg",
+        dvi_file.as_posix(),
+    ]
+    subprocess.run(commands, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    pages = sorted(
+        dvi_file.parent.glob(f"{stem.name}-*.svg"),
+        key=lambda p: int(p.stem.rsplit("-", 1)[1]),
+    )
+    return pages if len(pages) == count else None
+
+
+def compile_batch(expressions, environment="align*", tex_template=None):
+    # Compile every expression that isn't cached yet as one multi-page
+    # document: one LaTeX run and one dvisvgm run instead of one of each per
+    # expression. Any failure just leaves the misses to the normal per-MathTex
+    # path, so a bad expression still gets manim's usual error message.
+    from manim import config
+    from manim.utils.tex_file_writing import compile_tex
+
+    install()
+    if tex_template is None:
+        tex_template = config.tex_template
+    cache = get_cache()
+
+    pending = {}
+    for expression in expressions:
+        expression = expression.strip()
+        key = cache.key(expression, environment, tex_template)
+        if key not in pending and not cache.path_for(key).exists():
+            pending[key] = expression
+    if len(pending) < 2:
+        return 0
+
+    batch_template = _batch_template(tex_template)
+    if batch_template is None:
+        return 0
+    pages = "\n".join(
+        rf"\begin{{{BATCH_PAGE_ENV}}}\begin{{{environment}}}" + "\n" + expression + "\n"
+        + rf"\end{{{environment}}}\end{{{BATCH_PAGE_ENV}}}"
+        for expression in pending.values()
+    )
+    source = batch_template.get_texcode_for_expression(pages)
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+    tex_file = Path(config.get_dir("tex_dir")) / f"batch_{digest}.tex"
+    tex_file.parent.mkdir(parents=True, exist_ok=True)
+    tex_file.write_text(source, encoding="utf-8")
+
+    try:
+        dvi_file = compile_tex(tex_file, tex_template.tex_compiler, tex_template.output_format)
+        page_files = _split_pages(Path(dvi_file), tex_template.output_format, len(pending))
+    except Exception:
+        return 0
+    if page_files is None:
+        return 0
+
+    for key, page_file in zip(pending, page_files):
+        cache.put(key, page_file)
+        page_file.unlink(missing_ok=True)
+    cache.batched += len(pending)
+    return len(pending)
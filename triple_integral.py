@@ -1,7 +1,9 @@
 from manim import *
 import numpy as np
 
-TESTING = True  # Toggle for fast render
+from box_field import GrowBoxes
+from quality_profile import QUALITY
+from riemann import RiemannPrisms
 
 class TripleIntegralApprox(ThreeDScene):
     def construct(self):
@@ -27,26 +29,22 @@ class TripleIntegralApprox(ThreeDScene):
             lambda u, v: axes.c2p(u, v, func(u, v)),
             u_range=[-PI, PI],
             v_range=[-PI, PI],
-            resolution=(10, 10) if TESTING else (30, 30),
+            resolution=QUALITY.resolution((30, 30)),
             fill_opacity=0.4,
             checkerboard_colors=[BLUE_D, BLUE_E],
         ).shift(graph_shift)
         self.add(surface)
 
-        dx = dy = PI / 4 if TESTING else PI / 6
-        x_vals = np.arange(-PI, PI, dx)
-        y_vals = np.arange(-PI, PI, dy)
-        boxes = VGroup()
-
-        for x in x_vals:
-            for y in y_vals:
-                z = func(x + dx / 2, y + dy / 2)
-                cube = Cube(side_length=1).scale([dx, dy, z])
-                cube.move_to(axes.c2p(x + dx / 2, y + dy / 2, z / 2))
-                cube.shift(graph_shift)
-                cube.set_fill(ORANGE, opacity=1.0 if TESTING else 0.6)
-                cube.set_stroke(width=0 if TESTING else 0.5, color=BLACK)
-                boxes.add(cube)
+        # One prism per cell under its midpoint, every cell in one NumPy call
+        boxes = RiemannPrisms(
+            axes, func, [-PI, PI], [-PI, PI],
+            resolution=QUALITY.cell_count(12),
+            rule="midpoint",
+            colors=ORANGE,
+            fill_opacity=0.6 if QUALITY.box_detail else 1.0,
+            stroke_color=BLACK,
+            stroke_width=0.5 if QUALITY.box_detail else 0,
+        ).shift(graph_shift)
 
         # Title and watermark at top
         title = Text("Triple Integral Approximation").scale(0.7).to_edge(UP, buff=0.1)
@@ -58,7 +56,12 @@ class TripleIntegralApprox(ThreeDScene):
         self.add_fixed_in_frame_mobjects(title, watermark, function_tex)
         self.play(Write(title), Write(watermark), Write(function_tex))
 
-        self.play(LaggedStart(*[GrowFromCenter(box) for box in boxes], lag_ratio=0.03, run_time=4 if not TESTING else 1))
+        self.play(GrowBoxes(boxes, lag_ratio=0.03, run_time=QUALITY.lagged_time(4)))
+
+        # Numeric sum next to the exact value
+        sum_label = boxes.get_sum_label(exact=8 * PI**2, font_size=24).next_to(function_tex, DOWN, buff=0.15)
+        self.add_fixed_in_frame_mobjects(sum_label)
+        self.play(Write(sum_label))
         self.wait(1)
 
         # Fixed-position solving steps (always readable)
@@ -1,12 +1,12 @@
 from manim import *
 
-class USubstitutionTikTok(Scene):
-    def construct(self):
-        # Title and watermark (persistent)
-        title = Text("U-Substitution Method", font_size=48, color=BLUE).to_edge(UP)
-        watermark = Text("@calc4dumb", font_size=24, color=GREY).next_to(title, DOWN, buff=0.1)
-        self.add(title, watermark)
+from step_scene import Step, StepSequenceScene
 
+class USubstitutionTikTok(StepSequenceScene):
+    title_text = "U-Substitution Method"
+    step_font_size = 44
+
+    def construct_visual(self):
         # Small visual on bottom left - transformation concept
         axes = Axes(
             x_range=[-2, 4, 1],
@@ -28,58 +28,37 @@ class USubstitutionTikTok(Scene):
         
         self.play(Create(axes), Write(x_label), Write(u_label))
         self.play(Create(complex_curve))
-        
-        # Steps to show
-        steps = [
-            r"\int 2x(x^2 + 1)^3 \, dx",
-            r"\text{Step 1: Choose } u = x^2 + 1",
-            r"\text{Step 2: Find } du = 2x \, dx",
-            r"\text{Step 3: Substitute}",
-            r"\int u^3 \, du",
-            r"\text{Step 4: Integrate}",
-            r"\frac{u^4}{4} + C",
-            r"\text{Step 5: Back-substitute}",
-            r"\frac{(x^2 + 1)^4}{4} + C",
-        ]
 
-        # Create first step centered below watermark/title
-        step_text = MathTex(steps[0], font_size=44, color=BLUE).next_to(watermark, DOWN, buff=1)
-        self.play(Write(step_text))
-        self.wait(1.5)
+        # Kept for the step hooks
+        self.complex_curve = complex_curve
+        self.simple_curve = simple_curve
+        self.original_curve = complex_curve.copy()
 
-        # Iterate through remaining steps
-        for i in range(1, len(steps)):
-            # Special colors for different types of steps
-            if "Choose" in steps[i] or "Find" in steps[i]:
-                new_color = YELLOW
-            elif "Substitute" in steps[i] or "Back-substitute" in steps[i]:
-                new_color = ORANGE
-            elif "Integrate" in steps[i]:
-                new_color = PURPLE
-            elif i == len(steps) - 1:  # Final answer
-                new_color = GREEN
-            else:
-                new_color = WHITE
+    def show_substitution(self):
+        # Show the substitution transformation: complicated curve -> simple curve
+        self.play(Transform(self.complex_curve, self.simple_curve), run_time=1.5)
 
-            new_step = MathTex(steps[i], font_size=44, color=new_color).next_to(watermark, DOWN, buff=1)
-            self.play(Transform(step_text, new_step))
-            
-            # Special animations for key steps
-            if i == 4:  # Show the substitution transformation
-                self.play(Transform(original_curve, transformed_curve), run_time=1.5)
-            elif i == 7:  # Back-substitution - transform back
-                self.play(Transform(original_curve, transformed_curve), run_time=1.5)
-            
-            # Timing adjustments
-            if i == 1 or i == 2 or i == 4 or i == 7:  # Key conceptual steps
-                self.wait(2)
-            elif i == len(steps) - 1:  # Final answer
-                self.wait(1.5)
-            else:
-                self.wait(1.8)
+    def show_back_substitution(self):
+        # Back-substitution - transform back
+        self.play(Transform(self.complex_curve, self.original_curve), run_time=1.5)
+
+    def get_steps(self):
+        # Steps to show; longer pauses on the key conceptual steps
+        return [
+            Step(r"\int 2x(x^2 + 1)^3 \, dx", color=BLUE, hold=1.5),
+            Step(r"\text{Step 1: Choose } u = x^2 + 1", color=YELLOW, hold=2),
+            Step(r"\text{Step 2: Find } du = 2x \, dx", color=YELLOW, hold=2),
+            Step(r"\text{Step 3: Substitute}", color=ORANGE, hold=1.8),
+            Step(r"\int u^3 \, du", hook=self.show_substitution, hold=2),
+            Step(r"\text{Step 4: Integrate}", color=PURPLE, hold=1.8),
+            Step(r"\frac{u^4}{4} + C", hold=1.8),
+            Step(r"\text{Step 5: Back-substitute}", color=ORANGE, hook=self.show_back_substitution, hold=2),
+            Step(r"\frac{(x^2 + 1)^4}{4} + C", color=GREEN, hold=1.5),
+        ]
 
+    def construct_finale(self):
         # Highlight final answer with animated box
-        box = SurroundingRectangle(step_text, color=GREEN, buff=0.3)
+        box = SurroundingRectangle(self.step_text, color=GREEN, buff=0.3)
         self.play(Create(box))
         self.wait(0.5)
 
@@ -91,4 +70,4 @@ class USubstitutionTikTok(Scene):
         # Quick reminder of the strategy
         strategy_text = Text("Look for function & its derivative!", font_size=32, color=YELLOW).next_to(end_text, UP, buff=0.3)
         self.play(FadeIn(strategy_text))
-        self.wait(1)
\ No newline at end of file
+        self.wait(1)
@@ -1,6 +1,12 @@
 from manim import *
 import numpy as np
 
+from curve_utils import coords_to_points, smooth_curve
+from grid_surface import GridSurface
+from implied_vol import default_chain
+from quality_profile import QUALITY
+from svi import calibrate
+
 class VolatilitySmileTikTok(Scene):
     def construct(self):
         # Title and watermark (persistent)
@@ -65,20 +71,27 @@ class VolatilitySmileTikTok(Scene):
         new_step = MathTex(steps[4], font_size=38, color=PURPLE).next_to(watermark, DOWN, buff=1)
         self.play(Transform(step_text, new_step))
 
-        # Realistic volatility smile (U-shaped, higher at extremes)
-        def realistic_smile(x):
-            # Typical equity smile - higher vol for OTM puts and calls
-            return 0.20 + 0.15 * (x - 1)**2 + 0.05 * (x - 1)**4
+        # Market smile: implied vols solved from the option chain (data/option_chain.csv,
+        # CALC4DUMB_OPTION_CHAIN, or a synthetic chain), three-month expiry
+        chain = default_chain()
+        smile_x, smile_iv = chain.smile(0.25)
+        in_view = (smile_x >= 0.8) & (smile_x <= 1.2)
+        smile_x, smile_iv = smile_x[in_view], np.clip(smile_iv[in_view], 0.15, 0.35)
 
-        smile_curve = axes.plot(realistic_smile, x_range=[0.8, 1.2], color=PURPLE, stroke_width=6)
-        smile_glow = axes.plot(realistic_smile, x_range=[0.8, 1.2], color=PURPLE, stroke_width=12)
+        smile_curve = smooth_curve(axes, smile_x, smile_iv, color=PURPLE, stroke_width=6)
+        smile_glow = smooth_curve(axes, smile_x, smile_iv, color=PURPLE, stroke_width=QUALITY.glow_width(12))
         smile_glow.set_stroke(opacity=0.3)
-        
-        smile_label = Text("Market Data", font_size=16, color=PURPLE).next_to(axes.c2p(1, realistic_smile(1)), UP, buff=0.25)
-        
+        quote_dots = VGroup(*[
+            Dot(point, radius=0.03, color=PURPLE) for point in coords_to_points(axes, smile_x, smile_iv)
+        ])
+
+        atm = np.argmin(np.abs(smile_x - 1))
+        smile_label = Text("Market Data", font_size=16, color=PURPLE).next_to(axes.c2p(smile_x[atm], smile_iv[atm]), UP, buff=0.25)
+
         self.play(
             Create(smile_glow),
             Create(smile_curve, run_time=2),
+            FadeIn(quote_dots, lag_ratio=0.1),
             Write(smile_label)
         )
         self.wait(1.4)
@@ -145,11 +158,73 @@ class VolatilitySmileTikTok(Scene):
         # Final emphasis on the smile
         self.play(
             smile_curve.animate.set_stroke(width=8, color=GOLD),
-            smile_glow.animate.set_stroke(width=18, color=GOLD, opacity=0.4)
+            smile_glow.animate.set_stroke(width=QUALITY.glow_width(18), color=GOLD, opacity=0.4)
         )
         
         # Create final frame
         key_elements = VGroup(step_text, axes, smile_curve, dist_axes, lognormal, empirical)
         final_box = SurroundingRectangle(key_elements, color=GOLD, buff=0.3)
         self.play(Create(final_box))
-        self.wait(1.8)
\ No newline at end of file
+        self.wait(1.8)
+
+
+class VolatilitySurfaceTikTok(ThreeDScene):
+    def construct(self):
+        # SVI fit of every expiry in the chain (cached by quote hash, so only the first render fits)
+        chain = default_chain()
+        svi_surface = calibrate(chain)
+
+        axes = ThreeDAxes(
+            x_range=[0.8, 1.2, 0.1],
+            y_range=[0, 2, 0.5],
+            z_range=[0.1, 0.4, 0.1],
+            x_length=5,
+            y_length=5,
+            z_length=3,
+        ).shift(DOWN * 0.6)
+        self.set_camera_orientation(phi=65 * DEGREES, theta=-60 * DEGREES, zoom=0.8)
+
+        # K/S0 x maturity grid, starting just past the first expiry the fit can vouch for
+        n = QUALITY.cell_count(40)
+        moneyness = np.linspace(0.8, 1.2, n + 1)
+        maturity = np.linspace(max(svi_surface.maturities[0], 0.05), 2.0, n + 1)
+        m_grid, t_grid = np.meshgrid(moneyness, maturity, indexing="ij")
+        ivs = np.clip(svi_surface.implied_vol_moneyness(m_grid, t_grid), 0.1, 0.4)
+        surface = GridSurface(axes, moneyness, maturity, ivs, z_range=(0.15, 0.3), fill_opacity=0.8)
+
+        # Solved OTM quotes (the ones the fit used) on top of the surface; flat Dots, since a
+        # Dot3D is a whole sphere of faces each
+        vols = chain.implied_vols()
+        otm = np.where(chain.is_call, chain.strike >= chain.forward, chain.strike < chain.forward)
+        shown = otm & np.isfinite(vols) & (chain.moneyness >= 0.8) & (chain.moneyness <= 1.2) & (chain.maturity <= 2)
+        quotes = VGroup(*[
+            Dot(point, radius=0.03, color=WHITE)
+            for point in coords_to_points(axes, chain.moneyness[shown], chain.maturity[shown], vols[shown])
+        ])
+
+        labels = VGroup(
+            MathTex("K/S_0", font_size=24).next_to(axes.x_axis, DOWN),
+            MathTex("T", font_size=24).next_to(axes.y_axis, RIGHT),
+            MathTex(r"\sigma_{impl}", font_size=24).next_to(axes.z_axis, UP),
+        )
+
+        title = Text("The Whole Volatility SURFACE", font_size=40, color=BLUE).to_edge(UP)
+        watermark = Text("@calc4dumb", font_size=24, color=GREY).next_to(title, DOWN, buff=0.1)
+        caption = MathTex(
+            r"w(k) = a + b\left(\rho (k - m) + \sqrt{(k - m)^2 + \sigma^2}\right)",
+            font_size=30, color=YELLOW,
+        ).to_edge(DOWN, buff=0.4)
+        self.add_fixed_in_frame_mobjects(title, watermark)
+
+        self.play(Create(axes), Write(labels), run_time=1.2)
+        self.play(FadeIn(quotes, lag_ratio=0.02), run_time=1.5)
+        self.add_fixed_in_frame_mobjects(caption)
+        self.play(Write(caption))
+        self.play(FadeIn(surface), run_time=1.5)
+        self.wait(1)
+
+        # Slow orbit: smile across strikes, term structure along T
+        self.begin_ambient_camera_rotation(rate=0.25)
+        self.wait(4)
+        self.stop_ambient_camera_rotation()
+        self.wait(1)
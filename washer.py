@@ -1,13 +1,13 @@
 from manim import *
 import numpy as np
 
-class WasherMethodTikTok(Scene):
-    def construct(self):
-        # Title and watermark (persistent)
-        title = Text("Washer Method: Volume with a Hole", font_size=48, color=BLUE).to_edge(UP)
-        watermark = Text("@calc4dumb", font_size=24, color=GREY).next_to(title, DOWN, buff=0.1)
-        self.add(title, watermark)
+from step_scene import Step, StepSequenceScene
 
+class WasherMethodTikTok(StepSequenceScene):
+    title_text = "Washer Method: Volume with a Hole"
+    step_font_size = 38
+
+    def construct_visual(self):
         # Smaller graph on bottom left
         axes = Axes(
             x_range=[0, 4, 1],
@@ -66,106 +66,89 @@ class WasherMethodTikTok(Scene):
         self.play(Create(rotation_arrow), Write(rotation_label))
         self.wait(0.7)
 
-        # Steps to show, centered below watermark/title
-        steps = [
-            r"V = \int_1^4 \pi [R(x)^2 - r(x)^2] \, dx",
-            r"\text{Step 1: Identify outer and inner radii}",
-            r"R(x) = \sqrt{x}, \quad r(x) = 1",
-            r"\text{Step 2: Set up washer method}",
-            r"V = \int_1^4 \pi [(\sqrt{x})^2 - 1^2] \, dx",
-            r"\text{Step 3: Simplify}",
-            r"V = \int_1^4 \pi (x - 1) \, dx",
-            r"\text{Step 4: Factor out } \pi",
-            r"V = \pi \int_1^4 (x - 1) \, dx",
-            r"\text{Step 5: Integrate}",
-            r"V = \pi \left[\frac{x^2}{2} - x\right]_1^4",
-            r"\text{Step 6: Evaluate}",
-            r"V = \pi \left[(8 - 4) - (\frac{1}{2} - 1)\right] = \frac{9\pi}{2}",
-        ]
+        # Kept for the step hooks
+        self.axes = axes
+        self.outer_graph = outer_graph
+        self.inner_graph = inner_graph
 
-        # Create first step centered below watermark/title
-        step_text = MathTex(steps[0], font_size=38, color=BLUE).next_to(watermark, DOWN, buff=1)
-        self.play(Write(step_text))
-        self.wait(0.7)
+    def highlight_radii(self):
+        # Highlight both curves
+        self.play(
+            self.outer_graph.animate.set_stroke(width=6, color=GOLD),
+            self.inner_graph.animate.set_stroke(width=6, color=RED),
+            run_time=0.7
+        )
+        self.play(
+            self.outer_graph.animate.set_stroke(width=4, color=YELLOW),
+            self.inner_graph.animate.set_stroke(width=4, color=ORANGE),
+            run_time=0.3
+        )
+
+    def show_sample_washer(self):
+        # Add a sample washer
+        axes = self.axes
+        sample_x = 2.5
+        outer_radius = np.sqrt(sample_x)
+        inner_radius = 1
+
+        # Create annulus (washer shape)
+        washer = Annulus(
+            inner_radius=inner_radius * 0.3,
+            outer_radius=outer_radius * 0.3,
+            color=PURPLE,
+            fill_opacity=0.4
+        )
+        washer.move_to(axes.c2p(sample_x, 0))
+
+        # Radius lines
+        outer_line = Line(
+            axes.c2p(sample_x, 0),
+            axes.c2p(sample_x, outer_radius),
+            color=PURPLE,
+            stroke_width=3
+        )
+        inner_line = Line(
+            axes.c2p(sample_x, 0),
+            axes.c2p(sample_x, inner_radius),
+            color=RED,
+            stroke_width=3
+        )
+
+        outer_r_label = MathTex("R(x)", font_size=20, color=PURPLE).next_to(outer_line, RIGHT)
+        inner_r_label = MathTex("r(x)", font_size=20, color=RED).next_to(inner_line, LEFT)
 
-        # Iterate through remaining steps
-        for i in range(1, len(steps)):
-            # Special colors for different types of steps
-            if "Step" in steps[i]:
-                new_color = ORANGE
-            elif i == len(steps) - 1:  # Final answer
-                new_color = GREEN
-            else:
-                new_color = WHITE
-
-            new_step = MathTex(steps[i], font_size=38, color=new_color).next_to(watermark, DOWN, buff=1)
-            self.play(Transform(step_text, new_step))
-            
-            # Special animations for key steps
-            if i == 2:  # Show radius functions
-                # Highlight both curves
-                self.play(
-                    outer_graph.animate.set_stroke(width=6, color=GOLD),
-                    inner_graph.animate.set_stroke(width=6, color=RED),
-                    run_time=0.7
-                )
-                self.play(
-                    outer_graph.animate.set_stroke(width=4, color=YELLOW),
-                    inner_graph.animate.set_stroke(width=4, color=ORANGE),
-                    run_time=0.3
-                )
-                self.wait(1)
-            elif i == 4:  # Set up washer method - show washer visualization
-                # Add a sample washer
-                sample_x = 2.5
-                outer_radius = outer_func(sample_x)
-                inner_radius = inner_func(sample_x)
-                
-                # Create annulus (washer shape)
-                washer = Annulus(
-                    inner_radius=inner_radius * 0.3, 
-                    outer_radius=outer_radius * 0.3, 
-                    color=PURPLE, 
-                    fill_opacity=0.4
-                )
-                washer.move_to(axes.c2p(sample_x, 0))
-                
-                # Radius lines
-                outer_line = Line(
-                    axes.c2p(sample_x, 0), 
-                    axes.c2p(sample_x, outer_radius), 
-                    color=PURPLE, 
-                    stroke_width=3
-                )
-                inner_line = Line(
-                    axes.c2p(sample_x, 0), 
-                    axes.c2p(sample_x, inner_radius), 
-                    color=RED, 
-                    stroke_width=3
-                )
-                
-                outer_r_label = MathTex("R(x)", font_size=20, color=PURPLE).next_to(outer_line, RIGHT)
-                inner_r_label = MathTex("r(x)", font_size=20, color=RED).next_to(inner_line, LEFT)
-                
-                self.play(
-                    Create(washer), 
-                    Create(outer_line), 
-                    Create(inner_line),
-                    Write(outer_r_label), 
-                    Write(inner_r_label)
-                )
-                self.wait(1)
-                self.play(FadeOut(washer), FadeOut(outer_line), FadeOut(inner_line), 
-                         FadeOut(outer_r_label), FadeOut(inner_r_label))
-            elif i == 10:  # Integration step
-                self.wait(1.3)
-            elif i == len(steps) - 1:  # Final answer
-                self.wait(1)
-            else:
-                self.wait(1.2)
+        self.play(
+            Create(washer),
+            Create(outer_line),
+            Create(inner_line),
+            Write(outer_r_label),
+            Write(inner_r_label)
+        )
+        self.wait(1)
+        self.play(FadeOut(washer), FadeOut(outer_line), FadeOut(inner_line),
+                  FadeOut(outer_r_label), FadeOut(inner_r_label))
 
+    def get_steps(self):
+        # Steps to show, centered below watermark/title
+        return [
+            Step(r"V = \int_1^4 \pi [R(x)^2 - r(x)^2] \, dx", color=BLUE, hold=0.7),
+            Step(r"\text{Step 1: Identify outer and inner radii}", color=ORANGE, hold=1.2),
+            Step(r"R(x) = \sqrt{x}, \quad r(x) = 1", hook=self.highlight_radii, hold=1),
+            Step(r"\text{Step 2: Set up washer method}", color=ORANGE, hold=1.2),
+            Step(r"V = \int_1^4 \pi [(\sqrt{x})^2 - 1^2] \, dx", hook=self.show_sample_washer, hold=0),
+            Step(r"\text{Step 3: Simplify}", color=ORANGE, hold=1.2),
+            Step(r"V = \int_1^4 \pi (x - 1) \, dx", hold=1.2),
+            Step(r"\text{Step 4: Factor out } \pi", color=ORANGE, hold=1.2),
+            Step(r"V = \pi \int_1^4 (x - 1) \, dx", hold=1.2),
+            Step(r"\text{Step 5: Integrate}", color=ORANGE, hold=1.2),
+            Step(r"V = \pi \left[\frac{x^2}{2} - x\right]_1^4", hold=1.3),
+            Step(r"\text{Step 6: Evaluate}", color=ORANGE, hold=1.2),
+            Step(r"V = \pi \left[(8 - 4) - (\frac{1}{2} - 1)\right] = \frac{9\pi}{2}", color=GREEN, hold=1),
+        ]
+
+    def construct_finale(self):
         # Highlight final answer with animated box
-        box = SurroundingRectangle(step_text, color=GREEN, buff=0.3)
+        box = SurroundingRectangle(self.step_text, color=GREEN, buff=0.3)
         self.play(Create(box))
         self.wait(0.3)
 
@@ -177,4 +160,4 @@ class WasherMethodTikTok(Scene):
         # Quick reminder of the concept
         concept_text = Text("Washer Method: π(R² - r²) × thickness", font_size=28, color=YELLOW).next_to(end_text, UP, buff=0.3)
         self.play(FadeIn(concept_text))
-        self.wait(0.7)
\ No newline at end of file
+        self.wait(0.7)
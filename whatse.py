@@ -1,6 +1,8 @@
 from manim import *
 import numpy as np
 
+import tex_cache
+
 class WhatIsETikTok(Scene):
     def construct(self):
         # Title and watermark (persistent)
@@ -24,6 +26,9 @@ class WhatIsETikTok(Scene):
             r"\text{e connects everything in math!}",
         ]
 
+        # Compile all steps as one LaTeX document up front
+        tex_cache.compile_batch(steps)
+
         # Step 1: Introduce e (0-3 seconds)
         step_text = MathTex(steps[0], font_size=48, color=ORANGE).next_to(watermark, DOWN, buff=1)
         self.play(Write(step_text), run_time=1)